@@ -0,0 +1,168 @@
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+name: vxrail
+
+short_description: Persistent connection shared by the VxRail modules of a play
+
+description:
+- This connection plugin keeps one long-lived ansible-connection process per inventory host, like the persistent
+  httpapi connections. The modules run on the controller, and their requests to the VxRail Manager of the connection
+  are sent through that process, which keeps the keep-alive connections, the session cookies and the API version
+  index of the VxRail Manager across all the tasks of the play.
+- Without it, each task opens new connections to the VxRail Manager and resolves the API versions again.
+- Requests to other VxRail Managers (ex. by the fleet modules), file uploads and downloads, and the requests whose
+  response is read as raw JSON (ex. by the fleet information and request wait modules) are sent directly by the modules.
+- The modules keep their vxmip, vcadmin and vcpasswd options, the credentials are sent with each request.
+
+options:
+  host:
+    description:
+      The VxRail Manager served by the connection, as given in the vxmip option of the modules
+    type: str
+    default: inventory_hostname
+    vars:
+      - name: inventory_hostname
+      - name: ansible_host
+
+  persistent_connect_timeout:
+    description:
+      Seconds the connection waits for a task before it is closed
+    type: int
+    default: 30
+    ini:
+      - section: persistent_connection
+        key: connect_timeout
+    env:
+      - name: ANSIBLE_PERSISTENT_CONNECT_TIMEOUT
+    vars:
+      - name: ansible_connect_timeout
+
+  persistent_command_timeout:
+    description:
+      Seconds a request may take through the connection, after which the connection is closed.
+      It must be longer than the slowest API call of the modules.
+    type: int
+    default: 300
+    ini:
+      - section: persistent_connection
+        key: command_timeout
+    env:
+      - name: ANSIBLE_PERSISTENT_COMMAND_TIMEOUT
+    vars:
+      - name: ansible_command_timeout
+
+  persistent_log_messages:
+    description:
+      Log every request handled by the connection to the Ansible log file, including the credentials
+    type: bool
+    default: False
+    ini:
+      - section: persistent_connection
+        key: log_messages
+    env:
+      - name: ANSIBLE_PERSISTENT_LOG_MESSAGES
+    vars:
+      - name: ansible_persistent_log_messages
+
+author:
+    - VxRail Development Team(@VxRailDevTeam) <ansible.team@dell.com>
+'''
+
+import logging
+import urllib.parse
+
+from ansible.plugins.connection import NetworkConnectionBase
+
+
+class Connection(NetworkConnectionBase):
+    ''' Persistent connection to a VxRail Manager, serving the requests of the modules over JSON-RPC '''
+
+    transport = 'dellemc.vxrail.vxrail'
+    has_pipelining = True
+
+    def __init__(self, play_context, new_stdin, *args, **kwargs):
+        super(Connection, self).__init__(play_context, new_stdin, *args, **kwargs)
+        # Session cookies set by the VxRail Managers, keyed by base URL and Authorization header
+        self._cookies = {}
+        self._utils = None
+        self._logger = None
+
+    def _connect(self):
+        if self._utils is None:
+            # Only imported in the ansible-connection process, as module_utils turns off the HTTPS certificate
+            # verification of the ssl module for the VxRail Managers
+            from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
+            self._utils = utils
+            self._logger = utils.get_logger("dellemc_vxrail_connection", "/tmp/vxrail_ansible_connection.log",
+                                            log_devel=logging.INFO)
+            self._logger.info("Persistent connection to %s started", self.get_option('host'))
+            self.queue_message('vvvv', 'persistent connection to VxRail Manager %s' % self.get_option('host'))
+            self._connected = True
+
+    def close(self):
+        self._cookies = {}
+        super(Connection, self).close()
+
+    # Returns the VxRail Manager served by the connection
+    def get_manager(self):
+        return self.get_option('host')
+
+    # Sends a request of a module and returns the status, reason, headers and body of the response
+    def send_request(self, method, url, query_params=None, headers=None, body=None, request_timeout=None):
+        self._connect()
+        headers = dict(headers or {})
+        parts = urllib.parse.urlsplit(url)
+        base_url = '{}://{}'.format(parts.scheme, parts.netloc)
+        session = (base_url, headers.get('Authorization'))
+        if session in self._cookies and 'Cookie' not in headers:
+            headers['Cookie'] = self._cookies[session]
+        api_client = self._api_client(base_url)
+        if isinstance(request_timeout, list):
+            # A (connect, read) pair, which JSON turned into a list
+            request_timeout = tuple(request_timeout)
+        elif request_timeout is None:
+            request_timeout = api_client.request_timeout
+        self._log_messages('%s %s' % (method, url))
+        try:
+            response = api_client.rest_client.request(method, url, query_params=query_params, headers=headers, body=body,
+                                                      _preload_content=False, _request_timeout=request_timeout)
+        except self._utils.ApiException as e:
+            self._logger.info("%s %s: status %s", method, parts.path, e.status)
+            return {'status': e.status, 'reason': e.reason, 'headers': dict(e.headers or {}), 'data': e.body}
+        try:
+            data = response.data
+        finally:
+            response.release_conn()
+        cookies = response.headers.getlist('Set-Cookie') if hasattr(response.headers, 'getlist') else []
+        if cookies:
+            self._cookies[session] = '; '.join(cookie.split(';', 1)[0] for cookie in cookies)
+        self._logger.info("%s %s: status %s", method, parts.path, response.status)
+        return {'status': response.status, 'reason': response.reason, 'headers': dict(response.getheaders()),
+                'data': data}
+
+    # Returns the versions, lowest first, of the API paths ending with module_path, or -1 if the schema is not available
+    def get_api_versions(self, vxm_ip, module_path, method=None):
+        self._connect()
+        index = self._utils.APIVersionHandler(vxm_ip, self._logger).get_api_index()
+        if index == -1:
+            return -1
+        return index.versions(module_path, method)
+
+    # Drops the API version index of the VxRail Manager (or of all of them if None), e.g. after an upgrade
+    def invalidate_api_schema(self, vxm_ip=None):
+        self._connect()
+        self._utils.invalidate_api_schema_cache(vxm_ip, self._logger)
+
+    # The pooled ApiClient of the VxRail Manager, only its REST client is used as the modules build the requests
+    def _api_client(self, base_url):
+        import vxrail_ansible_utility
+        configuration = vxrail_ansible_utility.Configuration()
+        configuration.host = base_url
+        configuration.verify_ssl = False
+        return self._utils.get_api_client(configuration)
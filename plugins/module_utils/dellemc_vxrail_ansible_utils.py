@@ -3,13 +3,32 @@
 
 from __future__ import (absolute_import, division, print_function)
 import logging
+import logging.handlers
 import ast
+import atexit
+import collections
+import contextlib
+import functools
+import hashlib
+import importlib
+import json
+import os
+import queue
+import re
+import threading
+import time
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
 import urllib.error
+import urllib.parse
 import urllib.request
-import yaml
 import ssl
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
 try:
     _create_unverified_https_context = ssl._create_unverified_context
 except AttributeError:
@@ -21,7 +40,13 @@ else:
 __metaclass__ = type
 
 '''
-This method is to initialize logger and return the logger object
+This method is to initialize logger and return the logger object.
+The records are put on a queue and written by a background thread, so the module does not wait on the file.
+The log file is shared by every module process writing to it, so it is not rotated here: it is reopened once it was
+moved by an external rotation (ex: logrotate). Calling it again for the same log file reuses the existing handler.
+The logging can be tuned through environment variables:
+     - VXRAIL_LOG_LEVEL: level name (ex: WARNING) overriding log_devel, messages below it are never formatted.
+     - VXRAIL_LOG_PAYLOAD_MAX: messages longer than this many characters are truncated (default 0, no limit).
 parameters:
      - module_name: Name of module to be part of log message.
      - log_file_name: name of the file in which the log messages get
@@ -30,42 +55,82 @@ parameters:
 returns logger object
 '''
 
+_LOG_LISTENERS = {}
+_LOG_LOCK = threading.Lock()
+
 
 def get_logger(module_name, log_file_name='/tmp/vxrail_ansible.log', log_devel=logging.INFO):
-    LOG_FILE_NAME = log_file_name
-    LOG_FORMAT = CustomLogFormatter()
+    RequestTrace.module = module_name
+    LOG_FILE_NAME = os.path.abspath(log_file_name)
+    LOG_LEVEL = logging.getLevelName(os.environ.get('VXRAIL_LOG_LEVEL', '').strip().upper())
+    if not isinstance(LOG_LEVEL, int):
+        LOG_LEVEL = log_devel
     LOGGER = logging.getLogger()
-    LOGGER.setLevel(log_devel)
+    LOGGER.setLevel(LOG_LEVEL)
 
-    # file output
-    FILE_HANDLER = logging.FileHandler(LOG_FILE_NAME)
-    FILE_HANDLER.setLevel(log_devel)
-    FILE_HANDLER.setFormatter(LOG_FORMAT)
-    LOGGER.addHandler(FILE_HANDLER)
+    with _LOG_LOCK:
+        if LOG_FILE_NAME in _LOG_LISTENERS:
+            return LOGGER
+        # file output, written by the listener thread
+        FILE_HANDLER = logging.handlers.WatchedFileHandler(LOG_FILE_NAME)
+        FILE_HANDLER.setFormatter(CustomLogFormatter(max_length=_env_int('VXRAIL_LOG_PAYLOAD_MAX', 0)))
+        LOG_QUEUE = queue.SimpleQueue()
+        LISTENER = logging.handlers.QueueListener(LOG_QUEUE, FILE_HANDLER)
+        LISTENER.start()
+        # Flush the queue before the module exits (exit_json and fail_json call sys.exit)
+        atexit.register(_stop_log_listener, LOG_FILE_NAME)
+        _LOG_LISTENERS[LOG_FILE_NAME] = LISTENER
+        QUEUE_HANDLER = DeferredQueueHandler(LOG_QUEUE)
+        LOGGER.addHandler(QUEUE_HANDLER)
     return LOGGER
 
 
+def _stop_log_listener(log_file_name):
+    with _LOG_LOCK:
+        LISTENER = _LOG_LISTENERS.pop(log_file_name, None)
+    if LISTENER is not None:
+        LISTENER.stop()
+        for HANDLER in LISTENER.handlers:
+            HANDLER.close()
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    ''' Queue handler leaving the formatting of the log lines to the listener thread '''
+
+    def prepare(self, record):
+        # The handler only gets the records of the enabled levels, the others are never formatted. The message is
+        # built here, as the objects logged (ex: API responses) may be modified once the call returns, and the
+        # traceback is rendered while it is still available. The listener only adds the time, level and location.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
 class CustomLogFormatter(logging.Formatter):
     ''' Logging class for method '''
     info_fmt = "%(asctime)s [%(levelname)s]\t%(message)s"
     debug_fmt = "%(asctime)s [%(levelname)s]\t%(pathname)s:%(lineno)d\t%(message)s"
 
-    def __init__(self, fmt="%(asctime)s [%(levelname)s]\t%(pathname)s:%(lineno)d\t%(message)s"):
+    def __init__(self, fmt="%(asctime)s [%(levelname)s]\t%(pathname)s:%(lineno)d\t%(message)s", max_length=0):
         logging.Formatter.__init__(self, fmt)
+        self.max_length = max_length
+        # One formatter per format, chosen by level, instead of switching the format of this one for each record
+        self.info_formatter = logging.Formatter(CustomLogFormatter.info_fmt)
+        self.debug_formatter = logging.Formatter(CustomLogFormatter.debug_fmt)
 
     def format(self, record):
+        if self.max_length:
+            message = record.getMessage()
+            if len(message) > self.max_length:
+                # The record may be formatted by other handlers, so it is left as is
+                record = logging.makeLogRecord(dict(record.__dict__, args=None, msg="{}... ({} characters truncated)".format(
+                    message[:self.max_length], len(message) - self.max_length)))
         if record.levelno == logging.INFO:
-            self._fmt = CustomLogFormatter.info_fmt
-            # python 3 compatibility
-            if hasattr(self, '_style'):
-                self._style._fmt = CustomLogFormatter.info_fmt
-        else:
-            self._fmt = CustomLogFormatter.debug_fmt
-            # python 3 compatibility
-            if hasattr(self, '_style'):
-                self._style._fmt = CustomLogFormatter.debug_fmt
-        result = logging.Formatter.format(self, record)
-        return result
+            return self.info_formatter.format(record)
+        return self.debug_formatter.format(record)
 
 
 '''
@@ -102,12 +167,14 @@ parameters:
                     The path can also specify a particular method to use in the form of a 2-word string.
                     (ex: "GET /hosts/{sn}" or "PATCH /hosts/{sn}")
      - logger: A logger object to record the functionality.
+     - timeout: Timeout in seconds of each request downloading the API schema, when it is not cached.
+                Defaults to the VXRAIL_SCHEMA_FETCH_TIMEOUT environment variable, or 60.
 returns The API version string to use in future API calls.
 '''
 
 
-def get_highest_api_version_string(vxm_ip, module_path, logger):
-    ret_version = APIVersionHandler(vxm_ip, logger).get_highest_version(module_path)
+def get_highest_api_version_string(vxm_ip, module_path, logger, timeout=None):
+    ret_version = APIVersionHandler(vxm_ip, logger, timeout).get_highest_version(module_path)
     if ret_version != 'error':
         logger.info("API Version: %s\n" % ret_version['highest_version'])
         return ret_version['highest_version']
@@ -133,42 +200,448 @@ def field_not_found(api_version_number, cluster_version=None):
         return field_not_found_text % (str(api_version_number), cluster_version)
 
 
+'''
+This method tells whether a field is part of the result of a module, given its include and exclude options
+parameters:
+     - name: Name of the top level field of the result
+     - include: List of the fields to return, or None to return all of them
+     - exclude: List of the fields not to return, or None
+returns True if the field is to be returned
+'''
+
+
+def field_selected(name, include=None, exclude=None):
+    if include and name not in include:
+        return False
+    return not exclude or name not in exclude
+
+
+'''
+This method keeps the fields of a result selected by the include and exclude options of a module
+parameters:
+     - info: Dictionary built from an API response
+     - include: List of the fields to return, or None to return all of them
+     - exclude: List of the fields not to return, or None
+returns The dictionary with the selected fields only
+'''
+
+
+def select_fields(info, include=None, exclude=None):
+    if not include and not exclude:
+        return info
+    return {name: value for name, value in info.items() if field_selected(name, include, exclude)}
+
+
+'''
+Persistent on-disk cache of the VxRail Manager API schema, one JSON entry per VxM IP.
+Each entry records the Manager build (the schema info.version), the ETag/Last-Modified validators
+and the version index of the schema (see APIVersionIndex). Entries younger than the TTL are used
+without contacting the Manager; older entries are revalidated with a conditional request.
+The cache is tuned through environment variables:
+     - VXRAIL_SCHEMA_CACHE: set to "off" to disable the cache.
+     - VXRAIL_SCHEMA_CACHE_DIR: directory holding the entries (default /tmp/vxrail_ansible_schema_cache).
+     - VXRAIL_SCHEMA_CACHE_TTL: seconds an entry is used without revalidation (default 3600).
+     - VXRAIL_SCHEMA_CACHE_MAX_SIZE: total bytes kept on disk before the least recently used
+       entries are evicted (default 268435456).
+     - VXRAIL_SCHEMA_CACHE_INVALIDATE: set to "true" to drop the entry of the target VxM before use.
+     - VXRAIL_SCHEMA_FETCH_WORKERS: number of Swagger schema groups downloaded at the same time from the
+       VxRail Managers without a Stoplight schema (default 8).
+     - VXRAIL_SCHEMA_FETCH_TIMEOUT: timeout in seconds of each schema download request (default 60).
+'''
+
+
+class APISchemaCache:
+    default_dir = '/tmp/vxrail_ansible_schema_cache'
+    default_ttl = 3600
+    default_max_size = 256 * 1024 * 1024
+
+    def __init__(self, logger, cache_dir=None, ttl=None, max_size=None):
+        self.logger = logger
+        self.enabled = not _env_flag_is('VXRAIL_SCHEMA_CACHE', ('0', 'off', 'false', 'no'))
+        self.cache_dir = cache_dir or os.environ.get('VXRAIL_SCHEMA_CACHE_DIR', APISchemaCache.default_dir)
+        self.ttl = ttl if ttl is not None else _env_int('VXRAIL_SCHEMA_CACHE_TTL', APISchemaCache.default_ttl)
+        self.max_size = max_size if max_size is not None else _env_int('VXRAIL_SCHEMA_CACHE_MAX_SIZE',
+                                                                       APISchemaCache.default_max_size)
+
+    def entry_path(self, vxm_ip):
+        return os.path.join(self.cache_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', str(vxm_ip)) + '.json')
+
+    # Returns the cached entry for the VxM, or None if there is no usable entry
+    def load(self, vxm_ip):
+        if not self.enabled:
+            return None
+        path = self.entry_path(vxm_ip)
+        try:
+            with open(path, encoding='utf_8') as f:
+                entry = json.load(f)
+            # Record the access so that eviction drops the least recently used entries first
+            os.utime(path, None)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.info("Discarding unreadable API schema cache entry %s: %s", path, e)
+            self.remove(path)
+            return None
+        if not isinstance(entry, dict) or 'index' not in entry:
+            self.remove(path)
+            return None
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+
+    def store(self, vxm_ip, entry):
+        if not self.enabled:
+            return
+        import tempfile
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf_8') as f:
+                json.dump(entry, f, default=str)
+            # Atomic rename, so concurrent forks never read a partially written entry
+            os.replace(tmp_path, self.entry_path(vxm_ip))
+        except OSError as e:
+            self.logger.info("Could not write API schema cache entry for %s: %s", vxm_ip, e)
+            return
+        self.evict()
+
+    # Marks a revalidated (304 Not Modified) entry as fresh again
+    def refresh(self, vxm_ip, entry):
+        entry['fetched_at'] = time.time()
+        self.store(vxm_ip, entry)
+
+    # Drops the entry of the given VxM, or every entry if vxm_ip is None
+    def invalidate(self, vxm_ip=None):
+        if vxm_ip is not None:
+            self.remove(self.entry_path(vxm_ip))
+            return
+        for path in self.list_entries():
+            self.remove(path)
+
+    # Removes the least recently used entries until the cache fits in max_size
+    def evict(self):
+        entries = []
+        for path in self.list_entries():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self.logger.info("Evicting API schema cache entry %s", path)
+            self.remove(path)
+            total_size -= size
+
+    def list_entries(self):
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return []
+        return [os.path.join(self.cache_dir, name) for name in names if name.endswith('.json')]
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+'''
+This method drops the persisted API schema of a VxRail Manager, e.g. after an upgrade changed its API.
+The version index held by the persistent connection, if any, is dropped as well, and the API schema snapshot is no
+longer used for the VxRail Manager by this process.
+parameters:
+     - vxm_ip: The IP Address of the VxRail Manager. Drops every cached schema if set to None.
+     - logger: A logger object to record the functionality.
+'''
+
+
+def invalidate_api_schema_cache(vxm_ip, logger):
+    if vxm_ip is None:
+        APIVersionHandler.index_memo.clear()
+    else:
+        APIVersionHandler.index_memo.pop(vxm_ip, None)
+    APIVersionHandler.snapshot_skipped.add(vxm_ip)
+    APISchemaCache(logger).invalidate(vxm_ip)
+    connection = PersistentConnection.get(vxm_ip)
+    if connection is not None:
+        try:
+            connection.invalidate_api_schema(vxm_ip)
+        except Exception as e:
+            logger.error("Could not invalidate the API schema of the persistent connection: %s", e)
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_flag_is(name, values):
+    return os.environ.get(name, '').strip().lower() in values
+
+
+'''
+Compact index of the versioned paths of a VxRail Manager API schema.
+Each path (ex: "/v4/hosts/{sn}") is registered under every "/"-delimited suffix of its unversioned form
+("/hosts/{sn}", "/{sn}") and under the path itself, with the sorted versions available per HTTP method
+and for any method ("*"). Resolving the versions of a module path is then a single dictionary lookup.
+The index is plain JSON data, so it can be saved, reloaded and shipped between modules.
+'''
+
+
+class APIVersionIndex:
+    any_method = '*'
+
+    def __init__(self, suffixes=None, build=None):
+        # {path suffix: {http method or '*': [versions, lowest first]}}
+        self.suffixes = suffixes if suffixes is not None else {}
+        # The VxRail Manager build the index was generated from (the schema info.version)
+        self.build = build
+
+    @classmethod
+    def from_schema(cls, schema):
+        collected = {}
+        for path, operations in (schema.get('paths') or {}).items():
+            segments = path.split('/')
+            if len(segments) < 3 or not re.match(r'^v[0-9]+$', segments[1]):
+                continue
+            version = segments[1]
+            methods = [method.lower() for method in operations] if isinstance(operations, dict) else []
+            methods.append(cls.any_method)
+            keys = [path] + ['/' + '/'.join(segments[i:]) for i in range(2, len(segments))]
+            for key in keys:
+                by_method = collected.setdefault(key, {})
+                for method in methods:
+                    by_method.setdefault(method, set()).add(version)
+        suffixes = {}
+        for key, by_method in collected.items():
+            suffixes[key] = {method: sorted(versions, key=_version_number) for method, versions in by_method.items()}
+        info = schema.get('info') or {}
+        return cls(suffixes, info.get('version'))
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('suffixes'), data.get('build'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf_8') as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self):
+        return {'build': self.build, 'suffixes': self.suffixes}
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf_8') as f:
+            json.dump(self.to_dict(), f)
+
+    # Returns the versions, lowest first, of the paths ending with module_path that support the given method
+    def versions(self, module_path, method=None):
+        method = method.lower() if method else APIVersionIndex.any_method
+        by_method = self.suffixes.get(module_path)
+        if by_method is not None:
+            return by_method.get(method, [])
+        if module_path.startswith('/'):
+            return []
+        # Module paths without a leading "/" (ex: "system/proxy") may end in the middle of a path segment
+        versions = set()
+        for key, by_method in self.suffixes.items():
+            if key.endswith(module_path):
+                versions.update(by_method.get(method, []))
+        return sorted(versions, key=_version_number)
+
+
+def _version_number(version):
+    return int(version.split('v')[1])
+
+
+'''
+This method loads the version index of a VxRail Manager from an exported snapshot (see APIVersionIndex.save and
+scripts/export_api_schema_snapshot.py), so that the API versions are resolved without downloading the schema, e.g.
+in restricted networks. The snapshot is given by the VXRAIL_SCHEMA_SNAPSHOT environment variable, either as the
+file used for every VxRail Manager, or as a directory holding one <vxm_ip>.json file per VxRail Manager.
+The snapshot records the build it was exported from. It is not used for a VxRail Manager known to run another build,
+e.g. from its cached schema, nor for the rest of the run once its schema was invalidated (see
+invalidate_api_schema_cache), as the snapshot of the former release no longer applies after an upgrade.
+parameters:
+     - vxm_ip: The IP Address of the VxRail Manager.
+     - logger: A logger object to record the functionality.
+     - build: The build the VxRail Manager is known to run, or None if it is not known.
+returns The version index of the snapshot, or None if there is no snapshot for the VxRail Manager
+'''
+
+
+def get_api_schema_snapshot(vxm_ip, logger, build=None):
+    path = os.environ.get('VXRAIL_SCHEMA_SNAPSHOT')
+    if not path:
+        return None
+    if os.path.isdir(path):
+        path = os.path.join(path, re.sub(r'[^A-Za-z0-9_.-]', '_', str(vxm_ip)) + '.json')
+        if not os.path.exists(path):
+            logger.info("No API schema snapshot %s for %s", path, vxm_ip)
+            return None
+    try:
+        index = APIVersionIndex.load(path)
+    except (OSError, ValueError, AttributeError) as e:
+        logger.error("Could not load the API schema snapshot %s: %s", path, e)
+        return None
+    if not isinstance(index.suffixes, dict):
+        logger.error("API schema snapshot %s has no version index", path)
+        return None
+    if build is not None and index.build is not None and index.build != build:
+        logger.error("API schema snapshot %s is of build %s, but %s runs build %s: the snapshot is not used, "
+                     "please export it again", path, index.build, vxm_ip, build)
+        return None
+    if index.build is None:
+        logger.warning("API schema snapshot %s records no build, it cannot be checked against %s", path, vxm_ip)
+    logger.info("Using API schema snapshot %s for %s (build %s)", path, vxm_ip, index.build)
+    return index
+
+
+'''
+This method parses a YAML document, such as the API schema downloaded from the VxRail Manager.
+yaml is only imported here, as most module runs find the API versions in the cache and never parse YAML.
+parameters:
+     - data: The YAML document.
+returns The parsed document
+'''
+
+
+def load_yaml(data):
+    import yaml
+    return yaml.safe_load(data)
+
+
+'''
+This method extracts from an API schema document only what the API version lookup needs: the paths, the keys of
+each path (the HTTP methods) and info.version. Instead of building the whole document, with every model, example
+and description, the YAML parsing events are walked and everything else is skipped, using the LibYAML parser when
+PyYAML was built with it. JSON documents, such as the Swagger groups, are parsed with the json module.
+The documents using aliases or merge keys within the paths are loaded whole.
+parameters:
+     - data: The YAML or JSON API schema document.
+returns The API schema reduced to {'info': {'version': ...}, 'paths': {path: {method: None}}}, see APIVersionIndex.from_schema
+'''
+
+
+def load_api_schema_paths(data):
+    if data.lstrip()[:1] in (b'{', '{'):
+        schema = json.loads(data)
+        return {'info': {'version': (schema.get('info') or {}).get('version')},
+                'paths': {path: dict.fromkeys(operations) if isinstance(operations, dict) else {}
+                          for path, operations in (schema.get('paths') or {}).items()}}
+    import yaml
+    events = yaml.parse(data, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    try:
+        return _schema_paths_from_events(yaml, events)
+    except _AliasedSchema:
+        schema = load_yaml(data)
+        return {'info': schema.get('info') or {}, 'paths': schema.get('paths') or {}}
+    finally:
+        events.close()
+
+
+class _AliasedSchema(Exception):
+    pass
+
+
+def _schema_paths_from_events(yaml, events):
+    schema = {'info': {'version': None}, 'paths': {}}
+    event = next(events)
+    while not isinstance(event, (yaml.MappingStartEvent, yaml.StreamEndEvent)):
+        event = next(events)
+    if isinstance(event, yaml.StreamEndEvent):
+        return schema
+    for key, value in _yaml_mapping_items(yaml, events):
+        if key == 'paths' and isinstance(value, yaml.MappingStartEvent):
+            for path, operations in _yaml_mapping_items(yaml, events):
+                if isinstance(operations, yaml.AliasEvent) or path == '<<':
+                    raise _AliasedSchema()
+                if path is None:
+                    _skip_yaml_node(yaml, events, operations)
+                    continue
+                methods = schema['paths'][path] = {}
+                if not isinstance(operations, yaml.MappingStartEvent):
+                    _skip_yaml_node(yaml, events, operations)
+                    continue
+                for method, operation in _yaml_mapping_items(yaml, events):
+                    if method == '<<':
+                        raise _AliasedSchema()
+                    methods[method] = None
+                    _skip_yaml_node(yaml, events, operation)
+        elif key == 'info' and isinstance(value, yaml.MappingStartEvent):
+            for name, field in _yaml_mapping_items(yaml, events):
+                if name == 'version' and isinstance(field, yaml.ScalarEvent):
+                    schema['info']['version'] = field.value
+                else:
+                    _skip_yaml_node(yaml, events, field)
+        else:
+            _skip_yaml_node(yaml, events, value)
+    return schema
+
+
+# Yields the (key, first event of the value) of the mapping being parsed, the caller consumes or skips each value
+def _yaml_mapping_items(yaml, events):
+    while True:
+        event = next(events)
+        if isinstance(event, yaml.MappingEndEvent):
+            return
+        if isinstance(event, yaml.ScalarEvent):
+            key = event.value
+        else:
+            _skip_yaml_node(yaml, events, event)
+            key = None
+        yield key, next(events)
+
+
+# Consumes the events of the node starting with the given event
+def _skip_yaml_node(yaml, events, event):
+    depth = 1 if isinstance(event, yaml.CollectionStartEvent) else 0
+    while depth:
+        event = next(events)
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+
+
 class APIVersionHandler:
-    def __init__(self, vxm_ip, logger):
+    # Version indexes already resolved by this process, keyed by VxM IP
+    index_memo = {}
+    # VxM IPs whose schema was invalidated by this process, for which the snapshot is not used (None for all of them)
+    snapshot_skipped = set()
+
+    def __init__(self, vxm_ip, logger, timeout=None):
         # The ip to the vxm to use
         self.vxm_ip = vxm_ip
         # The logging object, so errors in API version processing can be logged
         self.logger = logger
+        # The timeout in seconds of each schema download request
+        self.timeout = timeout if timeout is not None else _env_int('VXRAIL_SCHEMA_FETCH_TIMEOUT', 60)
+        # The ETag/Last-Modified headers of the last Stoplight schema download
+        self.schema_validators = {}
 
     # Returns a Boolean representing if the given API version string (such as 'v5')
     # exists for the given module path in the Manager's schema
     def version_exists(self, api_version_string, module_path):
-        schema = self.get_api_schema()
-        if schema == -1:
+        index = self.get_api_index()
+        if index == -1:
             self.logger.info("Error collecting API schema from the VxRail Manager")
             return False
 
-        # Split module if method specified (ex: "GET /hosts/{sn}" or "PATCH /hosts/{sn}")
-        split_module = module_path.split(" ")
-        method = None
-        if len(split_module) == 2:
-            method, module_path = split_module
-            self.logger.info(f"Method specified as: {method}")
-
-        paths = schema['paths'].keys()
-        valid_paths = []
-        for path in paths:
-            if path.endswith(module_path):
-                if method is not None:
-                    if method.lower() in schema['paths'][path]:
-                        valid_paths.append(path.split('/')[1])
-                else:
-                    valid_paths.append(path.split('/')[1])
-        if len(valid_paths) < 1:
+        method, module_path = self.split_module_path(module_path)
+        valid_versions = index.versions(module_path, method)
+        if len(valid_versions) < 1:
             self.logger.error(f"Path {module_path} not found in API schema.")
             return False
         else:
-            if api_version_string in valid_paths:
+            if api_version_string in valid_versions:
                 self.logger.info(f"Found version: {api_version_string}")
                 return True
             else:
@@ -177,85 +650,149 @@ class APIVersionHandler:
 
     # Returns the highest API version of the given module path (ex: /hosts)
     def get_highest_version(self, module_path):
-        schema = self.get_api_schema()
-        if schema == -1:
+        index = self.get_api_index()
+        if index == -1:
             self.logger.error("Could not collect Stoplight/Swagger Schema.\n")
             return 'error'
         else:
-            return self.get_highest_module_version_from_schema(schema, module_path)
+            return self.get_highest_module_version_from_index(index, module_path)
 
     # Returns the highest API version of the given module path from the input schema
     def get_highest_module_version_from_schema(self, schema, module_path):
-        def sort_versions(v):
-            return int(v.split('v')[1])
+        return self.get_highest_module_version_from_index(APIVersionIndex.from_schema(schema), module_path)
 
-        # Split module if method specified (ex: "GET /hosts/{sn}" or "PATCH /hosts/{sn}")
-        split_module = module_path.split(" ")
-        method = None
-        if len(split_module) == 2:
-            method, module_path = split_module
-            self.logger.info(f"Method specified as: {method}")
-
-        paths = schema['paths'].keys()
-        valid_paths = []
-        for path in paths:
-            if path.endswith(module_path):
-                if method is not None:
-                    if method.lower() in schema['paths'][path]:
-                        valid_paths.append(path.split('/')[1])
-                else:
-                    valid_paths.append(path.split('/')[1])
-        valid_paths.sort(key=sort_versions)
-        if len(valid_paths) < 1:
+    # Returns the highest API version of the given module path from the input version index
+    def get_highest_module_version_from_index(self, index, module_path):
+        method, module_path = self.split_module_path(module_path)
+        valid_versions = index.versions(module_path, method)
+        if len(valid_versions) < 1:
             self.logger.error(f"Path {module_path} not found in API schema.")
             return 'error'
         else:
-            highest_version = {"highest_version": valid_paths[-1]}
+            highest_version = {"highest_version": valid_versions[-1]}
             self.logger.info(f"Highest version found: {highest_version}")
             return dict(highest_version.items())
 
-    # Obtains the api schema from the VxRail manager.
+    # Split module if method specified (ex: "GET /hosts/{sn}" or "PATCH /hosts/{sn}")
+    def split_module_path(self, module_path):
+        split_module = module_path.split(" ")
+        if len(split_module) == 2:
+            self.logger.info(f"Method specified as: {split_module[0]}")
+            return split_module[0], split_module[1]
+        return None, module_path
+
+    # Obtains the version index of the VxRail manager, from this process, the persistent connection, a snapshot, the
+    # on-disk cache or the Manager itself
+    def get_api_index(self):
+        if self.vxm_ip in APIVersionHandler.index_memo:
+            return APIVersionHandler.index_memo[self.vxm_ip]
+        connection = PersistentConnection.get(self.vxm_ip)
+        if connection is not None:
+            index = ConnectionVersionIndex(connection, self.vxm_ip, self.logger)
+            APIVersionHandler.index_memo[self.vxm_ip] = index
+            return index
+        cache = APISchemaCache(self.logger)
+        if _env_flag_is('VXRAIL_SCHEMA_CACHE_INVALIDATE', ('1', 'on', 'true', 'yes')):
+            self.logger.info("Invalidating cached API schema for %s", self.vxm_ip)
+            cache.invalidate(self.vxm_ip)
+        entry = cache.load(self.vxm_ip)
+        if not APIVersionHandler.snapshot_skipped.intersection((None, self.vxm_ip)):
+            # The cached schema, even if stale, tells the build of the VxRail Manager to check the snapshot against
+            build = entry.get('build') if entry is not None else None
+            index = get_api_schema_snapshot(self.vxm_ip, self.logger, build)
+            if index is not None:
+                APIVersionHandler.index_memo[self.vxm_ip] = index
+                return index
+        if entry is not None and cache.is_fresh(entry):
+            self.logger.info("Using cached API schema for %s (build %s)", self.vxm_ip, entry.get('build'))
+            index = APIVersionIndex.from_dict(entry['index'])
+        else:
+            index = self.fetch_api_index(cache, entry)
+        if index != -1:
+            APIVersionHandler.index_memo[self.vxm_ip] = index
+        return index
+
+    # Downloads the api schema from the VxRail manager and indexes it, revalidating the cached entry if there is one.
     # First attempts to obtain the Stoplight API yaml, then, if 404 is returned, search for the Swagger API yaml
-    def get_api_schema(self):
+    def fetch_api_index(self, cache, entry=None):
         try:
             self.logger.info("Collecting API schema from Stoplight service...")
-            return self.get_api_schema_stoplight()
+            schema = self.get_api_schema_stoplight(entry, paths_only=True)
+            source = 'stoplight'
         except urllib.error.HTTPError as err:
             self.logger.info("Exception code %s when collecting Stoplight info: %s\n", err.code, str(err))
             self.logger.info("Stoplight API schema not found, attempting to collect Swagger API schema instead.")
-            return self.get_api_schema_swagger()
+            schema = self.get_api_schema_swagger(paths_only=True)
+            source = 'swagger'
+            if schema == -1:
+                return schema
+        if schema is None:
+            self.logger.info("API schema not modified since build %s, reusing cached copy", entry.get('build'))
+            cache.refresh(self.vxm_ip, entry)
+            return APIVersionIndex.from_dict(entry['index'])
+        index = APIVersionIndex.from_schema(schema)
+        validators = self.schema_validators if source == 'stoplight' else {}
+        cache.store(self.vxm_ip, {'source': source,
+                                  'build': index.build,
+                                  'etag': validators.get('etag'),
+                                  'last_modified': validators.get('last_modified'),
+                                  'fetched_at': time.time(),
+                                  'index': index.to_dict()})
+        return index
+
+    # Obtains the full api schema from the VxRail manager, or only its paths and their methods with paths_only.
+    # First attempts to obtain the Stoplight API yaml, then, if 404 is returned, search for the Swagger API yaml
+    def get_api_schema(self, paths_only=False):
+        try:
+            self.logger.info("Collecting API schema from Stoplight service...")
+            return self.get_api_schema_stoplight(paths_only=paths_only)
+        except urllib.error.HTTPError as err:
+            self.logger.info("Exception code %s when collecting Stoplight info: %s\n", err.code, str(err))
+            self.logger.info("Stoplight API schema not found, attempting to collect Swagger API schema instead.")
+            return self.get_api_schema_swagger(paths_only)
 
     # Obtains the Stoplight API schema from the Manager (Version <= 7.0.350
-    def get_api_schema_stoplight(self):
+    # Returns None if the cached entry's validators show the schema has not been modified
+    # With paths_only, only the paths, their methods and info.version are extracted (see load_api_schema_paths)
+    def get_api_schema_stoplight(self, entry=None, paths_only=False):
         url = 'https://%s/rest/vxm/api-doc/vxrail_public_api.yaml' % self.vxm_ip
         self.logger.info("Attempting to collect Stoplight API schema from resource: %s" % url)
-        with urllib.request.urlopen(url) as response:
-            html = response.read()
-            yml = yaml.safe_load(html)
-            return yml
+        request = urllib.request.Request(url)
+        if entry is not None and entry.get('source') == 'stoplight':
+            if entry.get('etag'):
+                request.add_header('If-None-Match', entry['etag'])
+            if entry.get('last_modified'):
+                request.add_header('If-Modified-Since', entry['last_modified'])
+        try:
+            with traced_call('schema', self.vxm_ip, 'GET', urllib.parse.urlsplit(url).path) as record, \
+                    urllib.request.urlopen(request, timeout=self.timeout) as response:
+                self.schema_validators = {'etag': response.headers.get('ETag'),
+                                          'last_modified': response.headers.get('Last-Modified')}
+                html = response.read()
+                record.update(status=response.status, bytes=len(html))
+        except urllib.error.HTTPError as err:
+            if err.code == 304 and entry is not None:
+                return None
+            raise
+        if paths_only:
+            return load_api_schema_paths(html)
+        yml = load_yaml(html)
+        return yml
 
     # Obtains the Swagger API Schema from the Manager (Version < 7.0.350)
-    def get_api_schema_swagger(self):
+    # The groups are downloaded concurrently, and merged in the order of the groups
+    def get_api_schema_swagger(self, paths_only=False):
+        import concurrent.futures
         groups = ["day1", "lcm", "callhome", "certificates", "chassis", "cluster", "disks", "hosts",
                   "network", "requests", "support", "system", "telemetry", "healthcheck", "vc"]
+        workers = max(1, min(_env_int('VXRAIL_SCHEMA_FETCH_WORKERS', 8), len(groups)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            group_paths = list(executor.map(lambda group: self.get_api_schema_swagger_group(group, paths_only), groups))
+        if -1 in group_paths:
+            return -1
         combo_yml = {'paths': {}}
-        for group in groups:
-            url = 'https://%s/rest/vxm/v1/swagger-resources/api-specs?group=%s' % (self.vxm_ip, group)
-            self.logger.info(f"Collecting from group '{group}' with url: {url}")
-            try:
-                with urllib.request.urlopen(url) as response:
-                    html = response.read()
-                    yml = yaml.safe_load(html)
-                    for key in yml['paths'].keys():
-                        combo_yml['paths'][key] = yml['paths'][key]
-            except urllib.error.HTTPError as err:
-                if err.code == 404:
-                    # Group not found in cluster version, skip if simply 404
-                    self.logger.info(f"Group '{group}' not found on VxRail Manager API schema")
-                    continue
-                else:
-                    self.logger.error("Non 404 Exception when collecting Swagger info: %s\n", str(err))
-                    return -1
+        for paths in group_paths:
+            combo_yml['paths'].update(paths or {})
 
         if combo_yml['paths']:
             return combo_yml
@@ -263,6 +800,418 @@ class APIVersionHandler:
             self.logger.error("No Swagger Schema groups found.\n")
             return -1
 
+    # Obtains the paths of one group of the Swagger API Schema, None if the group does not exist or -1 on error
+    def get_api_schema_swagger_group(self, group, paths_only=False):
+        url = 'https://%s/rest/vxm/v1/swagger-resources/api-specs?group=%s' % (self.vxm_ip, group)
+        self.logger.info(f"Collecting from group '{group}' with url: {url}")
+        try:
+            with traced_call('schema', self.vxm_ip, 'GET', '/rest/vxm/v1/swagger-resources/api-specs?group=' + group) as record, \
+                    urllib.request.urlopen(url, timeout=self.timeout) as response:
+                html = response.read()
+                record.update(status=response.status, bytes=len(html))
+        except urllib.error.HTTPError as err:
+            if err.code == 404:
+                # Group not found in cluster version, skip if simply 404
+                self.logger.info(f"Group '{group}' not found on VxRail Manager API schema")
+                return None
+            self.logger.error("Non 404 Exception when collecting Swagger info: %s\n", str(err))
+            return -1
+        if paths_only:
+            return load_api_schema_paths(html)['paths']
+        return load_yaml(html)['paths']
+
+
+''' VxRail Ansible Utility for request timings '''
+
+'''
+Timings of the REST calls and API schema fetches made by this process. Each call is recorded with the VxRail Manager,
+method, path (ex: "/v1/hosts/{sn}"), API version, HTTP status, response size, latency and the number of
+connection retries. The records are kept in memory for the module results (see get_timings) and, when the
+VXRAIL_TRACE_FILE environment variable is set, appended to that file as JSON lines, so the slow managers and
+endpoints of a fleet can be found from the trace of all the modules.
+'''
+
+
+class RequestTrace():
+    module = None
+    records = collections.deque(maxlen=1000)
+    lock = threading.Lock()
+    trace_file = None
+
+    @staticmethod
+    def add(record):
+        record['latency'] = round(record['latency'], 4)
+        with RequestTrace.lock:
+            RequestTrace.records.append(record)
+            trace_path = os.environ.get('VXRAIL_TRACE_FILE')
+            if not trace_path:
+                return
+            try:
+                if RequestTrace.trace_file is None:
+                    RequestTrace.trace_file = open(trace_path, 'a', encoding='utf_8')
+                RequestTrace.trace_file.write(json.dumps(dict(record, module=RequestTrace.module, pid=os.getpid())) + '\n')
+                RequestTrace.trace_file.flush()
+            except OSError:
+                # Tracing must never fail a module
+                pass
+
+
+'''
+This method records the timing of the call made within its block (see RequestTrace)
+parameters:
+     - kind: The kind of call (ex: "api" or "schema").
+     - vxm: The address of the VxRail Manager.
+     - method: The HTTP method.
+     - path: The path of the resource (ex: "/v1/hosts/{sn}").
+yields The record of the call, to be completed with its status, bytes and retries
+'''
+
+
+@contextlib.contextmanager
+def traced_call(kind, vxm, method, path):
+    version = re.search(r'/(v\d+)/', path)
+    record = {'time': round(time.time(), 3), 'kind': kind, 'vxm': vxm, 'method': method.upper(), 'path': path,
+              'version': version.group(1) if version else None, 'status': None, 'bytes': None, 'retries': 0}
+    started_at = time.monotonic()
+    try:
+        yield record
+    except Exception as e:
+        record['status'] = record['status'] or getattr(e, 'status', None) or getattr(e, 'code', None)
+        record['error'] = type(e).__name__
+        raise
+    finally:
+        record['latency'] = time.monotonic() - started_at
+        RequestTrace.add(record)
+
+
+'''
+This method returns the timings recorded by this process, for the module results
+parameters:
+     - vxm: Only return the timings of this VxRail Manager. Returns all of them if set to None.
+returns A list of timing records
+'''
+
+
+def get_timings(vxm=None):
+    with RequestTrace.lock:
+        return [dict(record) for record in RequestTrace.records if vxm is None or record['vxm'] == vxm]
+
+
+''' VxRail Ansible Utility for pooled API clients '''
+
+
+class PooledApiClient(vxrail_ansible_utility.ApiClient):
+    ''' ApiClient applying a default timeout to every request that does not set _request_timeout, and timing every call '''
+
+    def __init__(self, configuration, request_timeout=None):
+        vxrail_ansible_utility.ApiClient.__init__(self, configuration)
+        self.request_timeout = request_timeout
+        self.vxm = urllib.parse.urlsplit(configuration.host).hostname
+        # The timing record of the call in progress, per thread
+        self.trace = threading.local()
+
+    def call_api(self, resource_path, method, *args, **kwargs):
+        if kwargs.get('_request_timeout') is None and self.request_timeout is not None:
+            kwargs['_request_timeout'] = self.request_timeout
+        with traced_call('api', self.vxm, method, resource_path) as record:
+            self.trace.record = record
+            try:
+                return vxrail_ansible_utility.ApiClient.call_api(self, resource_path, method, *args, **kwargs)
+            finally:
+                self.trace.record = None
+
+    def request(self, method, url, *args, **kwargs):
+        record = getattr(self.trace, 'record', None)
+        try:
+            response = vxrail_ansible_utility.ApiClient.request(self, method, url, *args, **kwargs)
+        except ApiException as e:
+            if record is not None:
+                record['status'] = e.status
+                record['bytes'] = len(e.body) if e.body else 0
+            raise
+        if record is not None:
+            # The raw urllib3 response when _preload_content is False, else a RESTResponse wrapping it
+            raw_response = getattr(response, 'urllib3_response', response)
+            record['status'] = response.status
+            record['bytes'] = len(response.data) if kwargs.get('_preload_content', True) \
+                else _int_or_none(response.getheader('Content-Length'))
+            retries = getattr(raw_response, 'retries', None)
+            record['retries'] = len(retries.history) if retries is not None else 0
+        return response
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_api_clients = {}
+_api_clients_lock = threading.Lock()
+
+'''
+This method returns the ApiClient shared by every call to the same VxRail Manager and user in this process,
+so polling loops and multi-call modules reuse its keep-alive connections instead of opening new ones.
+The client sends its requests through the persistent connection when there is one for the VxRail Manager.
+parameters:
+     - configuration: The vxrail_ansible_utility.Configuration holding the VxM host and credentials.
+     - pool_size: The maximum number of connections kept alive to the VxM. Only applies when the client is
+                  created. Defaults to the VXRAIL_API_POOL_SIZE environment variable, or 4.
+     - request_timeout: The timeout in seconds, total or as a (connect, read) pair, of each request that does
+                  not set _request_timeout. Defaults to the VXRAIL_API_REQUEST_TIMEOUT environment variable
+                  (ex: "30" or "10,300"), or no timeout.
+returns PooledApiClient object
+'''
+
+
+def get_api_client(configuration, pool_size=None, request_timeout=None):
+    key = (configuration.host, configuration.username)
+    with _api_clients_lock:
+        api_client = _api_clients.get(key)
+        if api_client is None:
+            configuration.connection_pool_maxsize = pool_size or _env_int('VXRAIL_API_POOL_SIZE', 4)
+            connection = PersistentConnection.get(urllib.parse.urlsplit(configuration.host).netloc)
+            if connection is not None:
+                api_client = ConnectionApiClient(configuration, connection, _env_timeout('VXRAIL_API_REQUEST_TIMEOUT'))
+            else:
+                api_client = PooledApiClient(configuration, _env_timeout('VXRAIL_API_REQUEST_TIMEOUT'))
+            _api_clients[key] = api_client
+        elif api_client.configuration.password != configuration.password:
+            # Credentials of the same user were updated since the client was created
+            api_client.configuration.password = configuration.password
+    if request_timeout is not None:
+        api_client.request_timeout = request_timeout
+    return api_client
+
+
+'''
+This method returns an API class of the vxrail_ansible_utility SDK by importing the module defining it, named after
+the class in snake case (ex: LCMUpgradeApi from vxrail_ansible_utility.api.lcm_upgrade_api).
+A class defined in a module named otherwise is looked up in the vxrail_ansible_utility.api package.
+parameters:
+     - name: The name of the API class (ex: LCMUpgradeApi).
+returns The API class
+'''
+
+
+def api(name):
+    module_name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)).lower()
+    try:
+        module = importlib.import_module('vxrail_ansible_utility.api.' + module_name)
+    except ModuleNotFoundError as e:
+        if e.name != 'vxrail_ansible_utility.api.' + module_name:
+            raise
+        module = importlib.import_module('vxrail_ansible_utility.api')
+    return getattr(module, name)
+
+
+def _env_timeout(name):
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        timeouts = [float(part) for part in value.split(',')]
+    except ValueError:
+        return None
+    return timeouts[0] if len(timeouts) == 1 else tuple(timeouts[:2])
+
+
+''' VxRail Ansible Utility for the persistent connection '''
+
+'''
+When the play uses the dellemc.vxrail.vxrail connection plugin, the tasks targeting the same inventory host share
+one long-lived ansible-connection process. The requests of the modules to the VxRail Manager of the connection, and
+their API version lookups, go through that process over its local socket: it keeps the keep-alive connections, the
+session cookies and the API version index of the VxRail Manager across the tasks, instead of each task opening new
+connections and resolving the API versions again. Requests to other VxRail Managers (ex: by the fleet modules), file
+uploads and the requests whose response is streamed (file downloads and raw JSON responses, see call_api_raw) are
+sent directly. Set VXRAIL_PERSISTENT_CONNECTION to "off" to send every request directly.
+'''
+
+
+class PersistentConnection():
+    # Connection to the ansible-connection process of the task, False once found not to be used
+    connection = None
+    # The VxRail Manager served by the connection
+    manager = None
+    lock = threading.Lock()
+
+    # Returns the connection if the module runs over the connection plugin and it serves the given VxRail Manager
+    # (or any VxRail Manager if None), else None
+    @staticmethod
+    def get(vxm=None):
+        with PersistentConnection.lock:
+            if PersistentConnection.connection is None:
+                PersistentConnection.connection = PersistentConnection.open() or False
+        connection = PersistentConnection.connection
+        if not connection or (vxm is not None and not _same_manager(vxm, PersistentConnection.manager)):
+            return None
+        return connection
+
+    @staticmethod
+    def open():
+        if _env_flag_is('VXRAIL_PERSISTENT_CONNECTION', ('0', 'off', 'false', 'no')):
+            return None
+        socket_path = _module_socket_path()
+        if not socket_path:
+            return None
+        from ansible.module_utils.connection import Connection, ConnectionError
+        connection = Connection(socket_path)
+        try:
+            PersistentConnection.manager = connection.get_manager()
+        except ConnectionError:
+            # Not the VxRail connection plugin (ex: a network connection of another collection)
+            return None
+        return connection
+
+
+# The socket of the persistent connection, from the arguments of the module (set by the action plugin)
+def _module_socket_path():
+    try:
+        from ansible.module_utils import basic
+    except ImportError:
+        return None
+    # Only read once AnsibleModule has loaded them, the arguments may otherwise still be on stdin
+    args = getattr(basic, '_ANSIBLE_ARGS', None)
+    if not args:
+        return None
+    try:
+        return json.loads(args)['ANSIBLE_MODULE_ARGS'].get('_ansible_socket')
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _same_manager(vxm, manager):
+    def normalize(address):
+        address = str(address or '').lower()
+        return address[:-len(':443')] if address.endswith(':443') else address
+    return normalize(vxm) == normalize(manager)
+
+
+class ConnectionApiClient(PooledApiClient):
+    ''' PooledApiClient sending its requests through the persistent connection '''
+
+    def __init__(self, configuration, connection, request_timeout=None):
+        PooledApiClient.__init__(self, configuration, request_timeout)
+        self.rest_client = ConnectionRESTClient(connection, self.rest_client)
+
+
+class ConnectionRESTClient():
+    ''' Stands for the RESTClientObject of the generated ApiClient, which calls the HTTP methods on it '''
+
+    def __init__(self, connection, rest_client):
+        self.connection = connection
+        # For the multipart requests and the streamed responses (file uploads and downloads), which are sent directly
+        self.rest_client = rest_client
+        for method in ('GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            setattr(self, method, functools.partial(self.request, method))
+
+    def request(self, method, url, query_params=None, headers=None, body=None, post_params=None,
+                _preload_content=True, _request_timeout=None):
+        if post_params or not _preload_content:
+            # Streamed bodies are not held in memory and sent over the socket of the connection
+            return self.rest_client.request(method, url, query_params=query_params, headers=headers, body=body,
+                                            post_params=post_params, _preload_content=_preload_content,
+                                            _request_timeout=_request_timeout)
+        from ansible.module_utils.connection import ConnectionError
+        try:
+            result = self.connection.send_request(method, url, query_params=query_params, headers=headers, body=body,
+                                                  request_timeout=_request_timeout)
+        except ConnectionError as e:
+            raise ApiException(status=0, reason="Persistent connection error: {}".format(e))
+        response = ConnectionResponse(result)
+        if not 200 <= response.status <= 299:
+            raise ApiException(http_resp=response)
+        return response
+
+
+class ConnectionResponse():
+    ''' HTTP response returned by the persistent connection, with the interface of the urllib3 and REST responses '''
+
+    def __init__(self, result):
+        self.status = result['status']
+        self.reason = result['reason']
+        self.data = result['data']
+        self.headers = result['headers']
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        for key, value in self.headers.items():
+            if key.lower() == name.lower():
+                return value
+        return default
+
+    def release_conn(self):
+        pass
+
+
+class ConnectionVersionIndex():
+    ''' Version index of a VxRail Manager held by the persistent connection, see APIVersionIndex '''
+
+    def __init__(self, connection, vxm_ip, logger):
+        self.connection = connection
+        self.vxm_ip = vxm_ip
+        self.logger = logger
+
+    # Returns the versions, lowest first, of the paths ending with module_path that support the given method
+    def versions(self, module_path, method=None):
+        versions = self.connection.get_api_versions(self.vxm_ip, module_path, method)
+        if versions == -1:
+            self.logger.error("The persistent connection could not collect the API schema of %s", self.vxm_ip)
+            return []
+        return versions
+
+
+''' VxRail Ansible Utility for raw JSON responses '''
+
+'''
+This method parses a JSON document, with orjson when it is installed
+parameters:
+     - data: JSON document, as bytes or str
+returns The parsed document
+'''
+
+
+def loads_json(data):
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+'''
+This method calls a method of a vxrail_ansible_utility API class without deserializing the response into model
+objects: the JSON body is parsed once into dictionaries and lists, keyed by the field names of the API.
+parameters:
+     - api_call: Bound method of an API class (ex: api_instance.v1_request_id_get)
+     - args, kwargs: Arguments of the method
+returns The parsed body of the response, or None if it is empty. Errors raise ApiException as with the method itself.
+'''
+
+
+def call_api_raw(api_call, *args, **kwargs):
+    kwargs['_preload_content'] = False
+    response = api_call(*args, **kwargs)
+    try:
+        data = response.data
+    finally:
+        response.release_conn()
+    return loads_json(data) if data else None
+
+
+class RawModel():
+    ''' Attribute access to a raw JSON object, where missing fields read as None as in the generated models '''
+
+    def __init__(self, fields):
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name):
+        return None
+
 
 ''' VxRail Ansible Utility for GET v1/requests/{id} API'''
 
@@ -277,7 +1226,7 @@ returns result_info list
 def get_request_info(response):
     statusInfo = {}
     statusInfolist = []
-    data = response
+    data = RawModel(response) if isinstance(response, dict) else response
     statusInfo['id'] = data.id
     statusInfo['owner'] = data.owner
     statusInfo['state'] = data.state
@@ -293,9 +1242,11 @@ def get_request_info(response):
         statusInfo['step'] = data.step
     if data.detail is not None:
         statusInfo['detail'] = data.detail
-    if data.extension is not None:
+    if isinstance(data.extension, str):
         # convert string into a dictoinary
         statusInfo['extension'] = ast.literal_eval(data.extension)
+    elif data.extension is not None:
+        statusInfo['extension'] = data.extension
     statusInfolist.append(dict(statusInfo.items()))
     return statusInfolist
 
@@ -340,13 +1291,1102 @@ class VxRailRequest():
         self.configuration.verify_ssl = False
         self.configuration.host = self.system_url.set_host()
 
-    def get_request_response(self, request_id):
+    # With raw set, the response is returned as a dictionary (see call_api_raw).
+    # With raise_errors set, an ApiException is raised instead of returning 'error'
+    def get_request_response(self, request_id, raw=False, raise_errors=False):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = api('RequestStatusApi')(get_api_client(self.configuration))
         try:
-            response = api_instance.v1_request_id_get(job_id)
+            if raw:
+                response = call_api_raw(api_instance.v1_request_id_get, job_id, _request_timeout=self.timeout)
+            else:
+                response = api_instance.v1_request_id_get(job_id, _request_timeout=self.timeout)
         except ApiException as e:
+            if raise_errors:
+                raise
             self.logger.error("Exception when calling v1_requests_id_get: %s\n", e)
             return 'error'
         return response
+
+
+''' VxRail Ansible Utility for waiting on long running operations '''
+
+
+class RequestPoller():
+    '''
+    Polls a long running operation until it reaches a terminal state or its wall-clock deadline passes.
+    The interval starts at min_interval, grows by the backoff factor (up to max_interval) while the state,
+    progress and step of the operation are unchanged, and shrinks by the same factor (down to min_interval)
+    when they change, so slow tasks are polled rarely and fast ones are noticed as soon as they finish.
+    Every interval is randomized by +/- jitter (a fraction of it) so that concurrent pollers spread out.
+    parameters:
+         - get_response: Callable returning the current status of the operation, with state, progress
+                         and step attributes or keys. An empty response, 'error' or an exception count
+                         as a failed poll. An ApiException with a 4xx status (but 408 and 429) stops the
+                         polling at once, as retrying the same call cannot succeed.
+         - logger: A logger object to record the functionality.
+         - timeout: Seconds after which the operation is given up on.
+         - label: Prefix of the log messages (ex: "LCM_Task").
+         - max_errors: Number of consecutive failed polls tolerated, or None to retry until the deadline.
+         - on_change: Callable invoked with the response whenever its state, progress or step changes.
+    '''
+    terminal_states = ('COMPLETED', 'FAILED')
+    # Client error statuses which may succeed when retried
+    retried_statuses = (408, 429)
+
+    def __init__(self, get_response, logger, timeout, label='Task', min_interval=5, max_interval=60, backoff=1.5,
+                 jitter=0.1, max_errors=None, on_change=None):
+        self.get_response = get_response
+        self.logger = logger
+        self.timeout = timeout
+        self.label = label
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff = backoff
+        self.jitter = jitter
+        self.max_errors = max_errors
+        self.on_change = on_change
+        # The last successful response, and its state
+        self.response = None
+        self.state = None
+        self.polls = 0
+        self.errors = 0
+        self.timed_out = False
+        # The error of the last failed poll, and the error polling stopped on, if any
+        self.last_error = None
+        self.error = None
+        self.client_error = False
+        self.elapsed = 0
+        self.interval = min_interval
+        self.changed = False
+        self.last_status = None
+        self.started_at = None
+        self.deadline = None
+
+    def wait(self):
+        self.start()
+        while True:
+            self.poll()
+            delay = self.next_delay()
+            if delay is None:
+                break
+            time.sleep(delay)
+        return self.finish()
+
+    # Same as wait, for use in an asyncio event loop: the blocking status call runs in the default executor
+    async def wait_async(self):
+        import asyncio
+        loop = asyncio.get_event_loop()
+        self.start()
+        while True:
+            await loop.run_in_executor(None, self.poll)
+            delay = self.next_delay()
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        return self.finish()
+
+    def start(self):
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + self.timeout
+
+    def finish(self):
+        self.elapsed = time.monotonic() - self.started_at
+        self.logger.info("%s: final status %s after %s polls in %.1f seconds", self.label, self.state, self.polls,
+                         self.elapsed)
+        return self.response
+
+    def done(self):
+        return self.state in RequestPoller.terminal_states
+
+    def poll(self):
+        self.polls += 1
+        self.changed = False
+        try:
+            response = self.get_response()
+        except Exception as e:
+            self.logger.error("%s: exception when polling status: %s", self.label, e)
+            self.last_error = str(e)
+            if isinstance(e, ApiException):
+                self.last_error = '{} {}'.format(e.status, e.reason)
+                if isinstance(e.status, int) and 400 <= e.status < 500 and e.status not in RequestPoller.retried_statuses:
+                    self.client_error = True
+            response = None
+        if not response or response == 'error':
+            self.errors += 1
+            if self.last_error is None:
+                self.last_error = 'Failed to get the status'
+            self.logger.info("%s: failed to get status. Count: %s", self.label, self.errors)
+            return
+        self.errors = 0
+        self.last_error = None
+        self.response = response
+        self.state = response_field(response, 'state')
+        status = (self.state, response_field(response, 'progress'), response_field(response, 'step'))
+        self.logger.info("%s: status: %s, progress: %s, step: %s", self.label, *status)
+        if status != self.last_status:
+            self.last_status = status
+            self.changed = True
+            if self.on_change is not None:
+                self.on_change(response)
+
+    # Returns the seconds to sleep before the next poll, or None once polling is over
+    def next_delay(self):
+        import random
+        if self.done():
+            return None
+        if self.client_error:
+            self.error = self.last_error
+            self.logger.error("%s: giving up on a client error", self.label)
+            return None
+        if self.max_errors is not None and self.errors >= self.max_errors:
+            self.error = self.last_error
+            self.logger.error("%s: giving up after %s consecutive failed polls", self.label, self.errors)
+            return None
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            self.timed_out = True
+            self.logger.error("%s: timed out after %s seconds", self.label, self.timeout)
+            return None
+        if self.changed:
+            self.interval = max(self.min_interval, self.interval / self.backoff)
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        delay = min(self.interval * random.uniform(1 - self.jitter, 1 + self.jitter), remaining)
+        self.logger.info("%s: Sleeping %.1f seconds...", self.label, delay)
+        return delay
+
+
+# Reads a field of a status response, whether it is a model object or a dictionary
+def response_field(response, name):
+    if isinstance(response, dict):
+        return response.get(name)
+    return getattr(response, name, None)
+
+
+class LCMPoller(RequestPoller):
+    '''
+    Polls an LCM operation, which outlives the reboots and upgrade of the VxRail Manager serving its status.
+    When a status call fails, the VxRail Manager is probed instead (see is_manager_reachable): a TCP and TLS
+    connection every probe interval, which starts at min_probe_interval and doubles up to max_probe_interval.
+    The status is polled again as soon as a probe succeeds. The time the manager is unreachable does not count
+    against the timeout, but an outage longer than outage_timeout ends the wait.
+    The transitions of the operation (state, step and progress) and of the manager are recorded in events.
+    parameters:
+         - vxm_ip: The IP address of the VxRail Manager to probe.
+         - outage_timeout: Seconds the VxRail Manager may stay unreachable.
+         - poller_args: Optional RequestPoller arguments (ex: label, min_interval, max_interval).
+    '''
+
+    def __init__(self, get_response, vxm_ip, logger, timeout, outage_timeout=2 * 60 * 60, min_probe_interval=10,
+                 max_probe_interval=180, **poller_args):
+        RequestPoller.__init__(self, get_response, logger, timeout, **poller_args)
+        self.vxm_ip = vxm_ip
+        self.outage_timeout = outage_timeout
+        self.min_probe_interval = min_probe_interval
+        self.max_probe_interval = max(min_probe_interval, max_probe_interval)
+        self.probe_interval = min_probe_interval
+        self.outage_started_at = None
+        self.outage_failed = False
+        self.events = []
+
+    def poll(self):
+        if self.outage_started_at is not None and not is_manager_reachable(self.vxm_ip):
+            self.errors += 1
+            self.logger.info("%s: VxRail Manager %s is unreachable. Count: %s", self.label, self.vxm_ip, self.errors)
+            return
+        RequestPoller.poll(self)
+        if self.errors and self.outage_started_at is None:
+            self.outage_started_at = time.monotonic()
+            self.probe_interval = self.min_probe_interval
+            self.add_event(event='manager_unreachable')
+        elif not self.errors and self.outage_started_at is not None:
+            outage = time.monotonic() - self.outage_started_at
+            self.deadline += outage
+            self.outage_started_at = None
+            self.add_event(event='manager_back', outage=round(outage, 1))
+        if self.changed:
+            self.add_event(state=self.state, step=response_field(self.response, 'step'),
+                           progress=response_field(self.response, 'progress'))
+
+    def next_delay(self):
+        import random
+        if self.outage_started_at is None:
+            return RequestPoller.next_delay(self)
+        outage = time.monotonic() - self.outage_started_at
+        if outage >= self.outage_timeout:
+            self.outage_failed = True
+            self.logger.error("%s: VxRail Manager %s unreachable for %.1f seconds, giving up", self.label, self.vxm_ip, outage)
+            return None
+        delay = min(self.probe_interval * random.uniform(1 - self.jitter, 1 + self.jitter), self.outage_timeout - outage)
+        self.probe_interval = min(self.max_probe_interval, self.probe_interval * 2)
+        self.logger.info("%s: probing VxRail Manager %s again in %.1f seconds...", self.label, self.vxm_ip, delay)
+        return delay
+
+    def add_event(self, **event):
+        event['elapsed'] = round(time.monotonic() - self.started_at, 1)
+        self.logger.info("%s: event %s", self.label, event)
+        self.events.append(event)
+
+
+'''
+This method checks that a VxRail Manager accepts TLS connections, which is much cheaper than an API call
+and does not need credentials
+parameters:
+     - vxm_ip: The IP address of the VxRail Manager.
+     - timeout: Seconds allowed for the connection and the TLS handshake.
+returns True if the TLS handshake succeeded
+'''
+
+
+def is_manager_reachable(vxm_ip, port=443, timeout=10):
+    import socket
+    context = ssl._create_unverified_context()
+    try:
+        with socket.create_connection((vxm_ip, port), timeout=timeout) as sock:
+            with context.wrap_socket(sock, server_hostname=vxm_ip):
+                return True
+    except (OSError, ssl.SSLError):
+        return False
+
+
+'''
+This method is used to wait for a long running operation through the v1/requests/{id} API
+parameters:
+     - request_id: Long running operation request ID.
+     - timeout: Seconds after which the operation is given up on.
+     - poller_args: Optional RequestPoller arguments (ex: label, min_interval, max_interval).
+returns RequestPoller object holding the last response, its state and whether the wait timed out
+'''
+
+
+def wait_for_request(vxm_ip, vcadmin, vcpasswd, request_id, logger, timeout, **poller_args):
+    request = VxRailRequest(vxm_ip, vcadmin, vcpasswd, logger)
+    poller = RequestPoller(lambda: request.get_request_response(request_id), logger, timeout, **poller_args)
+    poller.wait()
+    return poller
+
+
+'''
+This method is used to wait for many long running operations, on one or more VxRail Manager systems, at once.
+Every request is polled by its own RequestPoller on a shared asyncio event loop, and the blocking status calls
+run on a thread pool of at most max_workers threads, so a single process can follow dozens of clusters.
+parameters:
+     - requests: List of dictionaries with the vxmip, vcadmin, vcpasswd and request_id of each operation.
+     - timeout: Seconds after which the operations still running are given up on.
+     - max_workers: Maximum number of status calls in flight at the same time.
+     - poller_args: Optional RequestPoller arguments (ex: min_interval, max_interval, max_errors).
+returns list of RequestPoller objects, in the order of the requests. Their responses are dictionaries.
+        A request which is not found or not accessible (4xx status) is given up on at its first poll.
+'''
+
+
+def wait_for_requests(requests, logger, timeout, max_workers=16, **poller_args):
+    import asyncio
+    import concurrent.futures
+    pollers = []
+    for item in requests:
+        request = VxRailRequest(item['vxmip'], item['vcadmin'], item['vcpasswd'], logger)
+        label = '{}_{}'.format(item['vxmip'], item['request_id'])
+        get_response = functools.partial(request.get_request_response, item['request_id'], raw=True, raise_errors=True)
+        pollers.append(RequestPoller(get_response, logger, timeout, label=label, **poller_args))
+    if not pollers:
+        return pollers
+
+    async def wait_all():
+        await asyncio.gather(*[poller.wait_async() for poller in pollers])
+
+    loop = asyncio.new_event_loop()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pollers))))
+    loop.set_default_executor(executor)
+    try:
+        loop.run_until_complete(wait_all())
+    finally:
+        loop.close()
+        executor.shutdown(wait=True)
+    return pollers
+
+
+''' VxRail Ansible Utility for downloading files '''
+
+
+class FileDownload():
+    '''
+    Streams the body of a download API call to a file, chunk by chunk, instead of holding it in memory.
+    The body is written to <output_file_path>.part, which is renamed to the output file once complete, so the output
+    file is never left half written. When the transfer breaks, it is retried from where it stopped with a Range
+    request, and a later run resumes from the .part file left by an interrupted one.
+    The key of the request and the ETag (or Last-Modified) of the response are recorded in <output_file_path>.part.key.
+    A later run only resumes the .part file of the same key and validator, which is sent as If-Range so that the
+    VxRail Manager sends the whole body again if the report changed. Any other .part file is discarded.
+    parameters:
+         - api_instance: The API class instance the call is made on, only used by this download. The Range and
+                         If-Range headers are added to its requests, not to its ApiClient shared by the process.
+         - call: Callable issuing the API call on api_instance with _preload_content=False and returning its raw
+                 response.
+         - output_file_path: Path of the downloaded file.
+         - logger: A logger object to record the functionality.
+         - resume: Whether to resume from an existing .part file rather than starting over.
+         - retries: Number of times a broken transfer is resumed.
+         - key: JSON serializable identity of the request (ex: VxRail Manager, report id and format).
+    '''
+    chunk_size = 1024 * 1024
+
+    def __init__(self, api_instance, call, output_file_path, logger, resume=True, retries=3, key=None):
+        self.api_instance = api_instance
+        self.call = call
+        self.output_file_path = output_file_path
+        self.part_path = output_file_path + '.part'
+        self.key_path = self.part_path + '.key'
+        self.logger = logger
+        self.resume = resume
+        self.retries = retries
+        # Round trip through JSON, to compare it with the recorded one
+        self.key = json.loads(json.dumps(key))
+        # ETag or Last-Modified of the body written to the .part file
+        self.validator = None
+
+    # Returns a dictionary with the path, size, sha256 checksum, elapsed seconds and throughput of the download,
+    # or 'error'
+    def run(self):
+        started_at = time.monotonic()
+        checksum = hashlib.sha256()
+        offset = 0
+        if self.resume and os.path.exists(self.part_path) and self.load_key():
+            offset = self.hash_part(checksum)
+            self.logger.info("Resuming download of %s from byte %s", self.output_file_path, offset)
+        else:
+            self.discard_part()
+        resumed_from = offset
+        attempt = 0
+        while True:
+            try:
+                offset, checksum = self.transfer(offset, checksum)
+                break
+            except ApiException as e:
+                if e.status == 416 and offset:
+                    # The partial file does not match the report any more: start over
+                    self.logger.info("Range not satisfiable, restarting download of %s", self.output_file_path)
+                    offset, checksum, resumed_from = 0, hashlib.sha256(), 0
+                    self.discard_part()
+                    continue
+                self.logger.error("Exception when downloading %s: %s\n", self.output_file_path, e)
+                return 'error'
+            except Exception as e:
+                attempt += 1
+                if attempt > self.retries:
+                    self.logger.error("Download of %s failed after %s attempts: %s\n", self.output_file_path, attempt, e)
+                    return 'error'
+                offset = os.path.getsize(self.part_path) if os.path.exists(self.part_path) else 0
+                checksum = hashlib.sha256()
+                self.hash_part(checksum)
+                self.logger.info("Download of %s broken at byte %s (%s), retrying", self.output_file_path, offset, e)
+        os.replace(self.part_path, self.output_file_path)
+        self.remove(self.key_path)
+        elapsed = time.monotonic() - started_at
+        result = {'path': self.output_file_path, 'bytes': offset, 'resumed_from': resumed_from,
+                  'sha256': checksum.hexdigest(), 'elapsed': round(elapsed, 3),
+                  'throughput': round((offset - resumed_from) / elapsed) if elapsed > 0 else None}
+        self.logger.info("Downloaded %s: %s", self.output_file_path, result)
+        return result
+
+    # Returns whether the .part file was written for the same request and body, as recorded in the key file
+    def load_key(self):
+        try:
+            with open(self.key_path, encoding='utf_8') as f:
+                recorded = json.load(f)
+        except (OSError, ValueError):
+            recorded = {}
+        if not isinstance(recorded, dict) or recorded.get('key') != self.key or not recorded.get('validator'):
+            self.logger.info("Partial download of %s is not from the same report, starting over", self.output_file_path)
+            return False
+        self.validator = recorded['validator']
+        return True
+
+    def save_key(self):
+        with open(self.key_path, 'w', encoding='utf_8') as f:
+            json.dump({'key': self.key, 'validator': self.validator}, f)
+
+    def discard_part(self):
+        self.remove(self.part_path)
+        self.remove(self.key_path)
+        self.validator = None
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def hash_part(self, checksum):
+        size = 0
+        with open(self.part_path, 'rb') as part:
+            for chunk in iter(lambda: part.read(self.chunk_size), b''):
+                checksum.update(chunk)
+                size += len(chunk)
+        return size
+
+    # Streams the response body to the .part file from offset, returns the final offset and checksum
+    def transfer(self, offset, checksum):
+        headers = {}
+        if offset:
+            headers['Range'] = 'bytes={}-'.format(offset)
+            if self.validator:
+                headers['If-Range'] = self.validator
+        api_client = self.api_instance.api_client
+        self.api_instance.api_client = _HeaderApiClient(api_client, headers)
+        try:
+            response = self.call()
+        finally:
+            self.api_instance.api_client = api_client
+        try:
+            self.logger.info("Http Result: Status code - %s, Headers - %s", response.status, response.headers)
+            if offset and response.status != 206:
+                # The server ignored the Range header, or the report changed since, and sends the whole body again
+                self.logger.info("Range request not honored, restarting download of %s", self.output_file_path)
+                offset, checksum = 0, hashlib.sha256()
+            if not offset:
+                self.validator = self.response_validator(response)
+                self.save_key()
+            with open(self.part_path, 'ab' if offset else 'wb') as part:
+                for chunk in response.stream(self.chunk_size):
+                    part.write(chunk)
+                    checksum.update(chunk)
+                    offset += len(chunk)
+                part.flush()
+                os.fsync(part.fileno())
+        finally:
+            response.release_conn()
+        return offset, checksum
+
+    # The ETag (unless weak, which If-Range does not accept) or else the Last-Modified of the response
+    @staticmethod
+    def response_validator(response):
+        etag = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return response.headers.get('Last-Modified')
+
+
+''' VxRail Ansible Utility for uploading files '''
+
+
+class MultipartBody():
+    '''
+    File-like multipart/form-data request body, which reads the uploaded file chunk by chunk as it is sent instead of
+    loading it into memory, and computes its SHA512 checksum on the way.
+    parameters:
+         - fields: Dictionary of the form fields sent before the file.
+         - file_field: Name of the form field of the file.
+         - file_path: Path of the file to upload.
+         - on_read: Callable invoked with the number of bytes of the file sent so far.
+    '''
+
+    def __init__(self, fields, file_field, file_path, on_read=None):
+        import uuid
+        self.boundary = uuid.uuid4().hex
+        self.content_type = 'multipart/form-data; boundary=' + self.boundary
+        self.file_path = file_path
+        self.file_size = os.path.getsize(file_path)
+        self.on_read = on_read
+        self.checksum = hashlib.sha512()
+        self.sent = 0
+        head = b''
+        for name, value in fields.items():
+            head += self.part_header(name) + b'\r\n' + str(value).encode('utf-8') + b'\r\n'
+        head += self.part_header(file_field, os.path.basename(file_path)) + b'Content-Type: application/octet-stream\r\n\r\n'
+        self.head = head
+        self.tail = '\r\n--{}--\r\n'.format(self.boundary).encode('ascii')
+        self.length = len(self.head) + self.file_size + len(self.tail)
+        self.file = None
+        self.position = 0
+
+    def part_header(self, name, filename=None):
+        disposition = 'form-data; name="{}"'.format(name)
+        if filename is not None:
+            disposition += '; filename="{}"'.format(filename)
+        return '--{}\r\nContent-Disposition: {}\r\n'.format(self.boundary, disposition).encode('utf-8')
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.length
+        if self.file is None:
+            self.file = open(self.file_path, 'rb')
+        data = b''
+        # Header of the file part
+        if self.position < len(self.head):
+            data = self.head[self.position:self.position + size]
+            self.position += len(data)
+        # Content of the file
+        if len(data) < size and self.position < len(self.head) + self.file_size:
+            chunk = self.file.read(size - len(data))
+            self.checksum.update(chunk)
+            self.sent += len(chunk)
+            self.position += len(chunk)
+            data += chunk
+            if self.on_read is not None:
+                self.on_read(self.sent)
+        # End of the body
+        end = len(self.head) + self.file_size
+        if len(data) < size and self.position >= end:
+            offset = self.position - end
+            tail = self.tail[offset:offset + size - len(data)]
+            self.position += len(tail)
+            data += tail
+        return data
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class FileUpload():
+    '''
+    Uploads a file to a multipart/form-data API of the VxRail Manager, streaming it from disk (see MultipartBody).
+    The upload progress is logged every 10%, and an upload broken by a connection error is sent again, as the VxRail
+    Manager upload APIs cannot resume a partial upload.
+    Use from_api_call to send the request of a method of the generated API classes.
+    parameters:
+         - api_client: The ApiClient whose configuration (host, credentials) and connection pool are used.
+         - resource_path: Versioned path of the API (ex: /v1/lcm/upgrade/upload-bundle).
+         - fields: Dictionary of the form fields sent with the file.
+         - file_field: Name of the form field of the file.
+         - file_path: Path of the file to upload.
+         - logger: A logger object to record the functionality.
+         - timeout: Timeout in seconds of the request.
+         - retries: Number of times an upload broken by a connection error is sent again.
+         - method: HTTP method of the API.
+         - auth_settings: Names of the authentication settings of the API (ex: ['basicAuth']).
+    '''
+
+    def __init__(self, api_client, resource_path, fields, file_field, file_path, logger, timeout=None, retries=2,
+                 method='POST', auth_settings=('basicAuth',)):
+        self.api_client = api_client
+        self.url = api_client.configuration.host + resource_path
+        self.resource_path = resource_path
+        self.fields = fields
+        self.file_field = file_field
+        self.file_path = file_path
+        self.logger = logger
+        self.timeout = timeout
+        self.retries = retries
+        self.method = method
+        self.auth_settings = list(auth_settings)
+        self.size = 0
+        self.progress = 0
+
+    # Builds the upload of the request the API method would send with the given arguments (see describe_api_call)
+    @classmethod
+    def from_api_call(cls, api_call, logger, timeout=None, retries=2, **kwargs):
+        request = describe_api_call(api_call, **kwargs)
+        if len(request['files']) != 1:
+            raise ValueError("{} does not upload a single file".format(api_call.__name__))
+        (file_field, file_path), = request['files'].items()
+        return cls(api_call.__self__.api_client, request['resource_path'], request['fields'], file_field, file_path,
+                   logger, timeout=timeout, retries=retries, method=request['method'],
+                   auth_settings=request['auth_settings'])
+
+    # Returns a dictionary with the parsed response, size, sha512 checksum, elapsed seconds and throughput of the
+    # upload, or 'error'
+    def run(self):
+        attempt = 0
+        while True:
+            attempt += 1
+            body = MultipartBody(self.fields, self.file_field, self.file_path, self.log_progress)
+            started_at = time.monotonic()
+            try:
+                with traced_call('upload', urllib.parse.urlsplit(self.url).hostname, self.method, self.resource_path) as record:
+                    response = self.send(body)
+                    record.update(status=response.status, bytes=body.sent, retries=attempt - 1)
+                break
+            except ApiException as e:
+                self.logger.error("Exception when uploading %s to %s: %s\n", self.file_path, self.url, e)
+                return 'error'
+            except Exception as e:
+                if attempt > self.retries:
+                    self.logger.error("Upload of %s failed after %s attempts: %s\n", self.file_path, attempt, e)
+                    return 'error'
+                self.logger.info("Upload of %s broken after %s bytes (%s), sending it again", self.file_path, body.sent, e)
+            finally:
+                body.close()
+        elapsed = time.monotonic() - started_at
+        result = {'response': loads_json(response.data) if response.data else None, 'bytes': body.sent,
+                  'sha512': body.checksum.hexdigest(), 'attempts': attempt, 'elapsed': round(elapsed, 3),
+                  'throughput': round(body.sent / elapsed) if elapsed > 0 else None}
+        self.logger.info("Uploaded %s: %s", self.file_path, result)
+        return result
+
+    def send(self, body):
+        self.size = body.file_size
+        self.progress = 0
+        self.logger.info("Uploading %s (%s bytes) to %s", self.file_path, body.file_size, self.url)
+        headers = dict(self.api_client.default_headers)
+        self.api_client.update_params_for_auth(headers, [], self.auth_settings)
+        headers['Content-Type'] = body.content_type
+        headers['Content-Length'] = str(body.length)
+        headers['Accept'] = 'application/json'
+        # The REST client wrapped by the persistent connection one (see ConnectionRESTClient) holds the connection pool
+        rest_client = getattr(self.api_client.rest_client, 'rest_client', self.api_client.rest_client)
+        response = rest_client.pool_manager.urlopen(
+            self.method, self.url, body=body, headers=headers, timeout=self.timeout, retries=False, preload_content=True)
+        self.logger.info("Http Result: Status code - %s", response.status)
+        if not 200 <= response.status <= 299:
+            exception = ApiException(status=response.status, reason=response.reason)
+            exception.body = response.data
+            raise exception
+        return response
+
+    def log_progress(self, sent):
+        progress = sent * 10 // (self.size or 1) * 10
+        if progress > self.progress:
+            self.progress = progress
+            self.logger.info("Uploading %s: %s%% (%s bytes)", self.file_path, progress, sent)
+
+
+'''
+This method returns the request an API method of the generated API classes would send with the given arguments,
+without sending it, so that the request can be sent another way (ex: streamed by FileUpload) with the versioned path,
+form fields and authentication settings of the API.
+parameters:
+     - api_call: Bound method of an API class (ex: api_instance.v1_upload_bundle_customized_component)
+     - kwargs: Arguments of the method
+returns Dictionary with the resource_path (with the path parameters filled in), method, fields (form fields),
+        files (form field to file path) and auth_settings of the request
+'''
+
+
+def describe_api_call(api_call, **kwargs):
+    api_instance = api_call.__self__
+    recorder = _RecordingApiClient(api_instance.api_client)
+    api_instance.api_client = recorder
+    try:
+        api_call(**kwargs)
+    finally:
+        api_instance.api_client = recorder.api_client
+    return recorder.request
+
+
+class _HeaderApiClient():
+    ''' Stands in for the ApiClient of an API class and adds the given headers to the requests of call_api '''
+
+    def __init__(self, api_client, headers):
+        self.api_client = api_client
+        self.headers = headers
+
+    def __getattr__(self, name):
+        return getattr(self.api_client, name)
+
+    def call_api(self, resource_path, method, path_params=None, query_params=None, header_params=None, *args, **kwargs):
+        return self.api_client.call_api(resource_path, method, path_params, query_params,
+                                        dict(header_params or {}, **self.headers), *args, **kwargs)
+
+
+class _RecordingApiClient():
+    ''' Stands in for the ApiClient of an API class and records the request of call_api instead of sending it '''
+
+    def __init__(self, api_client):
+        self.api_client = api_client
+        self.request = None
+
+    def __getattr__(self, name):
+        return getattr(self.api_client, name)
+
+    def call_api(self, resource_path, method, path_params=None, query_params=None, header_params=None, body=None,
+                 post_params=None, files=None, response_type=None, auth_settings=None, **kwargs):
+        for name, value in (path_params or {}).items():
+            resource_path = resource_path.replace('{%s}' % name, urllib.parse.quote(str(value), safe=''))
+        self.request = {'resource_path': resource_path, 'method': method,
+                        'fields': {name: value for name, value in (post_params or []) if value is not None},
+                        'files': {name: path for name, path in (files or {}).items() if path},
+                        'auth_settings': list(auth_settings or [])}
+
+
+'''
+Persistent cache of the SHA512 checksums of local files (ex: LCM bundles and customized components), so that a
+bundle uploaded to many VxRail Managers is hashed once. There is one JSON entry per file, keyed by its real path
+and valid as long as the size, modification time and inode of the file are unchanged. Concurrent forks hashing
+the same file wait for the first one instead of reading the file again.
+The cache is tuned through environment variables:
+     - VXRAIL_HASH_CACHE: set to "off" to disable the cache.
+     - VXRAIL_HASH_CACHE_DIR: directory holding the entries (default /tmp/vxrail_ansible_hash_cache).
+'''
+
+
+class FileHashCache():
+    default_dir = '/tmp/vxrail_ansible_hash_cache'
+    chunk_size = 4 * 1024 * 1024
+
+    def __init__(self, logger, cache_dir=None):
+        self.logger = logger
+        self.enabled = not _env_flag_is('VXRAIL_HASH_CACHE', ('0', 'off', 'false', 'no'))
+        self.cache_dir = cache_dir or os.environ.get('VXRAIL_HASH_CACHE_DIR', FileHashCache.default_dir)
+
+    def entry_path(self, path):
+        return os.path.join(self.cache_dir, hashlib.sha256(path.encode('utf-8')).hexdigest() + '.json')
+
+    @staticmethod
+    def file_key(path):
+        stat = os.stat(path)
+        return {'path': path, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'inode': stat.st_ino}
+
+    # Returns the SHA512 hex digest of the file, from the cache when the file did not change
+    def sha512(self, path):
+        import fcntl
+        path = os.path.realpath(path)
+        if not self.enabled:
+            return self.hash_file(path)
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            lock = open(self.entry_path(path) + '.lock', 'w')
+        except OSError as e:
+            self.logger.info("Could not use the hash cache for %s: %s", path, e)
+            return self.hash_file(path)
+        with lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            key = self.file_key(path)
+            digest = self.load(key)
+            if digest is not None:
+                self.logger.info("Using cached SHA512 of %s", path)
+                return digest
+            digest = self.hash_file(path)
+            # The file may have changed while it was read
+            if self.file_key(path) == key:
+                self.store(key, digest)
+        return digest
+
+    def load(self, key):
+        try:
+            with open(self.entry_path(key['path']), encoding='utf_8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        return entry.get('sha512')
+
+    def store(self, key, digest):
+        import tempfile
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf_8') as f:
+                json.dump({'key': key, 'sha512': digest}, f)
+            os.replace(tmp_path, self.entry_path(key['path']))
+        except OSError as e:
+            self.logger.info("Could not write the hash cache entry of %s: %s", key['path'], e)
+
+    def hash_file(self, path):
+        started_at = time.monotonic()
+        checksum = hashlib.sha512()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(FileHashCache.chunk_size), b''):
+                checksum.update(chunk)
+        self.logger.info("Computed SHA512 of %s in %.1f seconds", path, time.monotonic() - started_at)
+        return checksum.hexdigest()
+
+
+'''
+This method returns the SHA512 checksum of a local file, computed once per version of the file (see FileHashCache)
+parameters:
+     - path: Path of the file.
+     - logger: A logger object to record the functionality.
+returns The SHA512 hex digest of the file
+'''
+
+
+def get_file_sha512(path, logger):
+    return FileHashCache(logger).sha512(path)
+
+
+''' VxRail Ansible Utility for LCM upgrades '''
+
+'''
+This method builds the request body of the LCM upgrade API (ex: upgrade_v9) from the LCM module settings,
+so the same upgrade can be started on any number of VxRail Manager systems
+parameters:
+     - settings: Dictionary of the dellemc_vxrail_lcm module options (bundle, vcadmin, vcpasswd, vc_root_account...).
+                 Missing options are unset.
+     - api_version_number: The version number of the LCM upgrade API.
+returns The request body as a dictionary
+'''
+
+
+def create_lcm_json(settings, api_version_number):
+    lcm_json = {}
+    lcm_json['bundle_file_locator'] = settings.get('bundle')
+    vcenter_dict = {}
+    vcenter_dict['vc_admin_user'] = {'username': settings.get('vcadmin'), 'password': settings.get('vcpasswd')}
+    vcenter_dict['vcsa_root_user'] = {'username': settings.get('vc_root_account'), 'password': settings.get('vc_root_passwd')}
+
+    vxrail_dict = {}
+    vxrail_dict['vxm_root_user'] = {'username': settings.get('vxm_root_account'), 'password': settings.get('vxm_root_passwd')}
+    lcm_json['vxrail'] = vxrail_dict
+
+    if settings.get('psc_root_passwd') and api_version_number <= 2:
+        vcenter_dict['psc_root_user'] = {'username': settings.get('psc_root_account'), 'password': settings.get('psc_root_passwd')}
+
+    migration_spec_dict = {}
+    if settings.get('source_vcsa_host_name'):
+        source_vcsa_host_dict = {}
+        source_vcsa_host_dict['name'] = settings.get('source_vcsa_host_name')
+        source_vcsa_host_dict['user'] = {'username': settings.get('source_vcsa_host_user_name'),
+                                         'password': settings.get('source_vcsa_host_user_passwd')}
+        migration_spec_dict['source_vcsa_host'] = source_vcsa_host_dict
+    if settings.get('source_psc_host_name') and api_version_number <= 2:
+        source_psc_host_dict = {}
+        source_psc_host_dict['name'] = settings.get('source_psc_host_name')
+        source_psc_host_dict['user'] = {'username': settings.get('source_psc_host_user_name'),
+                                        'password': settings.get('source_psc_host_user_passwd')}
+        migration_spec_dict['source_psc_host'] = source_psc_host_dict
+    if settings.get('target_vcsa_host_name'):
+        target_vcsa_host_dict = {}
+        target_vcsa_host_dict['name'] = settings.get('target_vcsa_host_name')
+        target_vcsa_host_dict['user'] = {'username': settings.get('target_vcsa_host_user_name'),
+                                         'password': settings.get('target_vcsa_host_user_passwd')}
+        migration_spec_dict['target_vcsa_host'] = target_vcsa_host_dict
+    if settings.get('temporary_ip'):
+        migration_spec_dict['temporary_ip_setting'] = {'temporary_ip': settings.get('temporary_ip'),
+                                                       'gateway': settings.get('temporary_gateway'),
+                                                       'netmask': settings.get('temporary_netmask')}
+    if any(migration_spec_dict):
+        vcenter_dict['migration_spec'] = migration_spec_dict
+    lcm_json['vcenter'] = vcenter_dict
+
+    if api_version_number >= 2:
+        if settings.get('witness_username'):
+            witness_dict = {}
+            witness_user_dict = {'username': settings.get('witness_username'),
+                                 'password': settings.get('witness_password')}
+            witness_dict['witness_user'] = witness_user_dict
+            witness_dict['auto_witness_upgrade'] = settings.get('auto_witness_upgrade')
+            lcm_json['witness'] = witness_dict
+
+        if settings.get('preferred_fault_domain_first'):
+            lcm_json['upgrade_sequence'] = {'preferred_fault_domain_first': settings.get('preferred_fault_domain_first')}
+
+    target_hosts_name = settings.get('target_hosts_name') or "all"
+    if api_version_number >= 4:
+        if target_hosts_name != "all":
+            target_hosts_list = []
+            for item in target_hosts_name.split(","):
+                target_hosts_list.append({'name': item})
+            lcm_json['target_hosts'] = target_hosts_list
+
+    if api_version_number >= 5:
+        update_rules = {}
+        ecosystem_check = {}
+
+        if settings.get('missing_file_check') is not None:
+            update_rules['missing_file_check'] = settings.get('missing_file_check')
+
+        if settings.get('skip_failed_hosts') is not None:
+            update_rules['skip_failed_hosts'] = settings.get('skip_failed_hosts')
+
+        if settings.get('ecosystem_check_components'):
+            components = settings.get('ecosystem_check_components').split(",")
+            ecosystem_check['components'] = components
+            ecosystem_check['continue_with_incompatible'] = settings.get('ecosystem_check_continue_with_incompatible')
+
+        update_rules['ecosystem_check'] = ecosystem_check
+        lcm_json['update_rules'] = update_rules
+
+    # for api v6
+    vcenter_dict['vc_mgmt_user'] = {'username': settings.get('vc_mgmt_account'), 'password': settings.get('vc_mgmt_passwd')}
+
+    # for api v8
+    if api_version_number >= 8:
+        lcm_json['vlcm_parameters'] = create_vlcm_parameters(settings)
+
+    return lcm_json
+
+
+'''
+This method builds the request body of the LCM precheck API (ex: precheck_v2) from the LCM precheck module settings
+parameters:
+     - settings: Dictionary of the dellemc_vxrail_lcm_precheck module options (bundle_file_locator, vcadmin, vcpasswd...).
+                 Missing options are unset.
+     - api_version_number: The version number of the LCM precheck API.
+returns The request body as a dictionary
+'''
+
+
+def create_lcm_precheck_json(settings, api_version_number):
+    lcm_precheck_json = {}
+    lcm_precheck_json['bundle_file_locator'] = settings.get('bundle_file_locator')
+    lcm_precheck_json['health_precheck_type'] = settings.get('health_precheck_type') or "LCM_PRECHECK"
+    vcenter_dict = {}
+    vcenter_dict['vc_admin_user'] = {'username': settings.get('vcadmin'), 'password': settings.get('vcpasswd')}
+    vcenter_dict['vcsa_root_user'] = {'username': settings.get('vc_root_account'), 'password': settings.get('vc_root_passwd')}
+    lcm_precheck_json['vcenter'] = vcenter_dict
+    vxrail_dict = {}
+    vxrail_dict['vxm_root_user'] = {'username': settings.get('vxm_root_account'), 'password': settings.get('vxm_root_passwd')}
+    lcm_precheck_json['vxrail'] = vxrail_dict
+
+    # for api v2
+    if api_version_number >= 2:
+        lcm_precheck_json['vlcm_parameters'] = create_vlcm_parameters(settings)
+
+    return lcm_precheck_json
+
+
+# Builds the vLCM parameters shared by the LCM upgrade (v8 and later) and precheck (v2 and later) APIs
+def create_vlcm_parameters(settings):
+    vlcm_parameters = {}
+    parallel_remediation = {}
+    enforce_quick_patch = {}
+
+    if settings.get('enable_quick_boot') is not None:
+        vlcm_parameters['enable_quick_boot'] = settings.get('enable_quick_boot')
+
+    if settings.get('parallel_remediation_enable') is not None:
+        parallel_remediation['enabled'] = settings.get('parallel_remediation_enable')
+        parallel_remediation['max_hosts'] = settings.get('parallel_remediation_max')
+        vlcm_parameters['parallel_remediation_action'] = parallel_remediation
+
+    if settings.get('enforce_quick_patch') is not None:
+        enforce_quick_patch['enabled'] = settings.get('enforce_quick_patch')
+
+    if settings.get('retry_as_standard') is not None:
+        enforce_quick_patch['retry_as_standard'] = settings.get('retry_as_standard')
+    vlcm_parameters['enforce_quick_patch'] = enforce_quick_patch
+    return vlcm_parameters
+
+
+'''
+Persistent cache of the passing LCM prechecks, so that a precheck which passed minutes before an upgrade is not
+run again. There is one JSON entry per VxRail Manager, bundle, precheck type and precheck parameters (see
+precheck_cache_params), holding the request ID of the precheck and the time it passed. The entries of a VxRail
+Manager are dropped once it is upgraded.
+The cache is tuned through environment variables:
+     - VXRAIL_PRECHECK_CACHE: set to "off" to disable the cache.
+     - VXRAIL_PRECHECK_CACHE_DIR: directory holding the entries (default /tmp/vxrail_ansible_precheck_cache).
+'''
+
+
+class PrecheckCache():
+    default_dir = '/tmp/vxrail_ansible_precheck_cache'
+
+    def __init__(self, logger, cache_dir=None):
+        self.logger = logger
+        self.enabled = not _env_flag_is('VXRAIL_PRECHECK_CACHE', ('0', 'off', 'false', 'no'))
+        self.cache_dir = cache_dir or os.environ.get('VXRAIL_PRECHECK_CACHE_DIR', PrecheckCache.default_dir)
+
+    def vxm_dir(self, vxm_ip):
+        return os.path.join(self.cache_dir, re.sub(r'[^A-Za-z0-9_.-]', '_', str(vxm_ip)))
+
+    def entry_path(self, vxm_ip, bundle, health_precheck_type, params=None):
+        key = json.dumps([bundle, health_precheck_type, params], sort_keys=True)
+        return os.path.join(self.vxm_dir(vxm_ip), hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+    # Returns the entry of the last passing precheck with the same parameters, or None if there is none younger
+    # than max_age seconds
+    def load(self, vxm_ip, bundle, health_precheck_type, max_age, params=None):
+        if not self.enabled or max_age <= 0:
+            return None
+        try:
+            with open(self.entry_path(vxm_ip, bundle, health_precheck_type, params), encoding='utf_8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Round trip through JSON, to compare them with the recorded ones
+        params = json.loads(json.dumps(params))
+        if not isinstance(entry, dict) or entry.get('bundle') != bundle or entry.get('params') != params:
+            return None
+        if time.time() - entry.get('passed_at', 0) >= max_age:
+            return None
+        return entry
+
+    def store(self, vxm_ip, bundle, health_precheck_type, request_id, passed_at=None, params=None):
+        if not self.enabled:
+            return
+        entry = {'vxmip': vxm_ip, 'bundle': bundle, 'health_precheck_type': health_precheck_type, 'params': params,
+                 'request_id': request_id, 'passed_at': passed_at or time.time()}
+        import tempfile
+        try:
+            os.makedirs(self.vxm_dir(vxm_ip), mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.vxm_dir(vxm_ip), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf_8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self.entry_path(vxm_ip, bundle, health_precheck_type, params))
+        except OSError as e:
+            self.logger.info("Could not write the precheck cache entry of %s: %s", vxm_ip, e)
+
+    # Drops the entries of the VxM, whose prechecks no longer hold once it changed
+    def invalidate(self, vxm_ip):
+        vxm_dir = self.vxm_dir(vxm_ip)
+        try:
+            names = os.listdir(vxm_dir)
+        except OSError:
+            return
+        for name in names:
+            try:
+                os.remove(os.path.join(vxm_dir, name))
+            except OSError:
+                pass
+
+
+'''
+This method returns the parameters of an LCM precheck which a recorded precheck must share to be reused: the
+bundle checksum given by the user, the accounts and the vLCM parameters of the precheck request. The passwords are
+left out, so that they are not written to disk.
+parameters:
+     - settings: The LCM precheck module settings (see create_lcm_precheck_json) and the bundle_checksum.
+returns A JSON serializable dictionary
+'''
+
+
+def precheck_cache_params(settings):
+    return {'bundle_checksum': settings.get('bundle_checksum'),
+            'accounts': [settings.get('vcadmin'), settings.get('vc_root_account'), settings.get('vxm_root_account')],
+            'vlcm_parameters': create_vlcm_parameters(settings)}
+
+
+'''
+This method returns the last passing LCM precheck of a bundle on a VxRail Manager (see PrecheckCache)
+parameters:
+     - vxm_ip: The IP Address of the VxRail Manager.
+     - bundle: The path of the LCM bundle on the VxRail Manager.
+     - max_age: Age in seconds under which a passing precheck is returned. No precheck is returned if set to 0.
+     - logger: A logger object to record the functionality.
+     - health_precheck_type: The type of the precheck.
+     - params: The parameters of the precheck (see precheck_cache_params), which must be the recorded ones.
+returns A dictionary with the request_id of the precheck and the time it passed (passed_at), or None
+'''
+
+
+def get_passed_precheck(vxm_ip, bundle, max_age, logger, health_precheck_type='LCM_PRECHECK', params=None):
+    entry = PrecheckCache(logger).load(vxm_ip, bundle, health_precheck_type, max_age, params)
+    if entry is not None:
+        logger.info("%s: reusing precheck %s of %s, passed %.0f seconds ago", vxm_ip, entry.get('request_id'), bundle,
+                    time.time() - entry['passed_at'])
+    return entry
+
+
+'''
+This method records a passing LCM precheck of a bundle on a VxRail Manager, for the upgrades started later
+parameters:
+     - vxm_ip: The IP Address of the VxRail Manager.
+     - bundle: The path of the LCM bundle on the VxRail Manager.
+     - request_id: The request ID of the precheck.
+     - logger: A logger object to record the functionality.
+     - health_precheck_type: The type of the precheck.
+     - params: The parameters of the precheck (see precheck_cache_params).
+'''
+
+
+def record_passed_precheck(vxm_ip, bundle, request_id, logger, health_precheck_type='LCM_PRECHECK', params=None):
+    PrecheckCache(logger).store(vxm_ip, bundle, health_precheck_type, request_id, params=params)
+
+
+'''
+This method drops the passing LCM prechecks of a VxRail Manager, e.g. after an upgrade
+parameters:
+     - vxm_ip: The IP Address of the VxRail Manager.
+     - logger: A logger object to record the functionality.
+'''
+
+
+def invalidate_precheck_cache(vxm_ip, logger):
+    PrecheckCache(logger).invalidate(vxm_ip)
@@ -362,8 +362,8 @@ class VxRailAutoDiscoveryHosts():
         return api_auto_discovery_hosts_get()
 
     def get_auto_discovery(self):
-        api_instance = vxrail_ansible_utility.VxRailInstallationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VxRailInstallationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get all auto discovery  hosts information
             response = self.get_versioned_response(api_instance, 'GET /system/initialize/nodes')
@@ -130,7 +130,7 @@ class VxRailCluster():
             'vxm_ip': self.vxm_ip
         }
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.BandwidthThrottlingInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('BandwidthThrottlingInformationApi')(utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'Put system/bandwidth-throttling', bandwidth_throttling_info)
         except ApiException as e:
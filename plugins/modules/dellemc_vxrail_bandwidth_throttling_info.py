@@ -125,7 +125,7 @@ class VxRailCluster():
     def get_system_bandwidth_throttling(self):
         bandwidth_throttling_info = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.BandwidthThrottlingInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('BandwidthThrottlingInformationApi')(utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'Get system/bandwidth-throttling')
         except ApiException as e:
@@ -140,7 +140,7 @@ class VxRailCluster():
 
     def put_callhome_mode(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CallHomeModeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CallHomeModeApi')(utils.get_api_client(self.configuration))
         try:
             # Change CallHome Mode
             response = self.get_versioned_response(api_instance, "Put /callhome/mode")
@@ -129,7 +129,7 @@ class VxRailCluster():
 
     def disable_callhome(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CallHomeOperationsApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CallHomeOperationsApi')(utils.get_api_client(self.configuration))
         try:
             # Disable CallHome Server
             response = self.get_versioned_response(api_instance, "Delete /callhome/disable")
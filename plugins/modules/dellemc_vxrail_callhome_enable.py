@@ -322,8 +322,8 @@ class VxRailCluster():
         return callhome_info
 
     def enable_callhome(self):
-        api_instance = vxrail_ansible_utility.CallHomeOperationsApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CallHomeOperationsApi')(
+            utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'Post callhome/enable')
         except ApiException as e:
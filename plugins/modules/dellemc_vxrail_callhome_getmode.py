@@ -127,7 +127,7 @@ class VxRailCluster():
     def get_callhome_mode(self):
         CallHomeModeInfo = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CallHomeModeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CallHomeModeApi')(utils.get_api_client(self.configuration))
         try:
             # query CallHome Mode information
             response = self.get_versioned_response(api_instance, "Get /callhome/mode")
@@ -138,7 +138,7 @@ class VxRailCallhome():
         callhomeInfos = {}
         callhomeInfolist = []
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CallHomeOperationsApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CallHomeOperationsApi')(utils.get_api_client(self.configuration))
         try:
             # query callhome information
             response = self.get_versioned_response(api_instance, "Get /callhome/info")
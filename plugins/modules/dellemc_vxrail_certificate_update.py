@@ -123,7 +123,6 @@ certificate_update_information:
 
 import logging
 import urllib3
-import time
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
@@ -205,7 +204,7 @@ class VxRailCluster():
 
     def post_certificate_import(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CertificatesApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CertificatesApi')(utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'POST /certificates/import-vxm')
         except ApiException as e:
@@ -217,7 +216,7 @@ class VxRailCluster():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(job_id)
         except (ConnectionError) as e:
@@ -269,7 +268,6 @@ def main():
     initial_timeout = module.params.get('timeout')
     api_version_number = module.params.get('api_version_number')
     update_status = 0
-    time_out = 0
 
     result = VxRailCluster().check_parameters()
     if result != 'success':
@@ -287,16 +285,15 @@ def main():
         update_request_id = result.request_id
         LOGGER.info('Update certificate: VxRail task_ID: %s.', update_request_id)
 
-    while update_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        LOGGER.info("Get Update_Task : sleeping 10 seconds...")
-        time.sleep(10)
-        time_out = time_out + 10
-        update_response = VxRailCluster().get_request_status(update_request_id)
-        if update_response:
-            update_status = update_response.state
-            update_result = VxRailCluster().get_request_info(update_response)
-            LOGGER.info('Update_Task: status: %s.', update_status)
-            LOGGER.info('Update_Task: details: %s.', update_result)
+    if update_status != 'COMPLETED':
+        cluster = VxRailCluster()
+        # Services restart while the certificate is updated, so failed polls are retried until the timeout
+        poller = utils.RequestPoller(lambda: cluster.get_request_status(update_request_id), LOGGER, initial_timeout,
+                                     label='Update_Task', min_interval=5, max_interval=10)
+        update_response = poller.wait()
+        update_status = poller.state
+        update_result = cluster.get_request_info(update_response) if update_response else None
+        LOGGER.info('Update_Task: details: %s.', update_result)
 
     if update_status == 'COMPLETED':
         LOGGER.info("-----Updating Certificate Completed-----")
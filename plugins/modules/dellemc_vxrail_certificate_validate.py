@@ -156,7 +156,7 @@ class VxRailCluster():
 
     def post_certificate_validate(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CertificatesApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CertificatesApi')(utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'POST /certificates/validate')
         except ApiException as e:
@@ -131,7 +131,7 @@ class VxRailSystem():
 
     def invoke_public_api(self) -> dict:
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CertificatesApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CertificatesApi')(utils.get_api_client(self.configuration))
         try:
             # Invoke api
             response = self.get_versioned_response(api_instance, "GET /trust-store/certificates/fingerprints")
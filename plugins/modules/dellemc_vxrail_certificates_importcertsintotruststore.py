@@ -137,7 +137,7 @@ class VxRailSystem():
 
     def invoke_public_api(self) -> dict:
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CertificatesApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CertificatesApi')(utils.get_api_client(self.configuration))
         certs_info = {'certs': self.certs}
         try:
             # Invoke api
@@ -182,7 +182,7 @@ class VxRailHosts():
         # create an instance of the API class
         api_class = getattr(vxrail_ansible_utility, CLASS)
         api_instance = api_class(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+            utils.get_api_client(self.configuration))
         response = None
         try:
             response = self.get_versioned_response(api_instance, URI)
@@ -46,6 +46,27 @@ options:
     required: False
     type: int
 
+  include:
+    description:
+      Fields of each chassis to return, all of them are returned by default. The subcomponents which are not returned
+      (such as hosts and power_supplies) are not processed either
+    required: False
+    type: list
+    elements: str
+    choices: ['id', 'sn', 'part_number', 'description', 'service_tag', 'psnt', 'model', 'health', 'missing',
+              'render_category', 'generation', 'chassis_manager_fw_version', 'witness', 'bay', 'hosts',
+              'power_supplies']
+
+  exclude:
+    description:
+      Fields of each chassis not to return
+    required: False
+    type: list
+    elements: str
+    choices: ['id', 'sn', 'part_number', 'description', 'service_tag', 'psnt', 'model', 'health', 'missing',
+              'render_category', 'generation', 'chassis_manager_fw_version', 'witness', 'bay', 'hosts',
+              'power_supplies']
+
   timeout:
     description:
       Time out value for getting chassis infomation, the default value is 60 seconds
@@ -64,6 +85,15 @@ EXAMPLES = r'''
         vxmip: "{{ vxmip }}"
         vcadmin: "{{ vcadmin }}"
         vcpasswd: "{{ vcpasswd }}"
+
+  - name: Retrieves The Serial Number And Health Of All VxRail Chassis
+    dellemc_vxrail_chassis_get:
+        vxmip: "{{ vxmip }}"
+        vcadmin: "{{ vcadmin }}"
+        vcpasswd: "{{ vcpasswd }}"
+        include:
+          - sn
+          - health
 '''
 
 RETURN = r'''
@@ -227,7 +257,6 @@ Chassis_Information:
 
         }
 '''
-from functools import reduce
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 from vxrail_ansible_utility.rest import ApiException
 import vxrail_ansible_utility
@@ -239,6 +268,11 @@ LOGGER = utils.get_logger(
     "dellemc_vxrail_chassis", "/tmp/vxrail_ansible_chassis.log", log_devel=logging.DEBUG)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Top level fields of each chassis, which the include and exclude options select
+CHASSIS_FIELDS = ['id', 'sn', 'part_number', 'description', 'service_tag', 'psnt', 'model', 'health', 'missing',
+                  'render_category', 'generation', 'chassis_manager_fw_version', 'witness', 'bay', 'hosts',
+                  'power_supplies']
+
 
 class VxRailChassisUrls():
     cluster_url = 'https://{}/rest/vxm'
@@ -258,6 +292,8 @@ class VxRailHosts():
         self.vc_password = module.params.get('vcpasswd')
         self.chassis_id = module.params.get('chassis_id')
         self.api_version_number = module.params.get('api_version_number')
+        self.include = module.params.get('include')
+        self.exclude = module.params.get('exclude')
         self.hosts_url = VxRailChassisUrls(self.vxm_ip)
         # Configure HTTP basic authorization: basicAuth
         self.configuration = vxrail_ansible_utility.Configuration()
@@ -292,15 +328,15 @@ class VxRailHosts():
 
     def get_chassis(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ChassisInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ChassisInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get all chassis information
             response = self.get_versioned_response(api_instance, 'GET /chassis')
         except ApiException as e:
             LOGGER.error("Exception when calling ChassisInformationApi->%s_chassis_get: %s\n", self.api_version_string, e)
             return 'error'
-        LOGGER.info("Call %s/chassis api response: %s\n", self.api_version_string, response)
+        self._log_response("/chassis", response)
         datalist = response
         if not datalist:
             return "No available hosts"
@@ -308,22 +344,33 @@ class VxRailHosts():
 
     def get_specific_chassis(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ChassisInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ChassisInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get specific chassis information by chassis id
             response = self.get_versioned_response(api_instance, 'GET /chassis/{chassis_id}')
         except ApiException as e:
             LOGGER.error("Exception when calling ChassisInformationApi->%s/chassis/{chassis_id}: %s\n", self.api_version_string, e)
             return 'error'
-        LOGGER.info("Call %s/chassis/{chassis_id} api response: %s\n", self.api_version_string, response)
+        self._log_response("/chassis/{chassis_id}", response)
         data = response
         if not data:
             return "No available host"
         return self._generate_chassis_info(data)
 
+    # The whole response is only logged when all the fields are returned
+    def _log_response(self, path, response):
+        if self.include or self.exclude:
+            LOGGER.info("Call %s%s api returned %s chassis\n", self.api_version_string, path,
+                        len(response) if isinstance(response, list) else int(bool(response)))
+        else:
+            LOGGER.info("Call %s%s api response: %s\n", self.api_version_string, path, response)
+
+    def _selected(self, field):
+        return utils.field_selected(field, self.include, self.exclude)
+
     def _get_info_list(self, generate_func, data_list):
-        return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+        return [generate_func(data) for data in data_list]
 
     def _generate_chassis_info(self, data):
         chassis_info = {}
@@ -342,10 +389,9 @@ class VxRailHosts():
         # Only found in v5+
         if self.api_version_number >= 5:
             chassis_info['chassis_manager_fw_version'] = data.chassis_manager_fw_version
-            if data.witness:
-                chassis_info['witness'] = self._generate_witness_info_from_response_data(data.witness)
-            else:
-                chassis_info['witness'] = None
+            if self._selected('witness'):
+                chassis_info['witness'] = \
+                    self._generate_witness_info_from_response_data(data.witness) if data.witness else None
 
         # Only found in v4+
         if self.api_version_number >= 4:
@@ -353,13 +399,14 @@ class VxRailHosts():
         else:
             chassis_info['bay'] = utils.field_not_found(4)
 
-        if data.hosts is not None:
+        # Subcomponents are only converted when they are returned
+        if data.hosts is not None and self._selected('hosts'):
             chassis_info['hosts'] = self._get_info_list(
                 self._generate_host_info_from_response_data, data.hosts)
-        if data.power_supplies is not None:
+        if data.power_supplies is not None and self._selected('power_supplies'):
             chassis_info['power_supplies'] = self._get_info_list(
                 self._generate_power_supplies_info_from_response_data, data.power_supplies)
-        return chassis_info
+        return utils.select_fields(chassis_info, self.include, self.exclude)
 
     def _generate_host_info_from_response_data(self, data):
         host_info = {}
@@ -538,6 +585,8 @@ def main():
         vcpasswd=dict(required=True, no_log=True),
         chassis_id=dict(type='str', default="all"),
         api_version_number=dict(type='int'),
+        include=dict(type='list', elements='str', choices=CHASSIS_FIELDS),
+        exclude=dict(type='list', elements='str', choices=CHASSIS_FIELDS),
         timeout=dict(type='int', default=60),
     )
     module = AnsibleModule(
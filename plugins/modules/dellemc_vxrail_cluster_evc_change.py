@@ -119,7 +119,7 @@ class VxRailCluster():
         }
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ConfigureTheClusterEVCModeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ConfigureTheClusterEVCModeApi')(utils.get_api_client(self.configuration))
         LOGGER.info(change_cluster_evc_info)
         try:
             response = self.get_versioned_response(api_instance, "POST /cluster/evc", change_cluster_evc_info)
@@ -279,7 +279,7 @@ class VxRailCluster():
     def start_validation(self, validate_json):
         request_body = validate_json
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ClusterExpansionApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ClusterExpansionApi')(utils.get_api_client(self.configuration))
         try:
             # start cluster expansion validation
             response = self.get_versioned_response_validate(api_instance, "Post /cluster/expansion/validate", request_body)
@@ -292,7 +292,7 @@ class VxRailCluster():
     def start_expansion(self, expansion_json):
         request_body = expansion_json
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ClusterExpansionApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ClusterExpansionApi')(utils.get_api_client(self.configuration))
         try:
             # start cluster expansion
             response = self.get_versioned_response_expansion(api_instance, "/cluster/expansion", request_body)
@@ -305,7 +305,7 @@ class VxRailCluster():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(job_id)
         except ApiException as e:
@@ -387,7 +387,7 @@ class VxRailCluster():
     def _create_nicmapping_section(self):
         LOGGER.info('configuration: %s.', self.configuration)
         nic_mappings = []
-        api_instance = vxrail_ansible_utility.HostInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostInformationApi')(utils.get_api_client(self.configuration))
         try:
             # get nic mapping
             response = api_instance.v1_system_cluster_hosts_pnics_get()
@@ -443,7 +443,6 @@ def main():
     validation_result = 0
     expansion_result = 0
     error = 0
-    time_out = 0
     validation_request_id = 0
     expansion_request_id = 0
     initial_timeout = module.params.get('timeout')
@@ -456,15 +455,14 @@ def main():
         module.fail_json(
             msg="validation request id is not returned. Please see the /tmp/vxrail_ansible_cluster_expansion.log for more details")
 
-    while validation_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        validation_response = VxRailCluster().get_request_status(validation_request_id)
-        validation_status = validation_response.state
-        validation_result = VxRailCluster().get_request_info(validation_response)
-        LOGGER.info('Validation_Task: status: %s.', validation_status)
-        LOGGER.info('Validation_Task: details: %s.', validation_result)
-        LOGGER.info("Validation Task: Sleeping 30 seconds...")
-        time.sleep(30)
-        time_out = time_out + 30
+    cluster = VxRailCluster()
+    started_at = time.monotonic()
+    poller = utils.RequestPoller(lambda: cluster.get_request_status(validation_request_id), LOGGER, initial_timeout,
+                                 label='Validation_Task', max_interval=30)
+    validation_response = poller.wait()
+    validation_status = poller.state
+    validation_result = cluster.get_request_info(validation_response)
+    LOGGER.info('Validation_Task: details: %s.', validation_result)
     hosts = eval(validation_result[0].get('extension')).get('hosts')
     error = hosts[0].get('errors')
 
@@ -474,15 +472,14 @@ def main():
         expansion_json = validation_json
         expansion_request_id = VxRailCluster().start_expansion(expansion_json)
         LOGGER.info('Cluster_expansion: VxRail task_ID: %s.', expansion_request_id)
-        while expansion_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-            expansion_response = VxRailCluster().get_request_status(expansion_request_id)
-            expansion_status = expansion_response.state
-            expansion_result = VxRailCluster().get_request_info(expansion_response)
-            LOGGER.info('Expansion_Task: status: %s.', expansion_status)
-            LOGGER.info('Expansion_Task: details: %s.', expansion_result)
-            LOGGER.info("Expansion Task: sleeping 30 seconds...")
-            time.sleep(30)
-            time_out = time_out + 30
+        # Validation and expansion share the module timeout
+        remaining_timeout = initial_timeout - (time.monotonic() - started_at)
+        poller = utils.RequestPoller(lambda: cluster.get_request_status(expansion_request_id), LOGGER,
+                                     remaining_timeout, label='Expansion_Task', max_interval=30)
+        expansion_response = poller.wait()
+        expansion_status = poller.state
+        expansion_result = cluster.get_request_info(expansion_response)
+        LOGGER.info('Expansion_Task: details: %s.', expansion_result)
         if expansion_status == 'COMPLETED':
             LOGGER.info("-----Expansion Completed-----")
         else:
@@ -128,8 +128,8 @@ class VxRailCluster():
 
     def cancel_cluster_expansion(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ClusterExpansionApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ClusterExpansionApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post expansion cancellation
             response = self.get_versioned_response(api_instance, "POST /cluster/expansion/cancel")
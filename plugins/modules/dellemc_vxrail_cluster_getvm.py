@@ -138,7 +138,7 @@ class VxRailCluster():
     def get_cluster_system_virtual_machines(self):
         response = ''
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VirtualMachineInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VirtualMachineInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query cluster system virtual machines information
             response = self.get_versioned_response(api_instance, "GET /cluster/system-virtual-machines")
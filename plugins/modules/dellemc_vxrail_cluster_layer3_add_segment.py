@@ -371,8 +371,8 @@ class VxRailCluster():
     def add_layer3_segment(self):
         response = ''
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.NetworkSegmentManagementApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('NetworkSegmentManagementApi')(
+            utils.get_api_client(self.configuration))
         request_body = self.create_segment_json()
         try:
             # post cluster lay3 segment
@@ -129,8 +129,8 @@ class VxRailCluster():
     def get_layer3_segments(self):
         response = ''
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.NetworkSegmentManagementApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('NetworkSegmentManagementApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get segments list
             response = self.get_versioned_response(api_instance, 'Get /cluster/layer3/segments')
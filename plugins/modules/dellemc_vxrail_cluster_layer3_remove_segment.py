@@ -137,8 +137,8 @@ class VxRailCluster():
     def remove_layer3_segment(self):
         response = ''
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.NetworkSegmentManagementApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('NetworkSegmentManagementApi')(
+            utils.get_api_client(self.configuration))
         try:
             # delete cluster layer3 segment
             response = self.get_versioned_response(api_instance, 'Delete /cluster/layer3/segment/{segment-label}', self.segment_label)
@@ -145,8 +145,8 @@ class VxRailCluster():
     def update_layer3_segment_label(self):
         response = ''
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.NetworkSegmentManagementApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('NetworkSegmentManagementApi')(
+            utils.get_api_client(self.configuration))
         try:
             # patch cluster layer3 segment label
             response = self.get_versioned_response(api_instance, 'Patch /cluster/layer3/segment/{segment-label}', self.new_segment_label_body,
@@ -104,7 +104,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 LOG_FILE_NAME = "/tmp/vxrail_ansible_rmnode.log"
 LOGGER = utils.get_logger("dellemc_vxrail_cluster_rmhost", LOG_FILE_NAME, log_devel=logging.DEBUG)
@@ -174,7 +173,7 @@ class VxRailRemoveHost():
     def remove_host(self, node_json):
         request_body = node_json
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostRemovalApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostRemovalApi')(utils.get_api_client(self.configuration))
         try:
             # start Node Removal
             response = self.get_versioned_response(api_instance, "POST /cluster/remove-host", request_body)
@@ -187,7 +186,7 @@ class VxRailRemoveHost():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(job_id)
         except ApiException as e:
@@ -233,7 +232,6 @@ def main():
     rmnode_status = 0
     rmnode_result = 0
     error = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('----Start to remove node: %s.----', module.params.get('host_sn'))
     removal_json = VxRailRemoveHost().create_removal_json()
@@ -244,15 +242,13 @@ def main():
         module.fail_json(
             msg="remove_node request id is not returned. Please see the /tmp/vxrail_ansible_rmnode.log for more details")
 
-    while rmnode_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        removal_response = VxRailRemoveHost().get_request_status(rmnode_request_id)
-        rmnode_status = removal_response.state
-        rmnode_result = VxRailRemoveHost().get_request_info(removal_response)
-        LOGGER.info('Node_Removal_Task: status: %s.', rmnode_status)
-        LOGGER.info('Node_Removal_Task: details: %s.', rmnode_result)
-        LOGGER.info("Node_Removal_Task: Sleeping 30 seconds...")
-        time.sleep(30)
-        time_out = time_out + 30
+    remove_host = VxRailRemoveHost()
+    poller = utils.RequestPoller(lambda: remove_host.get_request_status(rmnode_request_id), LOGGER, initial_timeout,
+                                 label='Node_Removal_Task', max_interval=30)
+    removal_response = poller.wait()
+    rmnode_status = poller.state
+    rmnode_result = remove_host.get_request_info(removal_response)
+    LOGGER.info('Node_Removal_Task: details: %s.', rmnode_result)
     if rmnode_result[0].get('error') is not None:
         error = eval(rmnode_result[0].get('error')).get('detail')
     if rmnode_status == 'COMPLETED' and not error:
@@ -383,8 +383,8 @@ class VxRailHost():
         for customer_host in self.hosts:
             customer_hosts_info.append(customer_host)
         LOGGER.info("Input Host Information: %s\n", customer_hosts_info)
-        api_instance = vxrail_ansible_utility.VxRailInstallationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VxRailInstallationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get all customer supplied hosts information
             response = self.get_versioned_response(api_instance, 'POST system/initialize/customer-supplied-hosts', customer_hosts_info)
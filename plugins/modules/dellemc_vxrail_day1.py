@@ -115,29 +115,36 @@ class VxRailDay1():
         self.configuration.verify_ssl = False
         self.configuration.host = self.day1_url.set_host()
         self.api_version_string = "v?"
+        # create an instance of the API class, shared by every call to this VxM
+        self.api_instance = utils.api('VxRailInstallationApi')(
+            utils.get_api_client(self.configuration))
+        # Versioned utility methods already resolved for this VxM, keyed by module path
+        self.versioned_calls = {}
 
     # Obtains the response for the given module path with specified api_version_number or highest found version
     def get_versioned_response(self, api_instance, module_path):
-        # Set api version string and version number if not defined
+        # Each module path resolves its own highest version if api_version_number is not defined
         if self.api_version_number is None:
             self.api_version_string = utils.get_highest_api_version_string(self.vxm_ip, module_path, LOGGER)
-            self.api_version_number = int(self.api_version_string.split('v')[1])
         else:
             self.api_version_string = utils.get_api_version_string(self.vxm_ip, self.api_version_number, module_path,
                                                                    LOGGER)
         LOGGER.info("Using api version number: %s\n", self.api_version_string)
         return self.api_version_string
 
+    # Returns the versioned utility method for the given module path, resolving its API version only once
+    def get_versioned_call(self, module_path, call_suffix):
+        if module_path not in self.versioned_calls:
+            call_string = self.get_versioned_response(self.api_instance, module_path) + call_suffix
+            LOGGER.info("Using utility method: %s\n", call_string)
+            self.versioned_calls[module_path] = getattr(self.api_instance, call_string)
+        return self.versioned_calls[module_path]
+
     def start_validation(self, day1_json):
         request_body = day1_json
-        # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VxRailInstallationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
         try:
             # start day1 DryRun validation(ex:v1_system_initialize_post)
-            call_string = self.get_versioned_response(api_instance, '/system/initialize') + '_system_initialize_post'
-            LOGGER.info("Using utility method: %s\n", call_string)
-            api_validation_post = getattr(api_instance, call_string)
+            api_validation_post = self.get_versioned_call('/system/initialize', '_system_initialize_post')
             response = api_validation_post(request_body, dryrun=True)
         except ApiException as e:
             LOGGER.error("Exception when calling VxRailInstallationApi->v1_system_initialize_post?dryrun=True: %s\n", e)
@@ -147,14 +154,9 @@ class VxRailDay1():
 
     def start_initialization(self, day1_json):
         request_body = day1_json
-        # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VxRailInstallationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
         try:
             # start day1 FirstRun(ex:v1_system_initialize_post)
-            call_string = self.get_versioned_response(api_instance, 'Post /system/initialize') + '_system_initialize_post'
-            LOGGER.info("Using utility method: %s\n", call_string)
-            api_initialize_post = getattr(api_instance, call_string)
+            api_initialize_post = self.get_versioned_call('Post /system/initialize', '_system_initialize_post')
             response = api_initialize_post(request_body)
         except ApiException as e:
             LOGGER.error("Exception when calling ClusterInitializeApi->v1_system_initialize_post: %s\n", e)
@@ -163,15 +165,10 @@ class VxRailDay1():
         return job_id
 
     def get_request_status(self):
-        # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VxRailInstallationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
         try:
             # get day1 FirstRun status(ex:v1_system_initialize_status_get)
-            call_string = self.get_versioned_response(api_instance,
-                                                      '/system/initialize/status') + '_system_initialize_status_get'
-            LOGGER.info("Using utility method: %s\n", call_string)
-            api_system_initialize_status_get = getattr(api_instance, call_string)
+            api_system_initialize_status_get = self.get_versioned_call('/system/initialize/status',
+                                                                       '_system_initialize_status_get')
             response = api_system_initialize_status_get()
         except Exception as e:
             LOGGER.error("Exception when calling v1_system_initialize_status_get: %s\n", e)
@@ -234,12 +231,8 @@ def main():
         argument_spec=module_args,
         supports_check_mode=True,
     )
-    validation_status = 0
     installation_status = 0
-    validation_result = 0
-    installation_result = 0
     error = 0
-    time_out = 0
     validation_request_id = 0
     installation_request_id = 0
     initial_timeout = module.params.get('timeout')
@@ -259,71 +252,65 @@ def main():
     if new_vxm_ip:
         LOGGER.info('VxRail Manager IP will change to %s during installation', new_vxm_ip)
 
+    # One handler per VxM IP, so versioned methods are resolved once for the whole deployment
+    day1 = VxRailDay1()
+    new_vxm_ip_day1 = VxRailDay1(new_vxm_ip) if new_vxm_ip else None
+
     LOGGER.info('----Start validation for the Day1 JSON input file...----')
     request_body = config_json
-    validation_request_id = VxRailDay1().start_validation(request_body)
+    validation_request_id = day1.start_validation(request_body)
     LOGGER.info('Day1_DryRun: VxRail task_ID: %s.', validation_request_id)
     if validation_request_id == "error":
         module.fail_json(
             msg="validation request id is not returned. Please see the /tmp/vxrail_ansible_day1.log for more details")
 
-    error_count = 0
-    while validation_status not in (
-            'COMPLETED', 'FAILED') and time_out < initial_timeout and error_count < MAX_ERROR_COUNT:
-        validation_response = VxRailDay1().get_request_status()
-        if validation_response:
-            error_count = 0
-            validation_status = validation_response.state
-            validation_result = VxRailDay1.get_request_info(validation_response)
-            LOGGER.info('Day1_DryRun_Task: status: %s.', validation_status)
-            LOGGER.info('Day1_DryRun_Task: details: %s.', validation_result)
-            LOGGER.info("Day1_DryRun Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        else:
-            error_count += 1
-            LOGGER.info('Fail to get validation status. Count: %s', error_count)
-
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
-
-    errors = validation_response.extension.validation.cursory.errors.fields
-    if len(errors) != 0:
-        error = errors[0].messages
-    else:
-        errors = validation_response.extension.validation.thorough.errors.fields
+    started_at = time.monotonic()
+    poller = utils.RequestPoller(day1.get_request_status, LOGGER, initial_timeout, label='Day1_DryRun_Task',
+                                 max_interval=CHECK_STATUS_INTERVAL, max_errors=MAX_ERROR_COUNT,
+                                 on_change=lambda response: LOGGER.info('Day1_DryRun_Task: details: %s.',
+                                                                        VxRailDay1.get_request_info(response)))
+    validation_response = poller.wait()
+    validation_status = poller.state
+
+    errors = []
+    if hasattr(validation_response, 'extension'):
+        errors = validation_response.extension.validation.cursory.errors.fields
         if len(errors) != 0:
             error = errors[0].messages
+        else:
+            errors = validation_response.extension.validation.thorough.errors.fields
+            if len(errors) != 0:
+                error = errors[0].messages
     if validation_status == 'COMPLETED' and not error:
         LOGGER.info("-------DryRun Completed------")
         LOGGER.info("----Configure and deploy a new VxRail cluster----")
-        installation_request_id = VxRailDay1().start_initialization(request_body)
+        installation_request_id = day1.start_initialization(request_body)
         LOGGER.info('Day1 Initialization: VxRail task_ID: %s.', installation_request_id)
 
         new_vxm_ip_iswork = False
-        error_count = 0
-        while installation_status not in (
-                'COMPLETED', 'FAILED') and time_out < initial_timeout and error_count < MAX_ERROR_COUNT:
+
+        # The status is read from the new VxM IP once the Manager has moved to it, and from the current one until then
+        def get_installation_status():
+            nonlocal new_vxm_ip_iswork
             installation_response = None
             if new_vxm_ip:
-                installation_response = VxRailDay1(new_vxm_ip).get_request_status()
+                installation_response = new_vxm_ip_day1.get_request_status()
                 if installation_response and not new_vxm_ip_iswork:
                     new_vxm_ip_iswork = VxRailDay1.check_new_vxm_ip(installation_response)
                     if new_vxm_ip_iswork:
                         LOGGER.info('VxRail Manager IP has been changed to %s', new_vxm_ip)
             if not installation_response and not new_vxm_ip_iswork:
-                installation_response = VxRailDay1().get_request_status()
-            if installation_response:
-                error_count = 0
-                installation_status = installation_response.state
-                installation_result = VxRailDay1.get_request_info(installation_response)
-                LOGGER.info('Installation_Task: status: %s.', installation_status)
-                LOGGER.info('Installation_Task: details: %s.', installation_result)
-                LOGGER.info("Installation_Task: sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-            else:
-                error_count += 1
-                LOGGER.info('Fail to get installation status. Count: %s', error_count)
-
-            time.sleep(CHECK_STATUS_INTERVAL)
-            time_out = time_out + CHECK_STATUS_INTERVAL
+                installation_response = day1.get_request_status()
+            return installation_response
+
+        # Validation and installation share the module timeout
+        remaining_timeout = initial_timeout - (time.monotonic() - started_at)
+        poller = utils.RequestPoller(get_installation_status, LOGGER, remaining_timeout, label='Installation_Task',
+                                     max_interval=CHECK_STATUS_INTERVAL, max_errors=MAX_ERROR_COUNT,
+                                     on_change=lambda response: LOGGER.info('Installation_Task: details: %s.',
+                                                                            VxRailDay1.get_request_info(response)))
+        poller.wait()
+        installation_status = poller.state
 
         if installation_status == 'COMPLETED':
             LOGGER.info("-----Installation Completed-----")
@@ -52,6 +52,14 @@ options:
     required: True
     type: str    
 
+  resume:
+    description:
+      Whether to resume an interrupted download of the same report to the same file rather than starting over.
+      The partial file is only resumed if it was downloaded with the same parameters and the report did not change since.
+    required: False
+    type: bool
+    default: True
+
   api_version_number:
     description:
       A specific version number to use for the API call. If not included, will use the highest version by default
@@ -91,13 +99,25 @@ message:
   returned: always
   type: str
   sample: '/path/to/output_file downloaded successfully'
+download:
+  description: Returns the size, checksum and transfer rate of the downloaded file
+  returned: success
+  type: dict
+  sample: >-
+        {
+            "path": "/path/to/output_file",
+            "bytes": 10485760,
+            "resumed_from": 0,
+            "sha256": "9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08",
+            "elapsed": 2.315,
+            "throughput": 4529486
+        }
 '''
 
 import logging
 import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
-from vxrail_ansible_utility.rest import ApiException
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -130,6 +150,8 @@ class VxRailCluster():
         self.format = module.params.get('format')
         self.report_id = module.params.get('report_id')
         self.api_version_number = module.params.get('api_version_number')
+        self.output_file_path = module.params.get('output_file_path')
+        self.resume = module.params.get('resume')
         self.system_url = VxrailClusterUrls(self.vxm_ip)
         # Configure HTTP basic authorization: basicAuth
         self.configuration = vxrail_ansible_utility.Configuration()
@@ -170,13 +192,14 @@ class VxRailCluster():
 
     def export_advisor_report(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CVSPublicApi(vxrail_ansible_utility.ApiClient(self.configuration))
-        try:
-            # export compliance report
+        api_instance = utils.api('CVSPublicApi')(utils.get_api_client(self.configuration))
+
+        # the report is streamed to the output file, and resumed if the transfer breaks
+        def export_call():
             return self.get_versioned_response(api_instance, "Get /cvs/report/{key}/{format}")
-        except ApiException as e:
-            LOGGER.error("Exception when calling CVSPublicApi->%s_cvs_report_key_format: %s\n", self.api_version_string, e)
-            return 'error'         
+
+        return utils.FileDownload(api_instance, export_call, self.output_file_path, LOGGER, resume=self.resume,
+                                  key={'vxmip': self.vxm_ip, 'report_id': self.report_id, 'format': self.format}).run()
 
 
 def main():
@@ -190,6 +213,7 @@ def main():
         format=dict(required=False),
         report_id=dict(required=False),
         output_file_path=dict(required=True),
+        resume=dict(type='bool', default=True),
         api_version_number=dict(type='int', required=False),
         timeout=dict(type='int', default=1800)
     )
@@ -199,17 +223,13 @@ def main():
     )
      
     LOGGER.info('----Start to export advisor report: ----')
-    response = VxRailCluster().export_advisor_report()
-    if response == "error":
-        module.fail_json(
-            msg=f"Call {API} API failed, please see log file {LOG_FILE_PATH} for more error details.")
-
-    LOGGER.info(f"Http Result: Status code - {response.status}")
     output_file_path = module.params.get('output_file_path')
     LOGGER.info('Outputfile Path: %s\n', output_file_path)
-    with open(output_file_path, 'wb') as file:
-        file.write(response.data)         
-        module.exit_json(changed=True, message=f'{output_file_path} downloaded successfully')
+    result = VxRailCluster().export_advisor_report()
+    if result == "error":
+        module.fail_json(
+            msg=f"Call {API} API failed, please see log file {LOG_FILE_PATH} for more error details.")
+    module.exit_json(changed=True, message=f'{output_file_path} downloaded successfully', download=result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,340 @@
+#!/usr/bin/python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: dellemc_vxrail_fleet_info
+
+short_description: Retrieve information from many VxRail Manager systems at once
+
+description:
+- This module will retrieve the selected information (system, hosts, chassis, disks...) from a list of VxRail Manager
+  systems. The managers are queried concurrently from a single task, and the information of each manager is returned
+  as it is reported by the highest version of each API, along with the errors of the managers which failed to answer.
+options:
+
+  managers:
+    description:
+      The VxRail Manager systems to query. Each VxRail Manager may only be given once.
+    required: True
+    type: list
+    elements: dict
+    suboptions:
+      vxmip:
+        description: The IP address of the VxRail Manager System
+        required: True
+        type: str
+      vcadmin:
+        description: Administrative account of the vCenter Server, overrides the module level vcadmin
+        required: False
+        type: str
+      vcpasswd:
+        description: The password for the administrator account, overrides the module level vcpasswd
+        required: False
+        type: str
+
+  vcadmin:
+    description:
+      Administrative account of the vCenter Server the VxRail Managers are registered to, used for the managers that
+      do not specify one
+    required: False
+    type: str
+
+  vcpasswd:
+    description:
+      The password for the administrator account provided in vcadmin, used for the managers that do not specify one
+    required: False
+    type: str
+
+  resources:
+    description:
+      The information to retrieve from each VxRail Manager
+    required: False
+    type: list
+    elements: str
+    choices: ['system', 'cluster', 'hosts', 'chassis', 'disks', 'callhome', 'callhome_mode', 'ntp', 'dns', 'proxy',
+              'internet_mode', 'bandwidth_throttling', 'telemetry_tier', 'support_account', 'vc_mode', 'stig']
+    default: ['system']
+
+  max_workers:
+    description:
+      Maximum number of VxRail Managers queried at the same time
+    required: False
+    type: int
+    default: 16
+
+  timeout:
+    description:
+      Time out value for retrieving all the information of one VxRail Manager, including the download of its API
+      schema when it is not cached, the default value is 60 seconds
+    required: false
+    type: int
+    default: 60
+
+  fail_on_error:
+    description:
+      Whether the module fails when any of the VxRail Managers could not be queried
+    required: False
+    type: bool
+    default: False
+
+  timings:
+    description:
+      Whether the timing of each REST call and API schema fetch (VxRail Manager, method, path, API version, status,
+      bytes, latency and retries) is returned in timings
+    required: False
+    type: bool
+    default: False
+
+author:
+    - VxRail Development Team(@VxRailDevTeam) <ansible.team@dell.com>
+
+'''
+
+EXAMPLES = r'''
+  - name: Get the system and hosts information of all VxRail clusters
+    dellemc_vxrail_fleet_info:
+        managers:
+          - vxmip: "{{ vxmip_1 }}"
+          - vxmip: "{{ vxmip_2 }}"
+            vcadmin: "{{ vcadmin_2 }}"
+            vcpasswd: "{{ vcpasswd_2 }}"
+        vcadmin: "{{ vcadmin }}"
+        vcpasswd: "{{ vcpasswd }}"
+        resources:
+          - system
+          - hosts
+        max_workers: 32
+        timeout: "{{ timeout }}"
+'''
+
+RETURN = r'''
+Fleet_Information:
+  description: Information of each VxRail Manager, keyed by its IP address
+  returned: always
+  type: dict
+  sample: >-
+    {
+        "172.16.10.100": {
+            "status": "partial",
+            "elapsed": 3.2,
+            "resources": {
+                "system": {
+                    "description": "A hyperconverged infrastructure appliance ...",
+                    "health": "Healthy",
+                    "version": "7.0.350-27282917"
+                }
+            },
+            "errors": {
+                "stig": "API Version for path GET /stig/info could not be found"
+            }
+        }
+    }
+Failed_Managers:
+  description: IP addresses of the VxRail Managers for which no information could be retrieved
+  returned: always
+  type: list
+  sample: ["172.16.10.101"]
+timings:
+  description: Timing of each REST call and API schema fetch, in the order they were made. Only returned when timings is true.
+  returned: when timings is true
+  type: list
+  sample: >-
+    [
+        {
+            "time": 1760000000.123,
+            "kind": "api",
+            "vxm": "172.16.10.100",
+            "method": "GET",
+            "path": "/v1/requests/{request_id}",
+            "version": "v1",
+            "status": 200,
+            "bytes": 412,
+            "retries": 0,
+            "latency": 0.1834
+        }
+    ]
+'''
+
+import concurrent.futures
+import logging
+import time
+import urllib3
+from ansible.module_utils.basic import AnsibleModule
+import vxrail_ansible_utility
+from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
+
+# Defining global variables
+MODULE = "dellemc_vxrail_fleet_info"
+LOG_FILE_PATH = "/tmp/vxrail_ansible_fleet_info.log"
+
+LOGGER = utils.get_logger(MODULE, LOG_FILE_PATH, log_devel=logging.DEBUG)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# API class, module path and versioned method (with {} for the version string) of each resource,
+# and the method names of the versions which do not follow the format
+RESOURCES = {
+    'system': ('SystemInformationApi', 'GET /system', '{}_query_vx_rail_manager_system_information_get',
+               {'v1': 'v1_query_vx_rail_manager_system_information'}),
+    'cluster': ('ClusterInformationApi', 'GET /cluster', '{}_cluster_get', {}),
+    'hosts': ('HostInformationApi', 'GET /hosts', '{}_hosts_get', {}),
+    'chassis': ('ChassisInformationApi', 'GET /chassis', '{}_chassis_get', {}),
+    'disks': ('DiskInformationApi', 'GET /disks', '{}_disks_get', {}),
+    'callhome': ('CallHomeOperationsApi', 'GET /callhome/info', '{}_callhome_info', {}),
+    'callhome_mode': ('CallHomeModeApi', 'GET /callhome/mode', '{}_callhome_mode_get', {}),
+    'ntp': ('SystemInformationApi', 'GET /system/ntp', '{}_system_ntp_get', {}),
+    'dns': ('SystemInformationApi', 'GET /system/dns', '{}_system_dns_get', {}),
+    'proxy': ('SystemProxySettingsApi', 'GET /system/proxy', '{}_system_proxy_get', {}),
+    'internet_mode': ('SystemNetworkApi', 'GET /system/internet-mode', '{}_system_internet_mode_get', {}),
+    'bandwidth_throttling': ('BandwidthThrottlingInformationApi', 'GET /system/bandwidth-throttling',
+                             'get_{}_system_bandwidth_throttling', {}),
+    'telemetry_tier': ('TelemetryReportingApi', 'GET /telemetry/tier', '{}_query_telemetry_tier_setting_information', {}),
+    'support_account': ('SupportAccountApi', 'GET /support/account', '{}_support_account_get', {}),
+    'vc_mode': ('VCenterServerModeApi', 'GET /vc/mode', '{}_vc_vc_mode_get', {}),
+    'stig': ('STIGInformationApi', 'GET /stig/info', 'get_{}_stig_info', {}),
+}
+
+
+class VxrailSystemUrls():
+    cluster_url = 'https://{}/rest/vxm'
+
+    def __init__(self, vxm_ip):
+        self.vxm_ip = vxm_ip
+
+    def set_host(self):
+        return VxrailSystemUrls.cluster_url.format(self.vxm_ip)
+
+
+class VxRailManagerInfo():
+    def __init__(self, vxm_ip, vc_admin, vc_password, timeout):
+        self.vxm_ip = vxm_ip
+        self.timeout = timeout
+        self.system_url = VxrailSystemUrls(self.vxm_ip)
+        # Configure HTTP basic authorization: basicAuth
+        self.configuration = vxrail_ansible_utility.Configuration()
+        self.configuration.username = vc_admin
+        self.configuration.password = vc_password
+        self.configuration.verify_ssl = False
+        self.configuration.host = self.system_url.set_host()
+        self.api_client = utils.get_api_client(self.configuration)
+
+    # Obtains the response of the highest version of the API of the resource, as parsed from its JSON body.
+    # No request, including the API schema download, may outlast the time left to this manager
+    def get_resource(self, resource, started_at):
+        api_class, module_path, call_format, special_calls = RESOURCES[resource]
+        api_version_string = utils.get_highest_api_version_string(self.vxm_ip, module_path, LOGGER,
+                                                                  timeout=self.remaining(started_at))
+        call_string = special_calls.get(api_version_string, call_format.format(api_version_string))
+        LOGGER.info("%s: using utility method %s->%s\n", self.vxm_ip, api_class, call_string)
+        api_instance = getattr(vxrail_ansible_utility, api_class)(self.api_client)
+        # The timeout is given per call, as the ApiClient is shared by the whole process
+        return utils.call_api_raw(getattr(api_instance, call_string), _request_timeout=self.remaining(started_at))
+
+    # Returns the seconds left to this manager, at least one so a request is never sent without a timeout
+    def remaining(self, started_at):
+        return max(self.timeout - (time.monotonic() - started_at), 1)
+
+    # Retrieves the resources one after the other, until all of them are done or the timeout expires
+    def get_resources(self, resources):
+        started_at = time.monotonic()
+        info = {'resources': {}, 'errors': {}}
+        for resource in resources:
+            if time.monotonic() - started_at >= self.timeout:
+                info['errors'][resource] = "Timed out after {} seconds".format(self.timeout)
+                continue
+            try:
+                info['resources'][resource] = self.get_resource(resource, started_at)
+            except Exception as e:
+                LOGGER.error("%s: exception when retrieving %s: %s\n", self.vxm_ip, resource, e)
+                info['errors'][resource] = str(e)
+        if not info['errors']:
+            info['status'] = 'ok'
+        elif info['resources']:
+            info['status'] = 'partial'
+        else:
+            info['status'] = 'failed'
+        info['elapsed'] = round(time.monotonic() - started_at, 1)
+        LOGGER.info("%s: %s in %s seconds", self.vxm_ip, info['status'], info['elapsed'])
+        return info
+
+
+class VxRailFleet():
+    def __init__(self, managers, resources, max_workers, timeout):
+        self.managers = managers
+        self.resources = resources
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def get_fleet_info(self):
+        fleet_info = {}
+        workers = max(1, min(self.max_workers, len(self.managers)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for manager in self.managers:
+                manager_info = VxRailManagerInfo(manager['vxmip'], manager['vcadmin'], manager['vcpasswd'], self.timeout)
+                futures[manager['vxmip']] = executor.submit(manager_info.get_resources, self.resources)
+            for vxm_ip, future in futures.items():
+                fleet_info[vxm_ip] = future.result()
+        return fleet_info
+
+
+def get_managers():
+    managers = []
+    vxm_ips = set()
+    for item in module.params.get('managers'):
+        manager = dict(item)
+        # The information is returned by vxmip, so each manager may only be given once
+        if manager['vxmip'] in vxm_ips:
+            module.fail_json(msg=f"The VxRail Manager {manager['vxmip']} is given more than once")
+        vxm_ips.add(manager['vxmip'])
+        manager['vcadmin'] = manager.get('vcadmin') or module.params.get('vcadmin')
+        manager['vcpasswd'] = manager.get('vcpasswd') or module.params.get('vcpasswd')
+        if not manager['vcadmin'] or not manager['vcpasswd']:
+            module.fail_json(msg=f"No vCenter credentials are given for the VxRail Manager {manager['vxmip']}")
+        managers.append(manager)
+    return managers
+
+
+def main():
+    ''' Entry point into execution flow '''
+    global module
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        managers=dict(type='list', elements='dict', required=True, options=dict(
+            vxmip=dict(required=True),
+            vcadmin=dict(required=False),
+            vcpasswd=dict(required=False, no_log=True))),
+        vcadmin=dict(required=False),
+        vcpasswd=dict(required=False, no_log=True),
+        resources=dict(type='list', elements='str', choices=list(RESOURCES), default=['system']),
+        max_workers=dict(type='int', default=16),
+        timeout=dict(type='int', default=60),
+        fail_on_error=dict(type='bool', default=False),
+        timings=dict(type='bool', default=False)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    managers = get_managers()
+    resources = module.params.get('resources')
+    LOGGER.info('----Start to retrieve %s from %s VxRail Managers----', resources, len(managers))
+    result = VxRailFleet(managers, resources, module.params.get('max_workers'), module.params.get('timeout')).get_fleet_info()
+    failed_managers = [vxm_ip for vxm_ip, info in result.items() if info['status'] == 'failed']
+    partial_managers = [vxm_ip for vxm_ip, info in result.items() if info['status'] == 'partial']
+    timings = dict(timings=utils.get_timings()) if module.params.get('timings') else {}
+    if module.params.get('fail_on_error') and (failed_managers or partial_managers):
+        module.fail_json(msg=f"Could not retrieve all the information of {', '.join(failed_managers + partial_managers)}, "
+                             f"please see log file {LOG_FILE_PATH} for more error details.",
+                         Fleet_Information=result, Failed_Managers=failed_managers, **timings)
+    vx_facts_result = dict(changed=False, Fleet_Information=result, Failed_Managers=failed_managers, **timings)
+    module.exit_json(**vx_facts_result)
+
+
+if __name__ == "__main__":
+    main()
@@ -126,7 +126,6 @@ Disks_Info:
     ]
 '''
 
-from functools import reduce
 import logging
 import urllib3
 from ansible.module_utils.basic import AnsibleModule
@@ -192,7 +191,7 @@ class VxRailCluster():
 
     def get_disks(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.DiskInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('DiskInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query disk information
             response = self.get_versioned_response(api_instance, "/disks")
@@ -205,7 +204,7 @@ class VxRailCluster():
 
     def get_specific_disk(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.DiskInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('DiskInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query disk information
             response = self.get_versioned_response(api_instance, "/disks/{disk_sn}")
@@ -217,7 +216,7 @@ class VxRailCluster():
         return self._generate_disks_info(data)
 
     def _get_disks_list(self, generate_func, data_list):
-        return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+        return [generate_func(data) for data in data_list]
 
     def _generate_disks_info(self, data):
         disks_info = {}
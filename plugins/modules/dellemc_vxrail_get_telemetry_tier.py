@@ -128,7 +128,7 @@ class VxRailCluster():
     def get_telemetry_tier(self):
         telem_info = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.TelemetryReportingApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('TelemetryReportingApi')(utils.get_api_client(self.configuration))
         try:
             # query telemetry information
             response = self.get_versioned_response(api_instance, "GET /telemetry/tier")
@@ -173,7 +173,7 @@ class VxRailCluster():
         clusterInfos = {}
         clusterInfolist = []
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ClusterInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ClusterInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query cluster information
             response = self.get_versioned_response(api_instance, "GET /cluster")
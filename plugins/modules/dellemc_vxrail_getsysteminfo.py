@@ -194,7 +194,7 @@ class VxRailSystem():
         systemInfos = {}
         systemInfolist = []
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query system information
             response = self.get_versioned_response(api_instance, "GET /system")
@@ -118,14 +118,13 @@ upgrade_status:
 
 import traceback
 import logging
-import time
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 
 try:
     import urllib3
+    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     import vxrail_ansible_utility
     from vxrail_ansible_utility.rest import ApiException
-    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     LOGGER = utils.get_logger("dellemc_vxrail_host_folder_upgrade", "/tmp/vxrail_ansible_host_folder_upgrade.log",
                               log_devel=logging.DEBUG)
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -203,8 +202,8 @@ class VxRailHostFolder():
             request_body['control']['concurrent_size'] = self.concurrent_size
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostFolderLCMApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostFolderLCMApi')(
+            utils.get_api_client(self.configuration))
         try:
             # start host-folder upgrade
             response = self.start_versioned_upgrade(api_instance, "Post /lcm/host-folder/upgrade", request_body)
@@ -215,7 +214,7 @@ class VxRailHostFolder():
 
     def get_request_status(self, request_id):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(request_id)
             if isinstance(response, dict):
@@ -292,20 +291,16 @@ def main():
     LOGGER.info('host_folder_upgrade: VxRail task_ID: %s.', request_id)
 
     initial_timeout = module.params.get('timeout')
-    time_out = 0
-    upgrade_status = 0
-    while upgrade_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        upgrade_response = VxRailHostFolder().get_request_status(request_id)
-        if upgrade_response == 'error':
-            module.fail_json(
-                msg="Failed to get the request status. Please see the /tmp/vxrail_ansible_host_folder_upgrade.log for more details")
-        upgrade_status = upgrade_response.state
-        upgrade_result = VxRailHostFolder().get_request_info(upgrade_response)
-        LOGGER.info('Upgrade_Task: status: %s.', upgrade_status)
-        LOGGER.info('Upgrade_Task: details: %s.', upgrade_result)
-        LOGGER.info('Upgrade Task: sleeping %s seconds...', TIME_SLEEP)
-        time.sleep(TIME_SLEEP)
-        time_out += TIME_SLEEP
+    host_folder = VxRailHostFolder()
+    poller = utils.RequestPoller(lambda: host_folder.get_request_status(request_id), LOGGER, initial_timeout,
+                                 label='Upgrade_Task', max_interval=TIME_SLEEP, max_errors=1)
+    upgrade_response = poller.wait()
+    if poller.errors:
+        module.fail_json(
+            msg="Failed to get the request status. Please see the /tmp/vxrail_ansible_host_folder_upgrade.log for more details")
+    upgrade_status = poller.state
+    upgrade_result = host_folder.get_request_info(upgrade_response)
+    LOGGER.info('Upgrade_Task: details: %s.', upgrade_result)
 
     if upgrade_status != 'COMPLETED':
         LOGGER.info("------Upgrade Failed-----")
@@ -102,7 +102,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -164,7 +163,7 @@ class VxRailCluster():
 
     def post_host_shutdown(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostInformationApi')(utils.get_api_client(self.configuration))
         try:
             # start host shutdown
             response = self.get_versioned_response(api_instance, "POST /hosts/{sn}/shutdown")
@@ -206,7 +205,6 @@ def main():
     LOGGER.info('Host Shutdown dryrun: %s.', dryrun)
     LOGGER.info('Evacuate Poweredoff VMs: %s.', evac_off_vms)
     task_state = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('Timeout setting: %s seconds.', initial_timeout)
     # Check call to v1/requests/{request_id}
@@ -216,14 +214,12 @@ def main():
                              "log file /tmp/vxrail_ansible_host_shutdown.log for more error details.")
     else:
         LOGGER.info('No issues found in call to v1/requests/request_id API. Begin checking status of host shutdown operation.')
-    while task_state not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        result_response = utils.get_request_status(vxm_ip=vxmip, vcadmin=vcadmin, vcpasswd=vcpasswd, logger=LOGGER, request_id=result_request_id)
-        task_state = result_response.state
-        LOGGER.info('Request_status: %s', task_state)
-        ''' call frequently to capture 'COMPLETED' status before host shut down'''
-        time_out = time_out + 1
-        time.sleep(1)
-    error_message = result_response.error
+    # Poll every second to capture the 'COMPLETED' status before the host shuts down
+    poller = utils.wait_for_request(vxmip, vcadmin, vcpasswd, result_request_id, LOGGER, initial_timeout,
+                                    label='Host_Shutdown_Task', min_interval=1, max_interval=1, max_errors=10)
+    result_response = poller.response
+    task_state = poller.state
+    error_message = utils.response_field(result_response, 'error')
     if task_state == 'COMPLETED' and not error_message:
         vx_facts = {'Request_ID': result_request_id, 'Request_Status': task_state}
         if dryrun:
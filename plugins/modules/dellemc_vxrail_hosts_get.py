@@ -45,6 +45,29 @@ options:
     required: False
     type: int
 
+  include:
+    description:
+      Fields of each host to return, all of them are returned by default. The subcomponents which are not returned
+      (such as disks and nics) are not processed either
+    required: False
+    type: list
+    elements: str
+    choices: ['id', 'sn', 'slot', 'hostname', 'name', 'manufacturer', 'psnt', 'led_status', 'led_color', 'health',
+              'missing', 'tpm_present', 'operational_status', 'power_status', 'dpus', 'part_number', 'gpus',
+              'tpm_version', 'tpm_status', 'type', 'boot_devices', 'nics', 'disks', 'firmware_info',
+              'encryption_status', 'drive_configuration', 'geo_location']
+
+  exclude:
+    description:
+      Fields of each host not to return
+    required: False
+    type: list
+    elements: str
+    choices: ['id', 'sn', 'slot', 'hostname', 'name', 'manufacturer', 'psnt', 'led_status', 'led_color', 'health',
+              'missing', 'tpm_present', 'operational_status', 'power_status', 'dpus', 'part_number', 'gpus',
+              'tpm_version', 'tpm_status', 'type', 'boot_devices', 'nics', 'disks', 'firmware_info',
+              'encryption_status', 'drive_configuration', 'geo_location']
+
   timeout:
     description:
       Time out value for getting system infomation, the default value is 60 seconds
@@ -63,6 +86,15 @@ EXAMPLES = r'''
         vxmip: "{{ vxmip }}"
         vcadmin: "{{ vcadmin }}"
         vcpasswd: "{{ vcpasswd }}"
+
+  - name: Retrieves The Serial Number And Health Of All VxRail Hosts
+    dellemc_vxrail_hosts_get:
+        vxmip: "{{ vxmip }}"
+        vcadmin: "{{ vcadmin }}"
+        vcpasswd: "{{ vcpasswd }}"
+        include:
+          - sn
+          - health
 '''
 
 RETURN = r'''
@@ -271,7 +303,6 @@ Hosts_Information:
                 "tpm_present": false
         }
 '''
-from functools import reduce
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 from vxrail_ansible_utility.rest import ApiException
 import vxrail_ansible_utility
@@ -283,6 +314,12 @@ LOGGER = utils.get_logger(
     "dellemc_vxrail_hosts", "/tmp/vxrail_ansible_hosts.log", log_devel=logging.DEBUG)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Top level fields of each host, which the include and exclude options select
+HOST_FIELDS = ['id', 'sn', 'slot', 'hostname', 'name', 'manufacturer', 'psnt', 'led_status', 'led_color', 'health',
+               'missing', 'tpm_present', 'operational_status', 'power_status', 'dpus', 'part_number', 'gpus',
+               'tpm_version', 'tpm_status', 'type', 'boot_devices', 'nics', 'disks', 'firmware_info',
+               'encryption_status', 'drive_configuration', 'geo_location']
+
 
 class VxRailHostsUrls():
     cluster_url = 'https://{}/rest/vxm'
@@ -302,6 +339,8 @@ class VxRailHosts():
         self.vc_password = module.params.get('vcpasswd')
         self.host_sn = module.params.get('host_sn')
         self.api_version_number = module.params.get('api_version_number')
+        self.include = module.params.get('include')
+        self.exclude = module.params.get('exclude')
         self.hosts_url = VxRailHostsUrls(self.vxm_ip)
         # Configure HTTP basic authorization: basicAuth
         self.configuration = vxrail_ansible_utility.Configuration()
@@ -334,15 +373,15 @@ class VxRailHosts():
 
     def get_hosts(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get all hosts information
             response = self.get_versioned_response(api_instance, "Get /hosts")
         except ApiException as e:
             LOGGER.error("Exception when calling HostInformationApi->%s_hosts_get: %s\n", self.api_version_string, e)
             return 'error'
-        LOGGER.info("Call %s/hosts api response: %s\n", self.api_version_string, response)
+        self._log_response("/hosts", response)
         datalist = response
         if not datalist:
             return "No available hosts"
@@ -350,22 +389,33 @@ class VxRailHosts():
 
     def get_specific_hosts(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get specific host information by sn
             response = self.get_versioned_response(api_instance, "GET /hosts/{sn}")
         except ApiException as e:
             LOGGER.error("Exception when calling HostInformationApi->%s_hosts_sn_get: %s\n", self.api_version_string, e)
             return 'error'
-        LOGGER.info("Call %s/hosts/{sn} api response: %s\n", self.api_version_string, response)
+        self._log_response("/hosts/{sn}", response)
         data = response
         if not data:
             return "No available host"
         return self._generate_host_info_from_response_data(data)
 
+    # The whole response is only logged when all the fields are returned
+    def _log_response(self, path, response):
+        if self.include or self.exclude:
+            LOGGER.info("Call %s%s api returned %s host(s)\n", self.api_version_string, path,
+                        len(response) if isinstance(response, list) else int(bool(response)))
+        else:
+            LOGGER.info("Call %s%s api response: %s\n", self.api_version_string, path, response)
+
+    def _selected(self, field):
+        return utils.field_selected(field, self.include, self.exclude)
+
     def _get_info_list(self, generate_func, data_list):
-        return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+        return [generate_func(data) for data in data_list]
 
     def _generate_host_info_from_response_data(self, data):
         host_info = {}
@@ -384,16 +434,16 @@ class VxRailHosts():
         host_info['operational_status'] = data.operational_status
         host_info['power_status'] = data.power_status
 
-        host_info['dpus'] = \
-            self._get_info_list(self._generate_dpu_info_from_response_data, data.dpus) \
-            if hasattr(data, 'dpus') else []
+        if self._selected('dpus'):
+            host_info['dpus'] = \
+                self._get_info_list(self._generate_dpu_info_from_response_data, data.dpus) \
+                if hasattr(data, 'dpus') else []
 
         if self.api_version_number >= 10:
             host_info['part_number'] = data.part_number
-            if data.gpus:
-                host_info['gpus'] = self._get_info_list(self._generate_gpu_info_from_response_data, data.gpus)
-            else:
-                host_info['gpus'] = []
+            if self._selected('gpus'):
+                host_info['gpus'] = \
+                    self._get_info_list(self._generate_gpu_info_from_response_data, data.gpus) if data.gpus else []
 
         host_info['tpm_version'] = data.tpm_version if hasattr(data, 'tpm_version') else utils.field_not_found(14)
         host_info['tpm_status'] = data.tpm_status if hasattr(data, 'tpm_status') else utils.field_not_found(14)
@@ -404,22 +454,23 @@ class VxRailHosts():
         else:
             host_info['type'] = utils.field_not_found(5)
 
-        if data.boot_devices is not None:
+        # Subcomponents are only converted when they are returned
+        if data.boot_devices is not None and self._selected('boot_devices'):
             host_info['boot_devices'] = self._get_info_list(
                 self._generate_boot_device_info_from_response_data, data.boot_devices)
-        if data.nics is not None:
+        if data.nics is not None and self._selected('nics'):
             host_info['nics'] = self._get_info_list(
                 self._generate_nic_info_from_response_data, data.nics)
-        if data.disks is not None:
+        if data.disks is not None and self._selected('disks'):
             host_info['disks'] = self._get_info_list(
                 self._generate_disk_info_from_response_data, data.disks)
-        if data.firmware_info is not None:
+        if data.firmware_info is not None and self._selected('firmware_info'):
             host_info['firmware_info'] = self._generate_firmware_info_from_response_data(
                 data.firmware_info)
 
         # Only found in v7+
         if self.api_version_number >= 7:
-            if data.encryption_status is not None:
+            if data.encryption_status is not None and self._selected('encryption_status'):
                 host_info['encryption_status'] = self._generate_encryption_status_info_from_response_data(
                     data.encryption_status)
         else:
@@ -427,7 +478,7 @@ class VxRailHosts():
 
         # Only found in v4+
         if self.api_version_number >= 4:
-            if data.drive_configuration is not None:
+            if data.drive_configuration is not None and self._selected('drive_configuration'):
                 host_info['drive_configuration'] = self._generate_drive_configuration_info_from_response_data(
                     data.drive_configuration)
         else:
@@ -435,13 +486,13 @@ class VxRailHosts():
 
         # Only found in v2+
         if self.api_version_number >= 2:
-            if data.geo_location is not None:
+            if data.geo_location is not None and self._selected('geo_location'):
                 host_info['geo_location'] = self._generate_geo_location_info_from_response_data(
                     data.geo_location)
         else:
             host_info['geo_location'] = utils.field_not_found(2)
 
-        return host_info
+        return utils.select_fields(host_info, self.include, self.exclude)
 
     def _generate_boot_device_info_from_response_data(self, data):
         boot_device_info = {}
@@ -682,6 +733,8 @@ def main():
         vcpasswd=dict(required=True, no_log=True),
         host_sn=dict(type='str', default="all"),
         api_version_number=dict(type='int'),
+        include=dict(type='list', elements='str', choices=HOST_FIELDS),
+        exclude=dict(type='list', elements='str', choices=HOST_FIELDS),
         timeout=dict(type='int', default=60),
     )
     module = AnsibleModule(
@@ -147,7 +147,7 @@ class VxRailCluster():
 
     def get_idrac_id(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostIDRACConfigurationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostIDRACConfigurationApi')(utils.get_api_client(self.configuration))
         try:
             # Get iDRAC available user slot IDs
             response = self.get_versioned_response(api_instance, "GET /hosts/{sn}/idrac/available-user-ids")
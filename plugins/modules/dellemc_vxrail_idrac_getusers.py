@@ -146,7 +146,7 @@ class VxRailCluster():
     def get_idrac_users(self):
         # create an instance of the API class
         response = ''
-        api_instance = vxrail_ansible_utility.HostIDRACConfigurationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostIDRACConfigurationApi')(utils.get_api_client(self.configuration))
         try:
             # query host idrac users information
             response = self.get_versioned_response(api_instance, "GET /hosts/{sn}/idrac/users")
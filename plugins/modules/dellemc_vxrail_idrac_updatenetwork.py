@@ -156,7 +156,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -266,7 +265,7 @@ class VxRailCluster():
 
     def update_network(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.HostIDRACConfigurationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('HostIDRACConfigurationApi')(utils.get_api_client(self.configuration))
         try:
             # Update iDRAC network settings
             response = self.get_versioned_response(api_instance, "PATCH /hosts/{sn}/idrac/network")
@@ -321,17 +320,13 @@ def main():
     vcadmin = module.params.get('vcadmin')
     vcpasswd = module.params.get('vcpasswd')
     task_state = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('Timeout setting: %s seconds.', initial_timeout)
-    while task_state not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        result_response = utils.get_request_status(vxm_ip=vxmip, vcadmin=vcadmin, vcpasswd=vcpasswd, logger=LOGGER, request_id=result_request_id)
-        task_state = result_response.state
-        LOGGER.info('Request_status: %s', task_state)
-        ''' call frequently to capture 'COMPLETED' status'''
-        time_out = time_out + 30
-        time.sleep(30)
-    error_message = result_response.error
+    poller = utils.wait_for_request(vxmip, vcadmin, vcpasswd, result_request_id, LOGGER, initial_timeout,
+                                    label='iDRAC_Update_Network_Task', min_interval=5, max_interval=30)
+    result_response = poller.response
+    task_state = poller.state
+    error_message = utils.response_field(result_response, 'error')
     if task_state == 'COMPLETED' and not error_message:
         vx_facts = {'Request_ID': result_request_id, 'Request_Status': task_state}
         LOGGER.info("iDRAC network settings updated")
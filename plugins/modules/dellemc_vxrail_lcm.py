@@ -285,7 +285,13 @@ LCM_status:
    {
     "LCM_API_Upgrade": {
         "request_id": "2ce09bde-d987-4fff-8f90-6fc430e2bfc3",
-        "status": "COMPLETED"
+        "status": "COMPLETED",
+        "events": [
+            {"state": "IN_PROGRESS", "step": "Preparing", "progress": 5, "elapsed": 0.4},
+            {"event": "manager_unreachable", "elapsed": 1503.2},
+            {"event": "manager_back", "outage": 241.7, "elapsed": 1744.9},
+            {"state": "COMPLETED", "step": "Completed", "progress": 100, "elapsed": 7210.3}
+        ]
     }
     "msg": "LCM is successful. Please see the /tmp/vxrail_ansible_lcm.log for more details"
    }
@@ -296,7 +302,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 LOG_FILE_NAME = "/tmp/vxrail_ansible_lcm.log"
@@ -304,6 +309,8 @@ LOGGER = utils.get_logger("dellemc_vxrail_lcm", LOG_FILE_NAME, log_devel=logging
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 MAX_RETRY_COUNT = 8
 CHECK_STATUS_INTERVAL = 360
+MIN_CHECK_STATUS_INTERVAL = 30
+STATUS_REQUEST_TIMEOUT = 60
 MAX_CHECK_COUNT = 60
 
 
@@ -324,40 +331,6 @@ class VxRailLCM():
         self.timeout = module.params.get('timeout')
         self.vc_admin = module.params.get('vcadmin')
         self.vc_password = module.params.get('vcpasswd')
-        self.vc_root_account = module.params.get('vc_root_account')
-        self.vc_root_passwd = module.params.get('vc_root_passwd')
-        self.vc_mgmt_account = module.params.get('vc_mgmt_account')
-        self.vc_mgmt_passwd = module.params.get('vc_mgmt_passwd')
-        self.vxm_root_account = module.params.get('vxm_root_account')
-        self.vxm_root_passwd = module.params.get('vxm_root_passwd')
-        self.psc_root_account = module.params.get('psc_root_account')
-        self.psc_root_passwd = module.params.get('psc_root_passwd')
-        self.source_vcsa_host_name = module.params.get('source_vcsa_host_name')
-        self.source_vcsa_host_user_name = module.params.get('source_vcsa_host_user_name')
-        self.source_vcsa_host_user_passwd = module.params.get('source_vcsa_host_user_passwd')
-        self.source_psc_host_name = module.params.get('source_psc_host_name')
-        self.source_psc_host_user_name = module.params.get('source_psc_host_user_name')
-        self.source_psc_host_user_passwd = module.params.get('source_psc_host_user_passwd')
-        self.target_vcsa_host_name = module.params.get('target_vcsa_host_name')
-        self.target_vcsa_host_user_name = module.params.get('target_vcsa_host_user_name')
-        self.target_vcsa_host_user_passwd = module.params.get('target_vcsa_host_user_passwd')
-        self.temporary_ip = module.params.get('temporary_ip')
-        self.temporary_gateway = module.params.get('temporary_gateway')
-        self.temporary_netmask = module.params.get('temporary_netmask')
-        self.witness_username = module.params.get('witness_username')
-        self.witness_password = module.params.get('witness_password')
-        self.auto_witness_upgrade = module.params.get('auto_witness_upgrade')
-        self.preferred_fault_domain_first = module.params.get('preferred_fault_domain_first')
-        self.target_hosts_name = module.params.get('target_hosts_name')
-        self.missing_file_check = module.params.get('missing_file_check')
-        self.skip_failed_hosts = module.params.get('skip_failed_hosts')
-        self.ecosystem_check_continue_with_incompatible = module.params.get('ecosystem_check_continue_with_incompatible')
-        self.ecosystem_check_components = module.params.get('ecosystem_check_components')
-        self.enable_quick_boot = module.params.get('enable_quick_boot')
-        self.parallel_remediation_enable = module.params.get('parallel_remediation_enable')
-        self.parallel_remediation_max = module.params.get('parallel_remediation_max')
-        self.enforce_quick_patch = module.params.get('enforce_quick_patch')
-        self.retry_as_standard = module.params.get('retry_as_standard')
         self.vxm_url = VxrailVXMUrls(self.vxm_ip)
         self.api_version_number = module.params.get('api_version_number')
         # Configure HTTP basic authorization: basicAuth
@@ -369,121 +342,12 @@ class VxRailLCM():
 
     def create_lcm_json(self):
         ''' lcm node json '''
-        lcm_json = {}
-        lcm_json['bundle_file_locator'] = self.bundle
-        vcenter_dict = {}
-        vcenter_dict['vc_admin_user'] = {'username': self.vc_admin, 'password': self.vc_password}
-        vcenter_dict['vcsa_root_user'] = {'username': self.vc_root_account, 'password': self.vc_root_passwd}
-
-        vxrail_dict = {}
-        vxrail_dict['vxm_root_user'] = {'username': self.vxm_root_account, 'password': self.vxm_root_passwd}
-        lcm_json['vxrail'] = vxrail_dict
-
-        if self.psc_root_passwd and self.api_version_number <= 2:
-            vcenter_dict['psc_root_user'] = {'username': self.psc_root_account, 'password': self.psc_root_passwd}
-
-        migration_spec_dict = {}
-        if self.source_vcsa_host_name:
-            source_vcsa_host_dict = {}
-            source_vcsa_host_dict['name'] = self.source_vcsa_host_name
-            source_vcsa_host_dict['user'] = {'username': self.source_vcsa_host_user_name,
-                                             'password': self.source_vcsa_host_user_passwd}
-            migration_spec_dict['source_vcsa_host'] = source_vcsa_host_dict
-        if self.source_psc_host_name and self.api_version_number <= 2:
-            source_psc_host_dict = {}
-            source_psc_host_dict['name'] = self.source_psc_host_name
-            source_psc_host_dict['user'] = {'username': self.source_psc_host_user_name,
-                                            'password': self.source_psc_host_user_passwd}
-            migration_spec_dict['source_psc_host'] = source_psc_host_dict
-        if self.target_vcsa_host_name:
-            target_vcsa_host_dict = {}
-            target_vcsa_host_dict['name'] = self.target_vcsa_host_name
-            target_vcsa_host_dict['user'] = {'username': self.target_vcsa_host_user_name,
-                                             'password': self.target_vcsa_host_user_passwd}
-            migration_spec_dict['target_vcsa_host'] = target_vcsa_host_dict
-        if self.temporary_ip:
-            migration_spec_dict['temporary_ip_setting'] = {'temporary_ip': self.temporary_ip,
-                                                           'gateway': self.temporary_gateway,
-                                                           'netmask': self.temporary_netmask}
-        if any(migration_spec_dict):
-            vcenter_dict['migration_spec'] = migration_spec_dict
-        lcm_json['vcenter'] = vcenter_dict
-
-        if self.api_version_number >= 2:
-            if self.witness_username:
-                witness_dict = {}
-                witness_user_dict = {'username': self.witness_username,
-                                     'password': self.witness_password}
-                witness_dict['witness_user'] = witness_user_dict
-                witness_dict['auto_witness_upgrade'] = self.auto_witness_upgrade
-                lcm_json['witness'] = witness_dict
-
-            if self.preferred_fault_domain_first:
-                lcm_json['upgrade_sequence'] = {'preferred_fault_domain_first': self.preferred_fault_domain_first}
-
-        if self.api_version_number >= 4:
-            if self.target_hosts_name != "all":
-                target_hosts_list = []
-                if len(self.target_hosts_name.split(",")) != 0:
-                    for item in self.target_hosts_name.split(","):
-                        target_hosts_list.append({'name': item})
-                else:
-                    target_hosts_list = [{'name': self.target_hosts_name}]
-                lcm_json['target_hosts'] = target_hosts_list
-
-        if self.api_version_number >= 5:
-            update_rules = {}
-            ecosystem_check = {}
-
-            if self.missing_file_check is not None:
-                update_rules['missing_file_check'] = self.missing_file_check
-
-            if self.skip_failed_hosts is not None:
-                update_rules['skip_failed_hosts'] = self.skip_failed_hosts
-
-            if self.ecosystem_check_components:
-                components = self.ecosystem_check_components.split(",")
-                ecosystem_check['components'] = components
-                ecosystem_check['continue_with_incompatible'] = self.ecosystem_check_continue_with_incompatible
-
-            update_rules['ecosystem_check'] = ecosystem_check
-            lcm_json['update_rules'] = update_rules
-
-        # for api v6
-        if hasattr(self, 'vc_mgmt_account') and hasattr(self, 'vc_mgmt_passwd'):
-            vcenter_dict['vc_mgmt_user'] = {'username': self.vc_mgmt_account, 'password': self.vc_mgmt_passwd}
-        else:
-            vcenter_dict['vc_mgmt_user'] = utils.field_not_found(6)
-        
-        # for api v8
-        if self.api_version_number >= 8:
-            vlcm_parameters = {}
-            parallel_remediation = {}
-            enforce_quick_patch = {}
-
-            if self.enable_quick_boot is not None:
-                vlcm_parameters['enable_quick_boot'] = self.enable_quick_boot
-
-            if self.parallel_remediation_enable is not None:
-                parallel_remediation['enabled'] = self.parallel_remediation_enable
-                parallel_remediation['max_hosts'] = self.parallel_remediation_max
-                vlcm_parameters['parallel_remediation_action'] = parallel_remediation
-
-            if self.enforce_quick_patch is not None:
-                enforce_quick_patch['enabled'] = self.enforce_quick_patch
-                
-            if self.retry_as_standard is not None:
-                enforce_quick_patch['retry_as_standard'] = self.retry_as_standard
-            vlcm_parameters['enforce_quick_patch'] = enforce_quick_patch
-
-            lcm_json['vlcm_parameters'] = vlcm_parameters
-
-        return lcm_json
+        return utils.create_lcm_json(module.params, self.api_version_number)
 
     def upgrade(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.LCMUpgradeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('LCMUpgradeApi')(utils.get_api_client(self.configuration))
             # start LCM with versioned api
             api_version_string = self.get_versioned_response('Post /lcm/upgrade')
             call_string = 'upgrade_' + api_version_string
@@ -513,9 +377,9 @@ class VxRailLCM():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
-            response = api_instance.v1_request_id_get(job_id)
+            response = api_instance.v1_request_id_get(job_id, _request_timeout=STATUS_REQUEST_TIMEOUT)
         except Exception as e:
             LOGGER.error("Exception when calling v1_requests_id_get: %s\n", e)
             return 'error'
@@ -602,46 +466,36 @@ def main():
         supports_check_mode=True,
     )
 
-    lcm_status = 0
-    lcm_result = 0
     error = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
-    try_times = 0
 
     LOGGER.info('----Start to upgrade with LCM API: ----')
-    lcm_request_id = VxRailLCM().upgrade()
+    lcm = VxRailLCM()
+    lcm_request_id = lcm.upgrade()
 
     LOGGER.info('LCM: VxRail task_ID: %s.', lcm_request_id)
     if lcm_request_id == "error":
         module.fail_json(
             msg="lcm request id is not returned. Please see the /tmp/vxrail_ansible_lcm.log for more details")
-    while lcm_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        lcm_response = VxRailLCM().get_request_status(lcm_request_id)
-        ''' When VxRail Manager upgrade or Reboot is in progress. Temporary disconnection during this process,
-        meed to send request with auth again'''
-        while lcm_response == "error" and try_times < MAX_RETRY_COUNT:
-            LOGGER.info('----VxRail Manager upgrade or Reboot is in progress, which may be temporary '
-                        'disconnection during this process ----')
-            LOGGER.info('----Please wait for its back...Need to log in again----')
-            time.sleep(15 * 60)
-            lcm_response = VxRailLCM().get_request_status(lcm_request_id)
-            try_times = try_times + 1
-        if try_times == MAX_RETRY_COUNT:
-            LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
-            vx_lcm = {'request_id': lcm_request_id}
-            vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
-                                   msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
-            module.exit_json(**vx_facts_result)
-        lcm_status = lcm_response.state
-        lcm_result = VxRailLCM().get_request_info(lcm_response)
-        LOGGER.info('LCM_Task: status: %s.', lcm_status)
-        LOGGER.info('LCM_Task: details: %s.', lcm_result)
-        LOGGER.info("LCM_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    # The VxRail Manager is upgraded and rebooted during the LCM, the status calls fail until it is back
+    poller = utils.LCMPoller(lambda: lcm.get_request_status(lcm_request_id), module.params.get('vxmip'), LOGGER,
+                             initial_timeout, outage_timeout=MAX_RETRY_COUNT * 15 * 60, label='LCM_Task',
+                             min_interval=MIN_CHECK_STATUS_INTERVAL, max_interval=CHECK_STATUS_INTERVAL)
+    lcm_response = poller.wait()
+    if poller.outage_failed:
+        LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
+        vx_lcm = {'request_id': lcm_request_id, 'events': poller.events}
+        vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
+                               msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
+        module.exit_json(**vx_facts_result)
+    lcm_status = poller.state
+    lcm_result = lcm.get_request_info(lcm_response) if lcm_response is not None else [{}]
+    LOGGER.info('LCM_Task: details: %s.', lcm_result)
     if lcm_status == 'COMPLETED':
         LOGGER.info("-------LCM is successful.-----")
+        # The upgraded VxRail Manager serves a new API schema, and its earlier prechecks no longer hold
+        utils.invalidate_api_schema_cache(module.params.get('vxmip'), LOGGER)
+        utils.invalidate_precheck_cache(module.params.get('vxmip'), LOGGER)
     else:
         LOGGER.info("------LCM Failed-----")
         if lcm_result[0].get('error') is not None:
@@ -649,11 +503,11 @@ def main():
         else:
             error = lcm_result[0].get('detail')
         LOGGER.info('----Failed reason is : %s.----', error)
-        vx_lcm = {'request_id': lcm_request_id, 'response_error': error}
+        vx_lcm = {'request_id': lcm_request_id, 'response_error': error, 'events': poller.events}
         vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
                                msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
         module.exit_json(**vx_facts_result)
-    vx_lcm = {'status': lcm_status, 'request_id': lcm_request_id}
+    vx_lcm = {'status': lcm_status, 'request_id': lcm_request_id, 'events': poller.events}
     vx_facts_result = dict(changed=True, LCM_API_Upgrade=vx_lcm,
                            msg="LCM is successful. Please see the /tmp/vxrail_ansible_lcm.log for more details")
     module.exit_json(**vx_facts_result)
@@ -71,12 +71,19 @@ EXAMPLES = r'''
 
 RETURN = r'''
 Advisory_Meta_Bundle_API:
-  description: Upload advisory meta bundle.
+  description: Upload advisory meta bundle, with the size, SHA512 checksum and transfer rate of the upload.
   returned: always
   type: dict
   sample: >-
         {
-            "Result": "It has successfully uploaded a metadata bundle for local advisory analysis."
+            "Result": "It has successfully uploaded a metadata bundle for local advisory analysis.",
+            "upload": {
+                "attempts": 1,
+                "bytes": 52428800,
+                "elapsed": 6.02,
+                "sha512": "9b71d224bd62f3785d96d46ad3ea3d73319bfbc2890caadae2dff72519673ca72323c3d99ba5c11d7c7acc6e14b8c5da0c4663475c2e5c3adef46f73bcdec043",
+                "throughput": 8709102
+            }
         }
 '''
 
@@ -84,7 +91,6 @@ import logging
 import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
-from vxrail_ansible_utility.rest import ApiException
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -125,7 +131,7 @@ class VxRailCluster():
         self.api_version_string = "v?"
 
     # Obtains the response for the given module path with specified api_version_number or highest found version
-    def get_versioned_response(self, api_instance, module_path):
+    def get_versioned_response(self, api_client, module_path):
         # Set api version string and version number if undefined
         if self.api_version_number is None:
             self.api_version_string = utils.get_highest_api_version_string(self.vxm_ip, module_path, LOGGER)
@@ -133,23 +139,17 @@ class VxRailCluster():
         else:
             self.api_version_string = utils.get_api_version_string(self.vxm_ip, self.api_version_number, module_path, LOGGER)
 
-        # Calls versioned method as attribute (ex: v1_lcm_advisory_meta_bundle_post)
+        # The request of the utility method (ex: v1_lcm_advisory_meta_bundle_post) is streamed from disk, as the
+        # method reads the whole file into memory
         call_string = self.api_version_string + '_lcm_advisory_meta_bundle_post'
-        # call_string = 'lcm_advisory_meta_bundle_post'
         LOGGER.info("Using utility method: %s\n", call_string)
-        api_generate_advisory_meta_bundle_post = getattr(api_instance, call_string)
-        return api_generate_advisory_meta_bundle_post(meta_bundle=self.meta_bundle)
+        api_instance = utils.api('CVSPublicApi')(api_client)
+        return utils.FileUpload.from_api_call(getattr(api_instance, call_string), LOGGER, timeout=self.timeout,
+                                              meta_bundle=self.meta_bundle).run()
 
     def upload_meta_bundle(self):
-        # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CVSPublicApi(vxrail_ansible_utility.ApiClient(self.configuration))
-        try:
-            # upload meta bundle
-            response = self.get_versioned_response(api_instance, "Post /lcm/advisory-meta-bundle")
-        except ApiException as e:
-            LOGGER.error("Exception when calling CVSPublicApi->%s_lcm_advisory_meta_bundle_post: %s\n", self.api_version_string, e)
-            return 'error'
-        return response
+        # upload meta bundle
+        return self.get_versioned_response(utils.get_api_client(self.configuration), "Post /lcm/advisory-meta-bundle")
 
 
 def main():
@@ -171,7 +171,8 @@ def main():
     result = VxRailCluster().upload_meta_bundle()
     if result == 'error':
         module.fail_json(msg=f"Uploading a metadata bundle for local advisory analysis has failed. Please see the {LOG_FILE_PATH} for more details")
-    vx_facts = {'Result': 'It has successfully uploaded a metadata bundle for local advisory analysis.'}
+    vx_facts = {'Result': 'It has successfully uploaded a metadata bundle for local advisory analysis.',
+                'upload': {key: result[key] for key in ('bytes', 'sha512', 'attempts', 'elapsed', 'throughput')}}
     vx_facts_result = dict(changed=True, Advisory_Meta_Bundle_API=vx_facts)
     module.exit_json(**vx_facts_result)
 
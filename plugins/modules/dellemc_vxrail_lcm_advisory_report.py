@@ -79,7 +79,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -138,7 +137,7 @@ class VxRailCluster():
 
     def post_lcm_advisory_report(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CVSPublicApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CVSPublicApi')(utils.get_api_client(self.configuration))
         try:
             # generate advisory report
             response = self.get_versioned_response(api_instance, "Post /lcm/advisory-report")
@@ -167,7 +166,6 @@ def main():
     )
     result_status = 0
     error = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('----Start to generate lcm advisory report: ----')
     result_request_id = VxRailCluster().post_lcm_advisory_report()
@@ -175,21 +173,17 @@ def main():
     if result_request_id == "error":
         module.fail_json(
             msg=f"The request id is not returned. Please see the log file {LOG_FILE_PATH} for more details")
-    while result_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        result_response = utils.get_request_status(vxm_ip=module.params.get('vxmip'), vcadmin=module.params.get('vcadmin'),
-                                                   vcpasswd=module.params.get('vcpasswd'), logger=LOGGER,
-                                                   request_id=result_request_id)
-        result_status = result_response.state
-        LOGGER.info('Advisory report_Task: status: %s.', result_status)
-        LOGGER.info('Advisory report_Task: details: %s.', result_response)
-        LOGGER.info("Advisory report_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    poller = utils.wait_for_request(module.params.get('vxmip'), module.params.get('vcadmin'), module.params.get('vcpasswd'),
+                                    result_request_id, LOGGER, initial_timeout, label='Advisory report_Task',
+                                    max_interval=CHECK_STATUS_INTERVAL)
+    result_response = poller.response
+    result_status = poller.state
+    LOGGER.info('Advisory report_Task: details: %s.', result_response)
     if result_status == 'COMPLETED':
         LOGGER.info("-------LCM advisory report is successful.-----")
     else:
         LOGGER.info("------LCM advisory report Failed to generate.-----")
-        error = result_response.error
+        error = utils.response_field(result_response, 'error')
         LOGGER.info('----Failed reason is : %s.----', error)
         vx_lcm_advisory_report = {'request_id': result_request_id, 'response_error': error}
         vx_facts_result = dict(failed=True, LCM_Advisory_Report=vx_lcm_advisory_report,
@@ -142,7 +142,7 @@ class VxRailCluster():
 
     def get_lcm_advisory_report_history(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.CVSPublicApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('CVSPublicApi')(utils.get_api_client(self.configuration))
         try:
             # generate advisory report
             response = self.get_versioned_response(api_instance, "Get /cvs/report/history")
@@ -43,8 +43,9 @@ options:
 
   checksum:
     description:
-      Specifies the checksum of uploading file encoded in SHA512
-    required: True
+      Specifies the checksum of uploading file encoded in SHA512. When omitted, it is computed from component_bundle,
+      once per version of the file
+    required: False
     type: str
 
   type:
@@ -93,12 +94,19 @@ EXAMPLES = r'''
 
 RETURN = r'''
 UPLOAD_CUSTOMIZED_COMPONENT_API:
-  description: The upload path of customized component.
+  description: The upload path of customized component, and the size, SHA512 checksum and transfer rate of the upload.
   returned: always
   type: dict
   sample: >-
         {
-            "file": "/data/store2/customized/tmp/components/NVD-VGPU_460.32.04-1OEM.700.0.0.15525992_17478485.zip"
+            "file": "/data/store2/customized/tmp/components/NVD-VGPU_460.32.04-1OEM.700.0.0.15525992_17478485.zip",
+            "upload": {
+                "attempts": 1,
+                "bytes": 356718283,
+                "elapsed": 41.27,
+                "sha512": "3c9909afec25354d551dae21590bb26e38d53f2173b8d3dc3eee4c047e7ab1c1eb8b85103e3be7ba613b31bb5c9c36214dc9f14a42fd7a2fdb84856bca5c44c2",
+                "throughput": 8643525
+            }
         }
 '''
 
@@ -106,7 +114,6 @@ import logging
 import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
-from vxrail_ansible_utility.rest import ApiException
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 LOG_FILE_PATH = "/tmp/vxrail_ansible_lcm_customized_component.log"
@@ -146,7 +153,7 @@ class VxrailCustomizedComponent():
 
         LOGGER.info("self.vxm_ip: %s\n", self.vxm_ip)
 
-    def get_versioned_response(self, api_instance, module_path):
+    def get_versioned_response(self, api_client, module_path):
         # Set api version string and version number if undefined
         if self.api_version_number is None:
             self.api_version_string = utils.get_highest_api_version_string(self.vxm_ip, module_path, LOGGER)
@@ -154,25 +161,25 @@ class VxrailCustomizedComponent():
         else:
             self.api_version_string = utils.get_api_version_string(self.vxm_ip, self.api_version_number, module_path, LOGGER)
 
-        # Calls versioned method as attribute
-        LOGGER.info("Calls versioned method: %s\n", self.api_version_string)
+        # The request of the utility method (ex: v1_upload_bundle_customized_component) is streamed from disk, as
+        # the method reads the whole file into memory
         call_string = self.api_version_string + '_upload_bundle_customized_component'
         LOGGER.info("Using utility method: %s\n", call_string)
-        api_upload_bundle_customized_component_public = getattr(api_instance, call_string)
-        return api_upload_bundle_customized_component_public(customized_component=self.customized_component, checksum=self.checksum, type=self.type,
-                                                             component_bundle=self.component_bundle, _request_timeout=self.timeout)
+        api_instance = utils.api('LCMPreCheckApi')(api_client)
+        return utils.FileUpload.from_api_call(getattr(api_instance, call_string), LOGGER, timeout=self.timeout,
+                                              customized_component=self.customized_component, checksum=self.checksum,
+                                              type=self.type, component_bundle=self.component_bundle).run()
 
     def upload_Customized_Component(self):
-        response = {}
-        try:
-            # create an instance of the API class
-            LOGGER.info("Upload customized component")
-            api_instance = vxrail_ansible_utility.LCMPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
-            response = self.get_versioned_response(api_instance, "Post /lcm/upgrade/upload-bundle")
-            LOGGER.info("Response: %s\n", response)
-        except ApiException as e:
-            LOGGER.error("Exception when calling %s %s, response: %s\n", self.api_version_string, e, response)
-            return 'error'
+        LOGGER.info("Upload customized component")
+        if not self.checksum:
+            self.checksum = utils.get_file_sha512(self.component_bundle, LOGGER)
+        response = self.get_versioned_response(utils.get_api_client(self.configuration), "Post /lcm/upgrade/upload-bundle")
+        LOGGER.info("Response: %s\n", response)
+        if response != 'error' and response['sha512'] != self.checksum.lower():
+            LOGGER.error("SHA512 of %s is %s, not the given checksum %s", self.component_bundle, response['sha512'], self.checksum)
+            module.fail_json(msg=f"The SHA512 of the uploaded {self.component_bundle} is {response['sha512']}, "
+                                 f"not the given checksum {self.checksum}")
         return response
 
 
@@ -186,7 +193,7 @@ def main():
         vcadmin=dict(required=True),
         vcpasswd=dict(required=True, no_log=True),
         customized_component=dict(required=True),
-        checksum=dict(required=True),
+        checksum=dict(required=False),
         type=dict(required=True),
         component_bundle=dict(required=True),
         api_version_number=dict(type='int', required=False),
@@ -202,7 +209,8 @@ def main():
     if result == 'error':
         module.fail_json(msg=f"Uploading a customized component has failed. Please see the {LOG_FILE_PATH} for more details")
 
-    vx_facts = {'file': result.file}
+    vx_facts = {'file': (result['response'] or {}).get('file'),
+                'upload': {key: result[key] for key in ('bytes', 'sha512', 'attempts', 'elapsed', 'throughput')}}
     vx_facts_result = dict(changed=True, UPLOAD_CUSTOMIZED_COMPONENT_API=vx_facts)
     module.exit_json(**vx_facts_result)
 
@@ -0,0 +1,730 @@
+#!/usr/bin/python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: dellemc_vxrail_lcm_fleet
+
+short_description: Upgrade many VxRail clusters in waves with the LCM upgrade API
+
+description:
+- This module will upgrade a list of VxRail clusters to the same LCM bundle, from a single task.
+  The clusters are upgraded in waves of wave_size clusters, with at most max_concurrent clusters upgrading at the same
+  time. Before its upgrade, the LCM precheck of every cluster is run, and the clusters failing it are not upgraded.
+  The prechecks of a wave run at once before its upgrades or, in pipeline mode (precheck_lookahead), for the next
+  clusters while the previous ones upgrade. A precheck older than precheck_max_age is run again before the upgrade.
+  When the share of failed clusters of a wave exceeds max_failure_percentage, no more upgrades are started,
+  the ones in progress are waited for, and the remaining clusters are skipped.
+  All the prechecks and upgrades are followed by one concurrent status poller, which probes the VxRail Managers
+  while they reboot (see the LCM module).
+options:
+
+  clusters:
+    description:
+      The VxRail clusters to upgrade, in the order of the waves. Each element gives the vxmip of the VxRail Manager,
+      and may override the credentials and settings of the module for that cluster
+    required: True
+    type: list
+    elements: dict
+    suboptions:
+      vxmip:
+        description: The IP address of the VxRail Manager System
+        required: True
+        type: str
+      vcadmin:
+        description: Administrative account of the vCenter Server the VxRail Manager is registered to
+        type: str
+      vcpasswd:
+        description: The password for the administrator account provided in vcadmin
+        type: str
+      vc_root_account:
+        description: root account of the vCenter Server the VxRail Manager is registered to
+        type: str
+      vc_root_passwd:
+        description: The password for the root account provided in vc_root_account
+        type: str
+      vxm_root_account:
+        description: root account of VxRail Manager
+        type: str
+      vxm_root_passwd:
+        description: The password for the root account provided in vxm_root_account
+        type: str
+      vc_mgmt_account:
+        description: management account of the vCenter Server the VxRail Manager is registered to
+        type: str
+      vc_mgmt_passwd:
+        description: The password for the management account provided in vc_mgmt_account
+        type: str
+      witness_username:
+        description: witness username, for stretched clusters
+        type: str
+      witness_password:
+        description: witness password, for stretched clusters
+        type: str
+      target_hosts_name:
+        description: The host names to upgrade in a partial upgrade, separated by commas
+        type: str
+      api_version_number:
+        description: A specific version number of the LCM upgrade API to use for this cluster
+        type: int
+
+  bundle:
+    description:
+      the path of lcm bundle on each vxm, which is recommended under /data/store2
+    required: True
+    type: str
+
+  vcadmin:
+    description:
+      Administrative account of the vCenter Servers, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  vcpasswd:
+    description:
+      The password for the administrator account provided in vcadmin
+    required: False
+    type: str
+
+  vc_root_account:
+    description:
+      root account of the vCenter Servers, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  vc_root_passwd:
+    description:
+      The password for the root account provided in vc_root_account
+    required: False
+    type: str
+
+  vxm_root_account:
+    description:
+      root account of the VxRail Managers, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  vxm_root_passwd:
+    description:
+      The password for the root account provided in vxm_root_account
+    required: False
+    type: str
+
+  vc_mgmt_account:
+    description:
+      management account of the vCenter Servers, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  vc_mgmt_passwd:
+    description:
+      The password for the management account provided in vc_mgmt_account
+    required: False
+    type: str
+
+  witness_username:
+    description:
+      witness username, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  witness_password:
+    description:
+      witness password, used for the clusters that do not specify one
+    required: False
+    type: str
+
+  auto_witness_upgrade:
+    description:
+      Whether VxRail will automatically upgrade the witness node
+    required: False
+    type: bool
+
+  preferred_fault_domain_first:
+    description:
+      Upgrade the preferred fault domain first, for stretched clusters
+    required: False
+    type: bool
+
+  missing_file_check:
+    description:
+      Whether to check the missing files of the bundle
+    required: False
+    type: bool
+    default: True
+
+  skip_failed_hosts:
+    description:
+      Whether to skip the hosts which failed to upgrade
+    required: False
+    type: bool
+
+  ecosystem_check_components:
+    description:
+      The components of the ecosystem check, separated by commas
+    required: False
+    type: str
+
+  ecosystem_check_continue_with_incompatible:
+    description:
+      Whether to continue the upgrade when the ecosystem check finds incompatible components
+    required: False
+    type: bool
+
+  enable_quick_boot:
+    description:
+      Enable quick boot to reduce reboot time
+    required: False
+    type: bool
+
+  parallel_remediation_enable:
+    description:
+      Enable parallel remediation. For Dynamic Node only
+    required: False
+    type: bool
+
+  parallel_remediation_max:
+    description:
+      Assign the maximum number of hosts to enter maintenance mode at a time and perform remediation
+    required: False
+    type: str
+
+  enforce_quick_patch:
+    description:
+      Enforce the upgrade with live patch
+    required: False
+    type: bool
+
+  retry_as_standard:
+    description:
+      Enable retry as standard to disable live patch and retry upgrade automatically
+    required: False
+    type: bool
+
+  wave_size:
+    description:
+      Number of clusters in each wave. A wave starts once all the upgrades of the previous one are over
+    required: False
+    type: int
+    default: 5
+
+  max_concurrent:
+    description:
+      Maximum number of clusters upgrading at the same time
+    required: False
+    type: int
+    default: 5
+
+  max_failure_percentage:
+    description:
+      Percentage of the clusters of a wave which may fail their precheck or upgrade, as the max_fail_percentage of
+      a play. Above it, no more upgrades are started. With the default value, no upgrade is started after a failure
+    required: False
+    type: int
+    default: 0
+
+  precheck:
+    description:
+      Whether the LCM precheck of each cluster is run, and must pass, before its upgrade
+    required: False
+    type: bool
+    default: True
+
+  precheck_lookahead:
+    description:
+      Number of clusters whose precheck runs ahead of their upgrade, while the clusters before them upgrade, across
+      the waves. With the default value, all the clusters of a wave are prechecked at once before its upgrades
+    required: False
+    type: int
+    default: 0
+
+  precheck_max_age:
+    description:
+      Age in seconds under which a passing precheck of the bundle is trusted. A precheck older than this is run
+      again before the upgrade of the cluster. 0 never runs it again
+    required: False
+    type: int
+    default: 3600
+
+  reuse_prechecks:
+    description:
+      Whether a passing precheck recorded earlier, by this module or the LCM precheck module, and younger than
+      precheck_max_age is reused instead of prechecking the cluster. It is only reused if it was run with the same
+      accounts, vLCM parameters and bundle_checksum
+    required: False
+    type: bool
+    default: False
+
+  bundle_checksum:
+    description:
+      Checksum, or any other identifier, of the bundle. A recorded precheck is only reused (see reuse_prechecks) for
+      the same bundle_checksum, so that a new bundle staged at the same path is prechecked again
+    required: False
+    type: str
+
+  max_workers:
+    description:
+      Maximum number of status calls sent at the same time
+    required: False
+    type: int
+    default: 16
+
+  timeout:
+    description:
+      Time out value for the upgrade of one cluster, the default value is 21600 seconds
+    required: False
+    type: int
+    default: 21600
+
+author:
+    - VxRail Development Team(@VxRailDevTeam) <ansible.team@dell.com>
+
+'''
+
+EXAMPLES = r'''
+  - name: Upgrade all VxRail clusters, two at a time
+    dellemc_vxrail_lcm_fleet:
+        clusters:
+          - vxmip: "{{ vxmip_1 }}"
+          - vxmip: "{{ vxmip_2 }}"
+            vxm_root_passwd: "{{ vxm_root_passwd_2 }}"
+          - vxmip: "{{ vxmip_3 }}"
+        bundle: "{{ bundle }}"
+        vcadmin: "{{ vcadmin }}"
+        vcpasswd: "{{ vcpasswd }}"
+        vc_root_account: "{{ vc_root_account }}"
+        vc_root_passwd: "{{ vc_root_passwd }}"
+        vxm_root_account: "{{ vxm_root_account }}"
+        vxm_root_passwd: "{{ vxm_root_passwd }}"
+        wave_size: 10
+        max_concurrent: 2
+        max_failure_percentage: 10
+        precheck_lookahead: 2
+        timeout: "{{ timeout }}"
+'''
+
+RETURN = r'''
+LCM_Fleet:
+  description: Outcome of the rollout and of the upgrade of each cluster, in the order of the clusters
+  returned: always
+  type: dict
+  sample: >-
+    {
+        "succeeded": 1,
+        "failed": 1,
+        "skipped": 1,
+        "aborted": true,
+        "clusters": [
+            {
+                "vxmip": "172.16.10.100",
+                "wave": 1,
+                "status": "COMPLETED",
+                "precheck_request_id": "LcmBundleDeployAndPrecheck-d0964e95-1b0c-4c1c-a58a-f9cdf46dab4a",
+                "precheck_cached": false,
+                "request_id": "2ce09bde-d987-4fff-8f90-6fc430e2bfc3",
+                "error": null,
+                "elapsed": 7305.2,
+                "events": [{"state": "COMPLETED", "step": "Completed", "progress": 100, "elapsed": 7210.3}]
+            },
+            {
+                "vxmip": "172.16.10.101",
+                "wave": 1,
+                "status": "PRECHECK_FAILED",
+                "precheck_request_id": "LcmBundleDeployAndPrecheck-5a1bc0a9-3f7e-4a4c-9f0e-2b5f5d2d2f11",
+                "precheck_cached": false,
+                "request_id": null,
+                "error": "Precheck FAILED",
+                "elapsed": 612.8,
+                "events": []
+            },
+            {
+                "vxmip": "172.16.10.102",
+                "wave": 2,
+                "status": "SKIPPED",
+                "precheck_request_id": null,
+                "precheck_cached": false,
+                "request_id": null,
+                "error": "Rollout aborted after 1 cluster failures",
+                "elapsed": 0,
+                "events": []
+            }
+        ]
+    }
+'''
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import time
+import urllib3
+from ansible.module_utils.basic import AnsibleModule
+import vxrail_ansible_utility
+from vxrail_ansible_utility.rest import ApiException
+from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
+
+# Defining global variables
+MODULE = "dellemc_vxrail_lcm_fleet"
+LOG_FILE_PATH = "/tmp/vxrail_ansible_lcm_fleet.log"
+
+LOGGER = utils.get_logger(MODULE, LOG_FILE_PATH, log_devel=logging.DEBUG)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+MAX_RETRY_COUNT = 8
+CHECK_STATUS_INTERVAL = 360
+MIN_CHECK_STATUS_INTERVAL = 30
+PRECHECK_STATUS_INTERVAL = 30
+MAX_PRECHECK_ERROR_COUNT = 10
+# Options of the module which can be overridden per cluster
+CLUSTER_OPTIONS = ('vcadmin', 'vcpasswd', 'vc_root_account', 'vc_root_passwd', 'vxm_root_account', 'vxm_root_passwd',
+                   'vc_mgmt_account', 'vc_mgmt_passwd', 'witness_username', 'witness_password')
+REQUIRED_CREDENTIALS = ('vcadmin', 'vcpasswd', 'vc_root_account', 'vc_root_passwd', 'vxm_root_account', 'vxm_root_passwd')
+UPGRADE_OPTIONS = ('auto_witness_upgrade', 'preferred_fault_domain_first', 'missing_file_check', 'skip_failed_hosts',
+                   'ecosystem_check_components', 'ecosystem_check_continue_with_incompatible', 'enable_quick_boot',
+                   'parallel_remediation_enable', 'parallel_remediation_max', 'enforce_quick_patch', 'retry_as_standard')
+
+
+class VxrailVXMUrls():
+    vxm_url = 'https://{}/rest/vxm'
+
+    def __init__(self, vxm_ip):
+        self.vxm_ip = vxm_ip
+
+    def set_host(self):
+        return VxrailVXMUrls.vxm_url.format(self.vxm_ip)
+
+
+class VxRailLCMCluster():
+    def __init__(self, settings, wave):
+        # The LCM module settings of this cluster (see utils.create_lcm_json)
+        self.settings = settings
+        self.vxm_ip = settings['vxmip']
+        self.api_version_number = settings.get('api_version_number')
+        self.vxm_url = VxrailVXMUrls(self.vxm_ip)
+        # Configure HTTP basic authorization: basicAuth
+        self.configuration = vxrail_ansible_utility.Configuration()
+        self.configuration.username = settings['vcadmin']
+        self.configuration.password = settings['vcpasswd']
+        self.configuration.verify_ssl = False
+        self.configuration.host = self.vxm_url.set_host()
+        self.started_at = None
+        # The outcome of the precheck, the time it passed and the lookahead slot held until the upgrade starts
+        self.prechecked = None
+        self.precheck_passed_at = None
+        self.lookahead = None
+        self.result = {'vxmip': self.vxm_ip, 'wave': wave, 'status': 'PENDING', 'precheck_request_id': None,
+                       'precheck_cached': False, 'request_id': None, 'error': None, 'elapsed': 0, 'events': []}
+
+    # Starts the LCM precheck of the bundle with the highest version of the precheck API
+    def start_precheck(self):
+        api_version_string = utils.get_highest_api_version_string(self.vxm_ip, 'Post /lcm/precheck', LOGGER)
+        call_string = 'precheck_' + api_version_string
+        LOGGER.info("%s: using utility method %s\n", self.vxm_ip, call_string)
+        api_instance = utils.api('LCMPreCheckApi')(utils.get_api_client(self.configuration))
+        request_body = utils.create_lcm_precheck_json(dict(self.settings, bundle_file_locator=self.settings['bundle']),
+                                                      int(api_version_string.split('v')[1]))
+        try:
+            response = getattr(api_instance, call_string)(request_body)
+        except ApiException as e:
+            LOGGER.error("%s: exception when calling LCMPreCheckApi->%s: %s\n", self.vxm_ip, call_string, e)
+            return 'error'
+        return response.request_id
+
+    # Starts the LCM upgrade, with the given API version or the highest one
+    def start_upgrade(self):
+        if self.api_version_number is None:
+            api_version_string = utils.get_highest_api_version_string(self.vxm_ip, 'Post /lcm/upgrade', LOGGER)
+            self.api_version_number = int(api_version_string.split('v')[1])
+        else:
+            api_version_string = utils.get_api_version_string(self.vxm_ip, self.api_version_number, 'Post /lcm/upgrade', LOGGER)
+        call_string = 'upgrade_' + api_version_string
+        LOGGER.info("%s: LCM upgrade version: %s", self.vxm_ip, call_string)
+        api_instance = utils.api('LCMUpgradeApi')(utils.get_api_client(self.configuration))
+        try:
+            response = getattr(api_instance, call_string)(utils.create_lcm_json(self.settings, self.api_version_number))
+        except ApiException as e:
+            LOGGER.error("%s: exception when calling LCMUpgradeApi->%s: %s\n", self.vxm_ip, call_string, e)
+            return 'error'
+        return response.request_id
+
+    def get_request_status(self, request_id):
+        return utils.get_request_status(self.vxm_ip, self.settings['vcadmin'], self.settings['vcpasswd'], request_id, LOGGER)
+
+    def finish(self, status, error=None):
+        self.result['status'] = status
+        self.result['error'] = error
+        if self.started_at is not None:
+            self.result['elapsed'] = round(time.monotonic() - self.started_at, 1)
+        LOGGER.info("%s: %s %s", self.vxm_ip, status, error or '')
+
+
+class VxRailLCMFleet():
+    def __init__(self, clusters, wave_size, max_concurrent, max_failure_percentage, precheck, precheck_lookahead,
+                 precheck_max_age, reuse_prechecks, max_workers, timeout):
+        self.waves = [clusters[i:i + wave_size] for i in range(0, len(clusters), wave_size)]
+        self.clusters = clusters
+        self.max_concurrent = max_concurrent
+        self.max_failure_percentage = max_failure_percentage
+        self.precheck = precheck
+        self.precheck_lookahead = precheck_lookahead
+        self.precheck_max_age = precheck_max_age
+        self.reuse_prechecks = reuse_prechecks
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.succeeded = 0
+        self.failed = 0
+        self.aborted = False
+        # The failures of each wave, by wave number
+        self.wave_failures = {}
+        self.precheck_tasks = []
+
+    def run(self):
+        loop = asyncio.new_event_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        loop.set_default_executor(executor)
+        try:
+            loop.run_until_complete(self.run_waves())
+        finally:
+            loop.close()
+            executor.shutdown(wait=True)
+        return {'succeeded': self.succeeded, 'failed': self.failed,
+                'skipped': len(self.clusters) - self.succeeded - self.failed, 'aborted': self.aborted,
+                'clusters': [cluster.result for cluster in self.clusters]}
+
+    async def run_waves(self):
+        pipeline = None
+        if self.precheck and self.precheck_lookahead > 0:
+            # The prechecks run ahead of the upgrades, across the waves
+            for cluster in self.clusters:
+                cluster.prechecked = asyncio.get_event_loop().create_future()
+            pipeline = asyncio.ensure_future(self.run_prechecks())
+        for number, wave in enumerate(self.waves, 1):
+            LOGGER.info('----Wave %s of %s: %s----', number, len(self.waves), [cluster.vxm_ip for cluster in wave])
+            await self.run_wave(wave, pipeline is not None)
+        if pipeline is not None:
+            await pipeline
+            await asyncio.gather(*self.precheck_tasks)
+
+    async def run_wave(self, wave, pipeline):
+        if self.aborted:
+            for cluster in wave:
+                self.release_lookahead(cluster)
+            if pipeline:
+                # Let the prechecks in progress finish, they are reported as is
+                await asyncio.gather(*[cluster.prechecked for cluster in wave])
+            for cluster in wave:
+                self.skip(cluster)
+            return
+        if self.precheck and not pipeline:
+            # The prechecks do not disturb the clusters, all the clusters of the wave are checked at once
+            for cluster in wave:
+                cluster.prechecked = asyncio.ensure_future(self.precheck_cluster(cluster))
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        await asyncio.gather(*[self.upgrade_cluster(cluster, semaphore) for cluster in wave])
+
+    # Starts the prechecks in the order of the clusters, so that at most precheck_lookahead clusters are
+    # prechecked ahead of their upgrade
+    async def run_prechecks(self):
+        lookahead = asyncio.Semaphore(self.precheck_lookahead)
+        for index, cluster in enumerate(self.clusters):
+            await lookahead.acquire()
+            if self.aborted:
+                lookahead.release()
+                for remaining in self.clusters[index:]:
+                    remaining.prechecked.set_result(False)
+                    self.skip(remaining)
+                return
+            cluster.lookahead = lookahead
+            self.precheck_tasks.append(asyncio.ensure_future(self.precheck_ahead(cluster)))
+
+    async def precheck_ahead(self, cluster):
+        passed = await self.precheck_cluster(cluster)
+        if not passed:
+            self.release_lookahead(cluster)
+        cluster.prechecked.set_result(passed)
+
+    def release_lookahead(self, cluster):
+        if cluster.lookahead is not None:
+            cluster.lookahead.release()
+            cluster.lookahead = None
+
+    async def precheck_cluster(self, cluster):
+        loop = asyncio.get_event_loop()
+        if cluster.started_at is None:
+            cluster.started_at = time.monotonic()
+        cluster.result['status'] = 'PRECHECK'
+        params = utils.precheck_cache_params(cluster.settings)
+        passed_precheck = None
+        if self.reuse_prechecks:
+            passed_precheck = await loop.run_in_executor(None, utils.get_passed_precheck, cluster.vxm_ip,
+                                                         cluster.settings['bundle'], self.precheck_max_age, LOGGER,
+                                                         'LCM_PRECHECK', params)
+        if passed_precheck is not None:
+            cluster.result['precheck_request_id'] = passed_precheck['request_id']
+            cluster.result['precheck_cached'] = True
+            cluster.precheck_passed_at = passed_precheck['passed_at']
+            return True
+        request_id = await loop.run_in_executor(None, cluster.start_precheck)
+        if request_id == 'error':
+            self.record_failure(cluster, 'PRECHECK_FAILED', 'Precheck request id is not returned')
+            return False
+        cluster.result['precheck_request_id'] = request_id
+        cluster.result['precheck_cached'] = False
+        poller = utils.RequestPoller(functools.partial(cluster.get_request_status, request_id), LOGGER, self.timeout,
+                                     label='{}_Precheck'.format(cluster.vxm_ip), max_interval=PRECHECK_STATUS_INTERVAL,
+                                     max_errors=MAX_PRECHECK_ERROR_COUNT)
+        await poller.wait_async()
+        if poller.state != 'COMPLETED':
+            self.record_failure(cluster, 'PRECHECK_FAILED', 'Precheck {}'.format(poller.state or 'timed out'))
+            return False
+        cluster.precheck_passed_at = time.time()
+        await loop.run_in_executor(None, utils.record_passed_precheck, cluster.vxm_ip, cluster.settings['bundle'],
+                                   request_id, LOGGER, 'LCM_PRECHECK', params)
+        return True
+
+    # Whether the precheck of the cluster passed too long ago to be trusted by its upgrade
+    def is_precheck_stale(self, cluster):
+        return self.precheck_max_age > 0 and time.time() - cluster.precheck_passed_at >= self.precheck_max_age
+
+    async def upgrade_cluster(self, cluster, semaphore):
+        # A failed precheck is already recorded
+        if self.precheck and not await cluster.prechecked:
+            return
+        async with semaphore:
+            self.release_lookahead(cluster)
+            # The rollout may have been aborted while this cluster was waiting for its turn
+            if self.aborted:
+                self.skip(cluster)
+                return
+            if self.precheck and self.is_precheck_stale(cluster):
+                LOGGER.info("%s: precheck %s is older than %s seconds, running it again", cluster.vxm_ip,
+                            cluster.result['precheck_request_id'], self.precheck_max_age)
+                if not await self.precheck_cluster(cluster) or self.aborted:
+                    self.skip(cluster)
+                    return
+            loop = asyncio.get_event_loop()
+            cluster.result['status'] = 'UPGRADING'
+            request_id = await loop.run_in_executor(None, cluster.start_upgrade)
+            if request_id == 'error':
+                self.record_failure(cluster, 'FAILED', 'LCM request id is not returned')
+                return
+            cluster.result['request_id'] = request_id
+            poller = utils.LCMPoller(functools.partial(cluster.get_request_status, request_id), cluster.vxm_ip, LOGGER,
+                                     self.timeout, outage_timeout=MAX_RETRY_COUNT * 15 * 60,
+                                     label='{}_LCM_Task'.format(cluster.vxm_ip),
+                                     min_interval=MIN_CHECK_STATUS_INTERVAL, max_interval=CHECK_STATUS_INTERVAL)
+            response = await poller.wait_async()
+            cluster.result['events'] = poller.events
+            if poller.state == 'COMPLETED':
+                self.succeeded += 1
+                cluster.finish('COMPLETED')
+                # The upgraded VxRail Manager serves a new API schema, and its earlier prechecks no longer hold
+                utils.invalidate_api_schema_cache(cluster.vxm_ip, LOGGER)
+                utils.invalidate_precheck_cache(cluster.vxm_ip, LOGGER)
+                return
+            if poller.outage_failed:
+                error = 'VxRail Manager did not come back'
+            elif response is None or response == 'error':
+                error = 'LCM {}'.format('timed out' if poller.timed_out else 'status is not returned')
+            else:
+                error = utils.response_field(response, 'error') or utils.response_field(response, 'detail')
+            self.record_failure(cluster, 'FAILED', error)
+
+    def record_failure(self, cluster, status, error):
+        wave = cluster.result['wave']
+        self.failed += 1
+        self.wave_failures[wave] = self.wave_failures.get(wave, 0) + 1
+        cluster.finish(status, error)
+        wave_size = len(self.waves[wave - 1])
+        if not self.aborted and self.wave_failures[wave] * 100 > self.max_failure_percentage * wave_size:
+            self.aborted = True
+            LOGGER.error('----Rollout aborted after %s failed of %s clusters of wave %s----', self.wave_failures[wave],
+                         wave_size, wave)
+
+    def skip(self, cluster):
+        # The clusters which already failed keep their failure
+        if cluster.result['status'] in ('COMPLETED', 'FAILED', 'PRECHECK_FAILED', 'SKIPPED'):
+            return
+        cluster.finish('SKIPPED', 'Rollout aborted after {} cluster failures'.format(self.failed))
+
+
+def get_clusters():
+    clusters = []
+    for number, item in enumerate(module.params.get('clusters')):
+        settings = {'bundle': module.params.get('bundle'), 'bundle_checksum': module.params.get('bundle_checksum')}
+        for option in CLUSTER_OPTIONS + UPGRADE_OPTIONS:
+            settings[option] = module.params.get(option)
+        for option, value in item.items():
+            if value is not None:
+                settings[option] = value
+        missing = [option for option in REQUIRED_CREDENTIALS if not settings.get(option)]
+        if missing:
+            module.fail_json(msg=f"No {', '.join(missing)} given for the VxRail Manager {settings['vxmip']}")
+        clusters.append(VxRailLCMCluster(settings, number // module.params.get('wave_size') + 1))
+    return clusters
+
+
+def main():
+    ''' Entry point into execution flow '''
+    global module
+    # define available arguments/parameters a user can pass to the module
+    cluster_options = dict(vxmip=dict(required=True), target_hosts_name=dict(type='str'), api_version_number=dict(type='int'))
+    for option in CLUSTER_OPTIONS:
+        cluster_options[option] = dict(type='str', no_log=option.endswith(('passwd', 'password')))
+    module_args = dict(
+        clusters=dict(type='list', elements='dict', required=True, options=cluster_options),
+        bundle=dict(required=True),
+        auto_witness_upgrade=dict(type='bool'),
+        preferred_fault_domain_first=dict(type='bool'),
+        missing_file_check=dict(type='bool', default=True),
+        skip_failed_hosts=dict(type='bool'),
+        ecosystem_check_components=dict(type='str'),
+        ecosystem_check_continue_with_incompatible=dict(type='bool'),
+        enable_quick_boot=dict(type='bool'),
+        parallel_remediation_enable=dict(type='bool'),
+        parallel_remediation_max=dict(type='str'),
+        enforce_quick_patch=dict(type='bool'),
+        retry_as_standard=dict(type='bool'),
+        wave_size=dict(type='int', default=5),
+        max_concurrent=dict(type='int', default=5),
+        max_failure_percentage=dict(type='int', default=0),
+        precheck=dict(type='bool', default=True),
+        precheck_lookahead=dict(type='int', default=0),
+        precheck_max_age=dict(type='int', default=3600),
+        reuse_prechecks=dict(type='bool', default=False),
+        bundle_checksum=dict(type='str'),
+        max_workers=dict(type='int', default=16),
+        timeout=dict(type='int', default=21600)
+    )
+    for option in CLUSTER_OPTIONS:
+        module_args[option] = dict(type='str', required=False, no_log=option.endswith(('passwd', 'password')))
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    if module.params.get('wave_size') < 1 or module.params.get('max_concurrent') < 1:
+        module.fail_json(msg="wave_size and max_concurrent must be at least 1")
+    clusters = get_clusters()
+    LOGGER.info('----Start to upgrade %s clusters with LCM API: ----', len(clusters))
+    fleet = VxRailLCMFleet(clusters, module.params.get('wave_size'), module.params.get('max_concurrent'),
+                           module.params.get('max_failure_percentage'), module.params.get('precheck'),
+                           max(0, module.params.get('precheck_lookahead')), module.params.get('precheck_max_age'),
+                           module.params.get('reuse_prechecks'), max(1, module.params.get('max_workers')), module.params.get('timeout'))
+    result = fleet.run()
+    LOGGER.info('LCM_Fleet: %s', result)
+    if result['failed'] or result['skipped']:
+        vx_facts_result = dict(failed=True, changed=result['succeeded'] > 0, LCM_Fleet=result,
+                               msg=f"{result['succeeded']} of {len(clusters)} clusters upgraded. "
+                                   f"Please see the {LOG_FILE_PATH} for more details")
+        module.exit_json(**vx_facts_result)
+    vx_facts_result = dict(changed=True, LCM_Fleet=result,
+                           msg=f"{len(clusters)} clusters upgraded. Please see the {LOG_FILE_PATH} for more details")
+    module.exit_json(**vx_facts_result)
+
+
+if __name__ == "__main__":
+    main()
@@ -105,6 +105,22 @@ options:
     required: False
     type: int
 
+  max_age:
+    description:
+      Age in seconds under which a passing precheck of the same bundle on the VxRail Manager, run by this module or by
+      the LCM fleet module, is reused instead of being run again. It is only reused if it was run with the same
+      accounts, vLCM parameters and bundle_checksum. With the default value, the precheck is always run
+    required: false
+    type: int
+    default: 0
+
+  bundle_checksum:
+    description:
+      Checksum, or any other identifier, of the bundle at bundle_file_locator. A passing precheck is only reused
+      (see max_age) for the same bundle_checksum, so that a new bundle staged at the same path is prechecked again
+    required: false
+    type: str
+
   timeout:
     description:
       Time out value for LCM Upgrade, the default value is 21600 seconds
@@ -149,7 +165,8 @@ LCM_status:
    {
      "LCM_Precheck": {
             "request_id": "LcmBundleDeployAndPrecheck-d0964e95-1b0c-4c1c-a58a-f9cdf46dab4a",
-            "status": "COMPLETED"
+            "status": "COMPLETED",
+            "cached": false
         },
         "msg": "LCM Precheck is successful. Please see the /tmp/vxrail_ansible_lcm_v1_precheck.log for more details"
 
@@ -161,7 +178,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 LOG_FILE_NAME = "/tmp/vxrail_ansible_lcm_precheck.log"
@@ -184,20 +200,9 @@ class VxrailVXMUrls():
 class VxRailLCMPRCHECK():
     def __init__(self):
         self.vxm_ip = module.params.get('vxmip')
-        self.bundle_file_locator = module.params.get('bundle_file_locator')
         self.timeout = module.params.get('timeout')
         self.vc_admin = module.params.get('vcadmin')
         self.vc_password = module.params.get('vcpasswd')
-        self.vc_root_account = module.params.get('vc_root_account')
-        self.vc_root_passwd = module.params.get('vc_root_passwd')
-        self.vxm_root_account = module.params.get('vxm_root_account')
-        self.vxm_root_passwd = module.params.get('vxm_root_passwd')
-        self.health_precheck_type = module.params.get('health_precheck_type')
-        self.enable_quick_boot = module.params.get('enable_quick_boot')
-        self.parallel_remediation_enable = module.params.get('parallel_remediation_enable')
-        self.parallel_remediation_max = module.params.get('parallel_remediation_max')
-        self.enforce_quick_patch = module.params.get('enforce_quick_patch')
-        self.retry_as_standard = module.params.get('retry_as_standard')
         self.api_version_number = module.params.get('api_version_number')
         self.vxm_url = VxrailVXMUrls(self.vxm_ip)
         # Configure HTTP basic authorization: basicAuth
@@ -210,7 +215,7 @@ class VxRailLCMPRCHECK():
         self.api_version_string = "v?"
 
     # Obtains the response for the given module path with specified api_version_number or highest found version
-    def get_versioned_response(self, api_instance, module_path, precheck_json):
+    def get_versioned_response(self, api_instance, module_path):
         # Set api version string and version number if undefined
         if self.api_version_number is None:
             self.api_version_string = utils.get_highest_api_version_string(self.vxm_ip, module_path, LOGGER)
@@ -222,54 +227,20 @@ class VxRailLCMPRCHECK():
         call_string = 'precheck_' + self.api_version_string
         LOGGER.info("Using utility method: %s\n", call_string)
         api_prechek_post = getattr(api_instance, call_string)
-        request_body = precheck_json
+        # The request body depends on the API version
+        request_body = self.create_lcm_precheck_json()
         return api_prechek_post(request_body)
 
     def create_lcm_precheck_json(self):
         ''' lcm node json '''
-        lcm_precheck_json = {}
-        lcm_precheck_json['bundle_file_locator'] = self.bundle_file_locator
-        lcm_precheck_json['health_precheck_type'] = self.health_precheck_type
-        vcenter_dict = {}
-        vcenter_dict['vc_admin_user'] = {'username': self.vc_admin, 'password': self.vc_password}
-        vcenter_dict['vcsa_root_user'] = {'username': self.vc_root_account, 'password': self.vc_root_passwd}
-        lcm_precheck_json['vcenter'] = vcenter_dict
-        vxrail_dict = {}
-        vxrail_dict['vxm_root_user'] = {'username': self.vxm_root_account, 'password': self.vxm_root_passwd}
-        lcm_precheck_json['vxrail'] = vxrail_dict
-
-        # for api v2
-        if self.api_version_number >= 2:
-            vlcm_parameters = {}
-            parallel_remediation = {}
-            enforce_quick_patch = {}
-
-            if self.enable_quick_boot is not None:
-                vlcm_parameters['enable_quick_boot'] = self.enable_quick_boot
-
-            if self.parallel_remediation_enable is not None:
-                parallel_remediation['enabled'] = self.parallel_remediation_enable
-                parallel_remediation['max_hosts'] = self.parallel_remediation_max
-                vlcm_parameters['parallel_remediation_action'] = parallel_remediation
-
-            if self.enforce_quick_patch is not None:
-                enforce_quick_patch['enabled'] = self.enforce_quick_patch
-                
-            if self.retry_as_standard is not None:
-                enforce_quick_patch['retry_as_standard'] = self.retry_as_standard
-            vlcm_parameters['enforce_quick_patch'] = enforce_quick_patch
-
-            lcm_precheck_json['vlcm_parameters'] = vlcm_parameters
-
-        return lcm_precheck_json
-
-    def lcm_precheck(self, lcm_precheck_json):
-        request_body = lcm_precheck_json
+        return utils.create_lcm_precheck_json(module.params, self.api_version_number)
+
+    def lcm_precheck(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.LCMPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('LCMPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # start LCM Precheck
-            response = self.get_versioned_response(api_instance, "Post /lcm/precheck", request_body)
+            response = self.get_versioned_response(api_instance, "Post /lcm/precheck")
         except ApiException as e:
             LOGGER.error("Exception when calling LCMPreCheckApi->precheck_%s: %s\n", self.api_version_string, e)
             return 'error'
@@ -279,7 +250,7 @@ class VxRailLCMPRCHECK():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(job_id)
         except Exception as e:
@@ -319,6 +290,8 @@ def main():
         vxm_root_passwd=dict(required=True, no_log=True),
         health_precheck_type=dict(type='str', default="LCM_PRECHECK"),
         api_version_number=dict(type='int'),
+        max_age=dict(type='int', default=0),
+        bundle_checksum=dict(type='str'),
         timeout=dict(type='int', default=MAX_CHECK_COUNT * CHECK_STATUS_INTERVAL)
     )
     v2_module_args = dict(
@@ -336,27 +309,33 @@ def main():
     lcm_precheck_status = 0
     lcm_precheck_result = 0
     error = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('----Start to LCM Precheck with V1 API: ----')
-    lcm_precheck_json = VxRailLCMPRCHECK().create_lcm_precheck_json()
-    request_body = lcm_precheck_json
-    lcm_precheck_request_id = VxRailLCMPRCHECK().lcm_precheck(request_body)
+    passed_precheck = utils.get_passed_precheck(module.params.get('vxmip'), module.params.get('bundle_file_locator'),
+                                                module.params.get('max_age'), LOGGER, module.params.get('health_precheck_type'),
+                                                utils.precheck_cache_params(module.params))
+    if passed_precheck is not None:
+        vx_lcm_precheck = {'status': 'COMPLETED', 'request_id': passed_precheck['request_id'], 'cached': True}
+        vx_facts_result = dict(changed=False, LCM_Precheck=vx_lcm_precheck,
+                               msg="LCM Precheck has already passed. Please see the /tmp/vxrail_ansible_lcm_precheck.log for more details")
+        module.exit_json(**vx_facts_result)
+    lcm_precheck = VxRailLCMPRCHECK()
+    lcm_precheck_request_id = lcm_precheck.lcm_precheck()
     LOGGER.info('LCM Precheck: VxRail task_ID: %s.', lcm_precheck_request_id)
     if lcm_precheck_request_id == "error":
         module.fail_json(
             msg="lcm precheck request id is not returned. Please see the /tmp/vxrail_ansible_lcm_precheck.log for more details")
-    while lcm_precheck_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        lcm_precheck_response = VxRailLCMPRCHECK().get_request_status(lcm_precheck_request_id)
-        lcm_precheck_status = lcm_precheck_response.state
-        lcm_precheck_result = VxRailLCMPRCHECK().get_request_info(lcm_precheck_response)
-        LOGGER.info('LCM_Precheck_Task: status: %s.', lcm_precheck_status)
-        LOGGER.info('LCM_Precheck_Task: details: %s.', lcm_precheck_result)
-        LOGGER.info("LCM_Precheck_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    poller = utils.RequestPoller(lambda: lcm_precheck.get_request_status(lcm_precheck_request_id), LOGGER,
+                                 initial_timeout, label='LCM_Precheck_Task', max_interval=CHECK_STATUS_INTERVAL)
+    lcm_precheck_response = poller.wait()
+    lcm_precheck_status = poller.state
+    lcm_precheck_result = lcm_precheck.get_request_info(lcm_precheck_response)
+    LOGGER.info('LCM_Precheck_Task: details: %s.', lcm_precheck_result)
     if lcm_precheck_status == 'COMPLETED':
         LOGGER.info("-------LCM Precheck is successful.-----")
+        utils.record_passed_precheck(module.params.get('vxmip'), module.params.get('bundle_file_locator'),
+                                     lcm_precheck_request_id, LOGGER, module.params.get('health_precheck_type'),
+                                     utils.precheck_cache_params(module.params))
     else:
         LOGGER.info("------LCM Precheck Failed-----")
         if eval(lcm_precheck_response.extension).get('errors') is not None:
@@ -366,7 +345,7 @@ def main():
         vx_facts_result = dict(failed=True, LCM_V1_Precheck=vx_lcm_precheck,
                                msg="LCM Precheck has failed. Please see the /tmp/vxrail_ansible_lcm_precheck.log for more details")
         module.exit_json(**vx_facts_result)
-    vx_lcm_precheck = {'status': lcm_precheck_status, 'request_id': lcm_precheck_request_id}
+    vx_lcm_precheck = {'status': lcm_precheck_status, 'request_id': lcm_precheck_request_id, 'cached': False}
     vx_facts_result = dict(changed=False, LCM_Precheck=vx_lcm_precheck,
                            msg="LCM Precheck is successful. Please see the /tmp/vxrail_ansible_lcm_precheck.log for more details")
     module.exit_json(**vx_facts_result)
@@ -72,7 +72,13 @@ LCM_status:
    {
     "LCM_API_Upgrade": {
         "request_id": "2ce09bde-d987-4fff-8f90-6fc430e2bfc3",
-        "status": "COMPLETED"
+        "status": "COMPLETED",
+        "events": [
+            {"state": "IN_PROGRESS", "step": "Preparing", "progress": 5, "elapsed": 0.4},
+            {"event": "manager_unreachable", "elapsed": 1503.2},
+            {"event": "manager_back", "outage": 241.7, "elapsed": 1744.9},
+            {"state": "COMPLETED", "step": "Completed", "progress": 100, "elapsed": 7210.3}
+        ]
     }
     "msg": "LCM is successful. Please see the /tmp/vxrail_ansible_lcm.log for more details"
    }
@@ -83,7 +89,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 LOG_FILE_NAME = "/tmp/vxrail_ansible_lcm.log"
@@ -91,6 +96,7 @@ LOGGER = utils.get_logger("dellemc_vxrail_lcm", LOG_FILE_NAME, log_devel=logging
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 MAX_RETRY_COUNT = 8
 CHECK_STATUS_INTERVAL = 360
+MIN_CHECK_STATUS_INTERVAL = 30
 MAX_CHECK_COUNT = 60
 
 
@@ -122,7 +128,7 @@ class VxRailLCMRetry():
     def upgrade(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.LCMUpgradeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('LCMUpgradeApi')(utils.get_api_client(self.configuration))
             # retry LCM with versioned api
             api_version_string = self.get_versioned_response('POST /lcm/upgrade/retry')
             call_string = 'upgrade_retry_' + api_version_string
@@ -163,12 +169,8 @@ def main():
         argument_spec=module_args,
         supports_check_mode=True,
     )
-    lcm_status = 0
-    lcm_result = 0
     error = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
-    try_times = 0
     vxmip = module.params.get('vxmip')
     vcadmin = module.params.get('vcadmin')
     vcpasswd = module.params.get('vcpasswd')
@@ -180,32 +182,26 @@ def main():
     if lcm_request_id == "error":
         module.fail_json(
             msg="lcm request id is not returned. Please see the /tmp/vxrail_ansible_lcm.log for more details")
-    while lcm_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        lcm_response = utils.get_request_status(vxm_ip=vxmip, vcadmin=vcadmin, vcpasswd=vcpasswd, logger=LOGGER, request_id=lcm_request_id)
-        ''' When VxRail Manager upgrade or Reboot is in progress. Temporary disconnection during this process,
-        meed to send request with auth again'''
-        while lcm_response == "error" and try_times < MAX_RETRY_COUNT:
-            LOGGER.info('----VxRail Manager upgrade or Reboot is in progress, which may be temporary '
-                        'disconnection during this process ----')
-            LOGGER.info('----Please wait for its back...Need to log in again----')
-            time.sleep(15 * 60)
-            lcm_response = utils.get_request_status(vxm_ip=vxmip, vcadmin=vcadmin, vcpasswd=vcpasswd, logger=LOGGER, request_id=lcm_request_id)
-            try_times = try_times + 1
-        if try_times == MAX_RETRY_COUNT:
-            LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
-            vx_lcm = {'request_id': lcm_request_id}
-            vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
-                                   msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
-            module.exit_json(**vx_facts_result)
-        lcm_status = lcm_response.state
-        lcm_result = utils.get_request_info(lcm_response)
-        LOGGER.info('LCM_Task: status: %s.', lcm_status)
-        LOGGER.info('LCM_Task: details: %s.', lcm_result)
-        LOGGER.info("LCM_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    # The VxRail Manager is upgraded and rebooted during the LCM, the status calls fail until it is back
+    poller = utils.LCMPoller(lambda: utils.get_request_status(vxm_ip=vxmip, vcadmin=vcadmin, vcpasswd=vcpasswd, logger=LOGGER,
+                                                              request_id=lcm_request_id),
+                             vxmip, LOGGER, initial_timeout, outage_timeout=MAX_RETRY_COUNT * 15 * 60, label='LCM_Task',
+                             min_interval=MIN_CHECK_STATUS_INTERVAL, max_interval=CHECK_STATUS_INTERVAL)
+    lcm_response = poller.wait()
+    if poller.outage_failed:
+        LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
+        vx_lcm = {'request_id': lcm_request_id, 'events': poller.events}
+        vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
+                               msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
+        module.exit_json(**vx_facts_result)
+    lcm_status = poller.state
+    lcm_result = utils.get_request_info(lcm_response) if lcm_response is not None else [{}]
+    LOGGER.info('LCM_Task: details: %s.', lcm_result)
     if lcm_status == 'COMPLETED':
         LOGGER.info("-------LCM is successful.-----")
+        # The upgraded VxRail Manager serves a new API schema, and its earlier prechecks no longer hold
+        utils.invalidate_api_schema_cache(module.params.get('vxmip'), LOGGER)
+        utils.invalidate_precheck_cache(module.params.get('vxmip'), LOGGER)
     else:
         LOGGER.info("------LCM Failed-----")
         if lcm_result[0].get('error') is not None:
@@ -213,11 +209,11 @@ def main():
         else:
             error = lcm_result[0].get('detail')
         LOGGER.info('----Failed reason is : %s.----', error)
-        vx_lcm = {'request_id': lcm_request_id, 'response_error': error}
+        vx_lcm = {'request_id': lcm_request_id, 'response_error': error, 'events': poller.events}
         vx_facts_result = dict(failed=True, LCM_API_Upgrade=vx_lcm,
                                msg="LCM has failed. Please see the /tmp/vxrail_ansible_lcm.log for more details")
         module.exit_json(**vx_facts_result)
-    vx_lcm = {'status': lcm_status, 'request_id': lcm_request_id}
+    vx_lcm = {'status': lcm_status, 'request_id': lcm_request_id, 'events': poller.events}
     vx_facts_result = dict(changed=True, LCM_API_Upgrade=vx_lcm,
                            msg="LCM is successful. Please see the /tmp/vxrail_ansible_lcm.log for more details")
     module.exit_json(**vx_facts_result)
@@ -107,7 +107,7 @@ class VxRailLCMCommitVLCMDraft():
     def post_commit_vlcm_draft(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
             # start commit vLCM draft with versioned api
             api_version_string = self.get_versioned_response('Post /lcm/vlcm/enablement/draft/commit')
             call_string = 'vlcm_enablement_draft_commit_post_' + api_version_string
@@ -128,7 +128,7 @@ class VxRailLCMDeleteVLCMDraft():
     def delete_vlcm_draft(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
             # start delete vLCM draft with versioned api
             api_version_string = self.get_versioned_response('Delete /lcm/vlcm/enablement/draft')
             call_string = 'vlcm_enablement_draft_delete_' + api_version_string
@@ -73,7 +73,8 @@ VLCM_ENABLE_API:
   returned: always
   type: dict
   sample: >-
-        { "status": vlcm_enable_status, 'request_id': vlcm_request_id}
+        { "status": vlcm_enable_status, 'request_id': vlcm_request_id, 'events': [{'state': 'IN_PROGRESS', 'step': 'update_cert',
+          'progress': 50, 'elapsed': 62.1}]}
 '''
 
 import logging
@@ -81,7 +82,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 import json
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
@@ -89,6 +89,8 @@ LOG_FILE_NAME = "/tmp/vxrail_ansible_lcm_vlcm_enable.log"
 LOGGER = utils.get_logger("dellemc_vxrail_lcm_vlcm_enable", LOG_FILE_NAME, log_devel=logging.DEBUG)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 CHECK_STATUS_INTERVAL = 60
+MIN_CHECK_STATUS_INTERVAL = 10
+STATUS_REQUEST_TIMEOUT = 60
 MAX_CHECK_COUNT = 60
 MAX_RETRY_COUNT = 20
 
@@ -144,7 +146,7 @@ class VxRailLCMEnableVLCM():
     def post_vlcm_enablement(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
             # start LCM with versioned api
             api_version_string = self.get_versioned_response('Post /lcm/vlcm/enablement')
             call_string = 'vlcm_enablement_post_' + api_version_string
@@ -167,14 +169,20 @@ class VxRailLCMEnableVLCM():
     def get_vlcm_enablement_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
         try:
-            response = api_instance.vlcm_enablement_status_get_v1(job_id)
+            response = api_instance.vlcm_enablement_status_get_v1(job_id, _request_timeout=STATUS_REQUEST_TIMEOUT)
         except Exception as e:
             LOGGER.error("Exception when calling vlcm_enablement_status_get_v1: %s\n", e)
             return 'error'
         return response
 
+
+# Logs the details of the current step whenever the state, step or progress of the enablement changes
+def log_vlcm_enablement_step(response):
+    LOGGER.info('VLCM_Enable_Task: details: %s.', (response.extension or {}).get(response.step))
+
+
 def main():
     ''' Entry point into execution flow '''
     global module
@@ -196,45 +204,30 @@ def main():
         supports_check_mode=True,
     )
 
-    vlcm_enable_status = 0
-    vlcm_enable_step = 0
-    try_times = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
 
     LOGGER.info('----Start to vLCM enablement: ----')
-    vlcm_request_id = VxRailLCMEnableVLCM().post_vlcm_enablement()
+    vlcm = VxRailLCMEnableVLCM()
+    vlcm_request_id = vlcm.post_vlcm_enablement()
     LOGGER.info('LCM: vLCM enablement request_id: %s.', vlcm_request_id)
     if vlcm_request_id == "error":
         module.fail_json(
             msg=f"vLCM enablement request_id is not returned. Please see the {LOG_FILE_NAME} for more details")
-    while vlcm_enable_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        LOGGER.info('----vLCM enablement is in progress----')
-        vlcm_response = VxRailLCMEnableVLCM().get_vlcm_enablement_status(vlcm_request_id)
-        LOGGER.info(vlcm_response)
-        ''' When update_cert step is in progress. Temporary disconnection during this process,
-        meed to send request with auth again'''
-        while vlcm_response == "error" and try_times < MAX_RETRY_COUNT:
-            LOGGER.info('----When update_cert step is in progress, which may be temporary '
-                        'disconnection during this process ----')
-            LOGGER.info('----Please wait for its back...Need to log in again----')
-            time.sleep(3 * 60)
-            vlcm_response = VxRailLCMEnableVLCM().get_vlcm_enablement_status(vlcm_request_id)
-            try_times = try_times + 1
-        if try_times == MAX_RETRY_COUNT:
-            LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
-            vx_lcm = {'request_id': vlcm_response}
-            vx_facts_result = dict(failed=True, VLCM_ENABLE_API=vx_lcm,
-                                   msg="vLCM enablement has failed. Please see the {LOG_FILE_NAME} for more details")
-            module.exit_json(**vx_facts_result)
-        vlcm_enable_status = vlcm_response.state
-        vlcm_enable_step = vlcm_response.step
-        LOGGER.info('VLCM_Enable_Task: status: %s.', vlcm_enable_status)
-        LOGGER.info('VLCM_Enable_Task: current step: %s.', vlcm_enable_step)
-        LOGGER.info('VLCM_Enable_Task: details: %s.', vlcm_response.extension[vlcm_enable_step])
-        LOGGER.info("VLCM_Enable_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    LOGGER.info('----vLCM enablement is in progress----')
+    # The certificates of the VxRail Manager are updated during the enablement, the status calls fail until it is back
+    poller = utils.LCMPoller(lambda: vlcm.get_vlcm_enablement_status(vlcm_request_id), module.params.get('vxmip'), LOGGER,
+                             initial_timeout, outage_timeout=MAX_RETRY_COUNT * 3 * 60, label='VLCM_Enable_Task',
+                             min_interval=MIN_CHECK_STATUS_INTERVAL, max_interval=CHECK_STATUS_INTERVAL,
+                             on_change=log_vlcm_enablement_step)
+    vlcm_response = poller.wait()
+    if poller.outage_failed:
+        LOGGER.info('----VxRail Manager upgrade or Reboot is failed----')
+        vx_lcm = {'request_id': vlcm_request_id, 'events': poller.events}
+        vx_facts_result = dict(failed=True, VLCM_ENABLE_API=vx_lcm,
+                               msg=f"vLCM enablement has failed. Please see the {LOG_FILE_NAME} for more details")
+        module.exit_json(**vx_facts_result)
+    vlcm_enable_status = poller.state
+    vlcm_enable_step = vlcm_response.step if vlcm_response is not None else None
 
     if vlcm_enable_status == 'COMPLETED':
         LOGGER.info("-------vLCM enablement is successful.-----")
@@ -242,11 +235,12 @@ def main():
         LOGGER.info("------vLCM enablement Failed-----")
 
         LOGGER.info('----Failed reason is : %s.----', vlcm_response)
-        vx_lcm = {'request_id': vlcm_request_id, 'response_error_step': vlcm_response.extension[vlcm_enable_step]}
+        error_step = vlcm_response.extension[vlcm_enable_step] if vlcm_response is not None else None
+        vx_lcm = {'request_id': vlcm_request_id, 'response_error_step': error_step, 'events': poller.events}
         vx_facts_result = dict(failed=True, VLCM_ENABLE_API=vx_lcm,
                                msg=f"vLCM enablement has failed. Please see the {LOG_FILE_NAME} for more details")
         module.exit_json(**vx_facts_result)
-    vx_lcm = {'status': vlcm_enable_status, 'request_id': vlcm_request_id}
+    vx_lcm = {'status': vlcm_enable_status, 'request_id': vlcm_request_id, 'events': poller.events}
     vx_facts_result = dict(VLCM_ENABLE_API=vx_lcm,
                            msg=f"vLCM enablement is successful. Please see the {LOG_FILE_NAME} for more details")
     LOGGER.info("vx_facts_result: %s\n", vx_facts_result)
@@ -81,7 +81,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 import json
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
@@ -143,7 +142,7 @@ class VxRailLCMGenerateVLCMDraft():
     def post_generate_vlcm_draft(self):
         try:
             # create an instance of the API class
-            api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
             # start generate vLCM draft with versioned api
             api_version_string = self.get_versioned_response('Post /lcm/vlcm/enablement/draft/generate')
             call_string = 'vlcm_enablement_draft_generate_post_' + api_version_string
@@ -166,7 +165,7 @@ class VxRailLCMGenerateVLCMDraft():
     def get_vlcm_task_status(self, task_id):
         job_id = task_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.vlcm_enablement_status_get_v1(job_id)
         except Exception as e:
@@ -197,7 +196,6 @@ def main():
 
     generate_vlcm_draft_status = 0
     generate_vlcm_draft_step = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
 
     LOGGER.info('----Start to generate vLCM draft: ----')
@@ -206,22 +204,15 @@ def main():
     if vlcm_task_id == "error":
         module.fail_json(
             msg=f"Generate vLCM draft task_id is not returned. Please see the {LOG_FILE_NAME} for more details")
-    while generate_vlcm_draft_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        LOGGER.info('----Generate vLCM draft is in progress----')
-        vlcm_response = VxRailLCMGenerateVLCMDraft().get_vlcm_task_status(vlcm_task_id)
-        if vlcm_response == "error":
-          time.sleep(CHECK_STATUS_INTERVAL)
-          time_out = time_out + CHECK_STATUS_INTERVAL
-          continue
-        LOGGER.info(vlcm_response)
-        generate_vlcm_draft_status = vlcm_response.state
-        generate_vlcm_draft_step = vlcm_response.step
-        LOGGER.info('Generate_VLCM_Draft_Task: status: %s.', generate_vlcm_draft_status)
-        LOGGER.info('Generate_VLCM_Draft_Task: current step: %s.', generate_vlcm_draft_step)
-        LOGGER.info('Generate_VLCM_Draft_Task: details: %s.', vlcm_response.extension[generate_vlcm_draft_step])
-        LOGGER.info("Generate_VLCM_Draft_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    LOGGER.info('----Generate vLCM draft is in progress----')
+    generate_vlcm_draft = VxRailLCMGenerateVLCMDraft()
+    poller = utils.RequestPoller(lambda: generate_vlcm_draft.get_vlcm_task_status(vlcm_task_id), LOGGER, initial_timeout,
+                                 label='Generate_VLCM_Draft_Task', max_interval=CHECK_STATUS_INTERVAL,
+                                 on_change=lambda response: LOGGER.info('Generate_VLCM_Draft_Task: details: %s.',
+                                                                        response.extension[response.step]))
+    vlcm_response = poller.wait()
+    generate_vlcm_draft_status = poller.state
+    generate_vlcm_draft_step = utils.response_field(vlcm_response, 'step')
 
     if generate_vlcm_draft_status == 'COMPLETED':
         LOGGER.info("-------Generate vLCM draft successfully.-----")
@@ -118,7 +118,7 @@ class VxRailLCMGetVLCM():
         try:
             # create an instance of the API class
             LOGGER.info("Retrieve cluster vLCM  information")
-            api_instance = vxrail_ansible_utility.VLCMApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('VLCMApi')(utils.get_api_client(self.configuration))
             api_version_string = self.get_versioned_response("GET /lcm/vlcm")
             call_string = 'vlcm_enablement_get_' + api_version_string
             LOGGER.info("Using utility method: %s\n", call_string)
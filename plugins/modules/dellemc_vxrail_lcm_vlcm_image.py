@@ -180,7 +180,7 @@ class VxrailLCMVlcmImage():
         try:
             # create an instance of the API class
             LOGGER.info("Retrieve vLCM image information")
-            api_instance = vxrail_ansible_utility.LCMUpgradeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+            api_instance = utils.api('LCMUpgradeApi')(utils.get_api_client(self.configuration))
             response = self.get_versioned_response(api_instance, "Post /lcm/upgrade/vlcm/image", request_body)
             LOGGER.info("Response: %s\n", response)
         except ApiException as e:
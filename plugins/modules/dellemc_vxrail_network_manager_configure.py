@@ -186,8 +186,8 @@ class VxRailCluster():
         LOGGER.info("Sending Configuration: %s", manager_change_info)
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.PreInstallationStaticIPApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('PreInstallationStaticIPApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post manager configuration
             response = self.get_versioned_response(api_instance, "POST /network/vxrail-manager", manager_change_info)
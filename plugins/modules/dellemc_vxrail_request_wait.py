@@ -0,0 +1,221 @@
+#!/usr/bin/python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: dellemc_vxrail_request_wait
+
+short_description: Wait for several long running operations at once
+
+description:
+- This module will wait for a list of long running operations, which may belong to different VxRail Manager systems,
+  until each of them reaches a terminal state or the timeout expires.
+  All the operations are polled concurrently from a single task, so the tasks that started them do not have to wait.
+options:
+
+  vcadmin:
+    description:
+      Administrative account of the vCenter Server the VxRail Manager is registered to, used for the requests that do not specify one
+    required: False
+    type: str
+
+  vcpasswd:
+    description:
+      The password for the administrator account provided in vcadmin, used for the requests that do not specify one
+    required: False
+    type: str
+
+  requests:
+    description:
+      The long running operations to wait for
+    required: True
+    type: list
+    elements: dict
+    suboptions:
+      vxmip:
+        description: The IP address of the VxRail Manager System which runs the operation
+        required: True
+        type: str
+      request_id:
+        description: The request ID returned when the operation was started
+        required: True
+        type: str
+      vcadmin:
+        description: Administrative account of the vCenter Server, overrides the module level vcadmin
+        required: False
+        type: str
+      vcpasswd:
+        description: The password for the administrator account, overrides the module level vcpasswd
+        required: False
+        type: str
+
+  max_workers:
+    description:
+      Maximum number of status calls sent at the same time
+    required: False
+    type: int
+    default: 16
+
+  max_errors:
+    description:
+      Number of consecutive failed status calls after which an operation is given up on. An operation which is not
+      found or not accessible (ex. wrong request_id or credentials) is given up on at once
+    required: False
+    type: int
+    default: 10
+
+  fail_on_error:
+    description:
+      Whether the module fails when any of the operations did not complete successfully
+    required: False
+    type: bool
+    default: True
+
+  timings:
+    description:
+      Whether the timing of each REST call and API schema fetch (VxRail Manager, method, path, API version, status,
+      bytes, latency and retries) is returned in timings
+    required: False
+    type: bool
+    default: False
+
+  timeout:
+    description:
+      Time out value for waiting on all the operations, the default value is 3600 seconds
+    required: false
+    type: int
+    default: 3600
+
+author:
+    - VxRail Development Team(@VxRailDevTeam) <ansible.team@dell.com>
+
+'''
+
+EXAMPLES = r'''
+    - name: Wait for the compliance reports of all clusters
+      dellemc_vxrail_request_wait:
+        vcadmin: "{{ vcadmin }}"
+        vcpasswd: "{{ vcpasswd }}"
+        requests:
+          - vxmip: "{{ vxmip_1 }}"
+            request_id: "{{ request_id_1 }}"
+          - vxmip: "{{ vxmip_2 }}"
+            request_id: "{{ request_id_2 }}"
+        timeout: "{{ timeout }}"
+'''
+
+RETURN = r'''
+Request_Wait:
+  description: Returns the final state of each operation, in the order of the requests. error is the reason an operation
+    was given up on before the timeout, ex. a wrong request_id or too many failed status calls.
+  returned: always
+  type: list
+  sample: >-
+        [
+            {
+                "vxmip": "172.16.10.100",
+                "request_id": "compliancecheck-57b24b10-0c35-4907-b850-4698ba0149a5",
+                "state": "COMPLETED",
+                "timed_out": false,
+                "error": null,
+                "elapsed": 312.4,
+                "details": [{"id": "compliancecheck-57b24b10-0c35-4907-b850-4698ba0149a5", "state": "COMPLETED",
+                             "progress": 100}]
+            }
+        ]
+timings:
+  description: Timing of each REST call and API schema fetch, in the order they were made. Only returned when timings is true.
+  returned: when timings is true
+  type: list
+  sample: >-
+    [
+        {
+            "time": 1760000000.123,
+            "kind": "api",
+            "vxm": "172.16.10.100",
+            "method": "GET",
+            "path": "/v1/requests/{request_id}",
+            "version": "v1",
+            "status": 200,
+            "bytes": 412,
+            "retries": 0,
+            "latency": 0.1834
+        }
+    ]
+'''
+
+import logging
+import urllib3
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
+
+# Defining global variables
+MODULE = "dellemc_vxrail_request_wait"
+LOG_FILE_PATH = "/tmp/vxrail_ansible_request_wait.log"
+
+LOGGER = utils.get_logger(MODULE, LOG_FILE_PATH, log_devel=logging.DEBUG)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+CHECK_STATUS_INTERVAL = 60
+MAX_ERROR_COUNT = 10
+
+
+def main():
+    ''' Entry point into execution flow '''
+    global module
+    # define available arguments/parameters a user can pass to the module
+    module_args = dict(
+        vcadmin=dict(required=False),
+        vcpasswd=dict(required=False, no_log=True),
+        requests=dict(type='list', elements='dict', required=True, options=dict(
+            vxmip=dict(required=True),
+            request_id=dict(required=True),
+            vcadmin=dict(required=False),
+            vcpasswd=dict(required=False, no_log=True))),
+        max_workers=dict(type='int', default=16),
+        max_errors=dict(type='int', default=MAX_ERROR_COUNT),
+        fail_on_error=dict(type='bool', default=True),
+        timings=dict(type='bool', default=False),
+        timeout=dict(type='int', default=3600)
+    )
+    module = AnsibleModule(
+        argument_spec=module_args,
+        supports_check_mode=True,
+    )
+    requests = []
+    for item in module.params.get('requests'):
+        request = dict(item)
+        request['vcadmin'] = item.get('vcadmin') or module.params.get('vcadmin')
+        request['vcpasswd'] = item.get('vcpasswd') or module.params.get('vcpasswd')
+        if not request['vcadmin'] or not request['vcpasswd']:
+            module.fail_json(msg=f"No vCenter credentials are given for request {item['request_id']} on {item['vxmip']}")
+        requests.append(request)
+    LOGGER.info('----Start to wait for %s requests----', len(requests))
+    pollers = utils.wait_for_requests(requests, LOGGER, module.params.get('timeout'), module.params.get('max_workers'),
+                                      max_interval=CHECK_STATUS_INTERVAL, max_errors=module.params.get('max_errors'))
+    request_wait = []
+    failed_requests = []
+    for request, poller in zip(requests, pollers):
+        details = utils.get_request_info(poller.response) if poller.response else None
+        request_wait.append({'vxmip': request['vxmip'], 'request_id': request['request_id'], 'state': poller.state,
+                             'timed_out': poller.timed_out, 'error': poller.error, 'elapsed': round(poller.elapsed, 1), 'details': details})
+        if poller.state != 'COMPLETED':
+            failed_requests.append(request['request_id'])
+    LOGGER.info('Request_Wait: details: %s.', request_wait)
+    timings = dict(timings=utils.get_timings()) if module.params.get('timings') else {}
+    if failed_requests and module.params.get('fail_on_error'):
+        vx_facts_result = dict(failed=True, Request_Wait=request_wait, **timings,
+                               msg=f"Requests {', '.join(failed_requests)} did not complete. Please see the {LOG_FILE_PATH} for more details")
+        module.exit_json(**vx_facts_result)
+    vx_facts_result = dict(changed=False, Request_Wait=request_wait, **timings,
+                           msg=f"{len(request_wait) - len(failed_requests)} of {len(request_wait)} requests completed. "
+                               f"Please see the {LOG_FILE_PATH} for more details")
+    module.exit_json(**vx_facts_result)
+
+
+if __name__ == "__main__":
+    main()
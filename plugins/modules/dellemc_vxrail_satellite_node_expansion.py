@@ -218,14 +218,13 @@ expansion_status:
 
 import traceback
 import logging
-import time
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 
 try:
     import urllib3
+    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     import vxrail_ansible_utility
     from vxrail_ansible_utility.rest import ApiException
-    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     LOGGER = utils.get_logger("dellemc_vxrail_satellite_node_expansion", "/tmp/vxrail_ansible_satellite_node_expansion.log",
                               log_devel=logging.DEBUG)
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -334,8 +333,8 @@ class VxRailSatelliteNode():
         return api_satellite_node_expansion_cancel_post()
 
     def cancel_expansion(self):
-        api_instance = vxrail_ansible_utility.SatelliteNodeExpansionApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SatelliteNodeExpansionApi')(
+            utils.get_api_client(self.configuration))
         try:
             # cancel cluster expansion
             self.get_versioned_response_cancel_expansion(api_instance, "Post /host-folder/expansion/cancel")
@@ -362,8 +361,8 @@ class VxRailSatelliteNode():
     def start_expansion(self, expansion_json):
         request_body = expansion_json
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SatelliteNodeExpansionApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SatelliteNodeExpansionApi')(
+            utils.get_api_client(self.configuration))
         try:
             # start cluster expansion
             response = self.get_versioned_response_start_expansion(api_instance, "Post /host-folder/expansion", request_body)
@@ -376,7 +375,7 @@ class VxRailSatelliteNode():
     def get_request_status(self, request_id):
         job_id = request_id
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.RequestStatusApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('RequestStatusApi')(utils.get_api_client(self.configuration))
         try:
             response = api_instance.v1_request_id_get(job_id)
         except ApiException as e:
@@ -504,7 +503,6 @@ def main():
         expansion_status = 0
         expansion_result = 0
         error = 0
-        time_out = 0
         time_sleep = 30
         expansion_request_id = 0
         initial_timeout = module.params.get('timeout')
@@ -517,15 +515,13 @@ def main():
                 msg="Expansion request id is not returned. Please see the /tmp/vxrail_ansible_satellite_node_expansion.log for more details")
         else:
             LOGGER.info('Satellite_node_expansion: VxRail task_ID: %s.', expansion_request_id)
-            while expansion_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-                expansion_response = VxRailSatelliteNode().get_request_status(expansion_request_id)
-                expansion_status = expansion_response.state
-                expansion_result = VxRailSatelliteNode().get_request_info(expansion_response)
-                LOGGER.info('Expansion_Task: status: %s.', expansion_status)
-                LOGGER.info('Expansion_Task: details: %s.', expansion_result)
-                LOGGER.info('Expansion Task: sleeping %s seconds...', time_sleep)
-                time.sleep(time_sleep)
-                time_out = time_out + time_sleep
+            satellite_node = VxRailSatelliteNode()
+            poller = utils.RequestPoller(lambda: satellite_node.get_request_status(expansion_request_id), LOGGER,
+                                         initial_timeout, label='Expansion_Task', max_interval=time_sleep)
+            expansion_response = poller.wait()
+            expansion_status = poller.state
+            expansion_result = satellite_node.get_request_info(expansion_response)
+            LOGGER.info('Expansion_Task: details: %s.', expansion_result)
             if expansion_status == 'COMPLETED':
                 LOGGER.info("-----Expansion Completed-----")
             else:
@@ -84,9 +84,9 @@ LOG_FILE_NAME = "/tmp/vxrail_ansible_satellite_node_remove.log"
 
 try:
     import urllib3
+    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     import vxrail_ansible_utility
     from vxrail_ansible_utility.rest import ApiException
-    from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
     LOGGER = utils.get_logger("dellemc_vxrail_satellite_node_remove", LOG_FILE_NAME, log_devel=logging.DEBUG)
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 except ImportError:
@@ -138,7 +138,7 @@ class VxRailRemoveSatelliteNode():
 
     def remove_satellite_node(self, host_sn):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SatelliteNodeExpansionApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SatelliteNodeExpansionApi')(utils.get_api_client(self.configuration))
         try:
             # start Node Removal
             self.get_versioned_response(api_instance, "Delete /host-folder/hosts/{sn}", host_sn)
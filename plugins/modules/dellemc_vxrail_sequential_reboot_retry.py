@@ -159,8 +159,8 @@ class VxRailCluster():
             for hostname in self.hosts:
                 sequential_reboot_retry_info['hosts'].append({'hostname':hostname})
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SequentialRebootApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SequentialRebootApi')(
+            utils.get_api_client(self.configuration))
         LOGGER.info(sequential_reboot_retry_info)
         try:
             # post sequential reboot apply
@@ -184,7 +184,7 @@ class VxRailCluster():
 
     def get_stig_info(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.STIGInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('STIGInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query STIG information
             response = self.get_versioned_response(api_instance, "GET /stig/info")
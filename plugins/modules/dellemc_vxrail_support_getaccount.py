@@ -130,7 +130,7 @@ class VxRailSupport():
     def get_support_account(self):
         supportInfo = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SupportAccountApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SupportAccountApi')(utils.get_api_client(self.configuration))
         try:
             # query v1 support account
             response = self.get_versioned_response(api_instance, 'Get /support/account')
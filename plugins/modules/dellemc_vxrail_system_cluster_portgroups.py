@@ -86,7 +86,6 @@ Cluster_Portgroups:
     }
 '''
 
-from functools import reduce
 import logging
 import urllib3
 from ansible.module_utils.basic import AnsibleModule
@@ -144,7 +143,7 @@ class VxRailCluster():
 
     def get_cluster_portgroups(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemNetworkApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemNetworkApi')(utils.get_api_client(self.configuration))
         try:
             # query system cluster-portgroup information
             response = self.get_versioned_response(api_instance, "GET /system/cluster-portgroups", self.node_fqdn)
@@ -158,7 +157,7 @@ class VxRailCluster():
         return self._get_portgroup_info_list(self._generate_cluster_portgroup_info_from_response_data, datalist)
 
     def _get_portgroup_info_list(self, generate_func, data_list):
-        return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+        return [generate_func(data) for data in data_list]
 
     def _generate_cluster_portgroup_info_from_response_data(self, data):
         portgroup_info = {}
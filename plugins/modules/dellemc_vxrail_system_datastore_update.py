@@ -134,8 +134,8 @@ class VxRailCluster():
         # create an instance of the API class
 
 
-        api_instance = vxrail_ansible_utility.DatastoreIDUpdateApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('DatastoreIDUpdateApi')(
+            utils.get_api_client(self.configuration))
         LOGGER.info(datastore_id_update_info)
         try:
             # patch datastore ID update
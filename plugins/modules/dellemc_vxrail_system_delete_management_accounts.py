@@ -148,7 +148,7 @@ class VxRailCluster():
         account_info['username'] = self.username
         account_info['vc_admin_user'] = {'username': self.vc_admin, 'password': self.vc_password}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ManagementAccountApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ManagementAccountApi')(utils.get_api_client(self.configuration))
         try:
             # query management account information
             response = self.get_versioned_response(api_instance, API, account_info)
@@ -130,7 +130,7 @@ class VxRailCluster():
 
     def disable_proxy_settings(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemProxySettingsApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemProxySettingsApi')(utils.get_api_client(self.configuration))
         try:
             # disable proxy configuration
             response = self.get_versioned_response(api_instance, "DELETE /system/proxy")
@@ -168,8 +168,8 @@ class VxRailCluster():
             dns_change_info['upstream_dns'] = self.upstream_dns
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post dns information
             response = self.get_versioned_response(api_instance, "POST /system/dns", dns_change_info)
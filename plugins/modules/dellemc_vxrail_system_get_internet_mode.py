@@ -131,7 +131,7 @@ class VxRailCluster():
     def get_internet_mode(self):
         internet_mode_info = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemNetworkApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemNetworkApi')(utils.get_api_client(self.configuration))
         try:
             # query internet mode information
             response = self.get_versioned_response(api_instance, "GET /system/internet-mode")
@@ -135,7 +135,7 @@ class VxRailCluster():
 
     def get_management_accounts(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.ManagementAccountApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('ManagementAccountApi')(utils.get_api_client(self.configuration))
         try:
             # query management account information
             response = self.get_versioned_response(api_instance, API)
@@ -135,7 +135,7 @@ class VxRailCluster():
     def get_proxy_settings(self):
         proxy_info = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemProxySettingsApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemProxySettingsApi')(utils.get_api_client(self.configuration))
         try:
             # query proxy information
             response = self.get_versioned_response(api_instance, "GET /system/proxy")
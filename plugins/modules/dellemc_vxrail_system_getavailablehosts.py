@@ -136,7 +136,7 @@ class VxRailSystem():
 
     def get_system_available_hosts(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(utils.get_api_client(self.configuration))
         try:
             # query system available hosts api
             response = self.get_versioned_response(api_instance, "GET /system/available-hosts")
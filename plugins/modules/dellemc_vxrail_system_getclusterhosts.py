@@ -95,7 +95,6 @@ Hosts_Information:
                 "segment_label": null
         }
 '''
-from functools import reduce
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 from vxrail_ansible_utility.rest import ApiException
 import vxrail_ansible_utility
@@ -152,8 +151,8 @@ class VxRailHosts():
 
     def get_system_cluster_hosts(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # get all cluster hosts information
             response = self.get_versioned_response(api_instance, "GET /system/cluster-hosts")
@@ -168,7 +167,7 @@ class VxRailHosts():
         return self._get_info_list(self._generate_host_info_from_response_data, datalist)
 
     def _get_info_list(self, generate_func, data_list):
-        return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+        return [generate_func(data) for data in data_list]
 
     def _generate_host_info_from_response_data(self, data):
         host_info = {}
@@ -140,7 +140,7 @@ class VxRailCluster():
 
     def get_precheck_profiles(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # query Prechecks Profiles API
             response = self.get_versioned_response(api_instance, "GET /system/prechecks/profiles")
@@ -201,7 +201,7 @@ class VxRailCluster():
 
     def get_all_prechecks_reports(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # Get all prechecks results
             response = self.get_versioned_response(api_instance, "GET /system/prechecks/results")
@@ -215,7 +215,7 @@ class VxRailCluster():
 
     def get_one_precheck_report(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # Get one prechecks result
             response = self.get_versioned_response(api_instance, "GET /system/prechecks/{id}/result")
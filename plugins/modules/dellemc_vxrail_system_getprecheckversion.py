@@ -123,7 +123,7 @@ class VxRailCluster():
     def get_precheck_version(self):
         PrecheckVersion = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # query System Precheck Version information
             response = self.get_versioned_response(api_instance, "GET /system/prechecks/precheck-service-version")
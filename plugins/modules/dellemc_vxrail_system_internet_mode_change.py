@@ -139,7 +139,7 @@ class VxRailCluster():
         internet_mode_info = {}
         internet_mode_info['is_dark_site'] = self.is_dark_site
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemNetworkApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemNetworkApi')(utils.get_api_client(self.configuration))
         try:
             # put internet mode information
             response = self.get_versioned_response(api_instance, "PUT /system/internet-mode", internet_mode_info)
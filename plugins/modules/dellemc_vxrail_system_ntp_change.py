@@ -161,8 +161,8 @@ class VxRailCluster():
         }
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post ntp information
             response = self.get_versioned_response(api_instance, "POST /system/ntp", ntp_change_info)
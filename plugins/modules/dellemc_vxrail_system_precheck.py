@@ -304,7 +304,7 @@ class VxRailCluster():
     def post_system_precheck(self):
         # create an instance of the API class
         response = ''
-        api_instance = vxrail_ansible_utility.SystemPreCheckApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemPreCheckApi')(utils.get_api_client(self.configuration))
         try:
             # post system precheck
             response = self.get_versioned_response(api_instance, "POST /system/precheck")
@@ -156,8 +156,8 @@ class VxRailCluster():
         }
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemInformationApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemInformationApi')(
+            utils.get_api_client(self.configuration))
         LOGGER.info(primary_storage_provision_info)
         try:
             # patch datastore ID update
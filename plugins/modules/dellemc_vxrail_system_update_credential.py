@@ -157,8 +157,8 @@ class VxRailCluster():
 
     def post_system_update_credential(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemCredentialsApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemCredentialsApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post system updated credential
             response = self.get_versioned_response(api_instance, "Post /system/update-credential")
@@ -206,7 +206,7 @@ class VxRailCluster():
         proxy_change_info["proxy_spec"] = spec_info
 
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.SystemProxySettingsApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemProxySettingsApi')(utils.get_api_client(self.configuration))
         try:
             # update proxy information
             response = self.get_versioned_response(api_instance, "PATCH /system/proxy", proxy_change_info)
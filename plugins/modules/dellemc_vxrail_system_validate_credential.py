@@ -227,8 +227,8 @@ class VxRailCluster():
                 }
             ]
             credential_info["hosts"] = hosts_spec
-        api_instance = vxrail_ansible_utility.SystemCredentialsApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('SystemCredentialsApi')(
+            utils.get_api_client(self.configuration))
         try:
             response = self.get_versioned_response(api_instance, 'POST /system/validate-credential', credential_info)
         except ApiException as e:
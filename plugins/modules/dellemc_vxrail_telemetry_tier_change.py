@@ -139,8 +139,8 @@ class VxRailCluster():
         tier_info = {}
         tier_info['level'] = self.tier
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.TelemetryReportingApi(
-            vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('TelemetryReportingApi')(
+            utils.get_api_client(self.configuration))
         try:
             # post telemetry information
             response = self.get_versioned_response(api_instance, "POST /telemetry/tier", tier_info)
@@ -126,7 +126,7 @@ class VxRailCluster():
     def get_vc_mode(self):
         VCModeInfo = {}
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VCenterServerModeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VCenterServerModeApi')(utils.get_api_client(self.configuration))
         try:
             # query VC Mode information
             response = self.get_versioned_response(api_instance, "GET /vc/mode")
@@ -93,7 +93,6 @@ import urllib3
 from ansible.module_utils.basic import AnsibleModule
 import vxrail_ansible_utility
 from vxrail_ansible_utility.rest import ApiException
-import time
 from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
 
 # Defining global variables
@@ -162,7 +161,7 @@ class VxRailCluster():
 
     def patch_vc_mode(self):
         # create an instance of the API class
-        api_instance = vxrail_ansible_utility.VCenterServerModeApi(vxrail_ansible_utility.ApiClient(self.configuration))
+        api_instance = utils.api('VCenterServerModeApi')(utils.get_api_client(self.configuration))
         try:
             # patch vc mode
             response = self.get_versioned_response(api_instance, "Patch /vc/mode")
@@ -192,7 +191,6 @@ def main():
         supports_check_mode=True,
     )
     result_status = 0
-    time_out = 0
     initial_timeout = module.params.get('timeout')
     LOGGER.info('----Start to change vc mode: ----')
     result_request_id = VxRailCluster().patch_vc_mode()
@@ -200,16 +198,12 @@ def main():
     if result_request_id == "error":
         module.fail_json(
             msg=f"The request id is not returned. Please see the log file {LOG_FILE_PATH} for more details")
-    while result_status not in ('COMPLETED', 'FAILED') and time_out < initial_timeout:
-        result_response = utils.get_request_status(vxm_ip=module.params.get('vxmip'), vcadmin=module.params.get('vcadmin'),
-                                                   vcpasswd=module.params.get('vcpasswd'), logger=LOGGER,
-                                                   request_id=result_request_id)
-        result_status = result_response.state
-        LOGGER.info('ConvertVC_Task: status: %s.', result_status)
-        LOGGER.info('ConvertVC_Task: details: %s.', result_response)
-        LOGGER.info("ConvertVC_Task: Sleeping %s seconds...", CHECK_STATUS_INTERVAL)
-        time.sleep(CHECK_STATUS_INTERVAL)
-        time_out = time_out + CHECK_STATUS_INTERVAL
+    poller = utils.wait_for_request(module.params.get('vxmip'), module.params.get('vcadmin'), module.params.get('vcpasswd'),
+                                    result_request_id, LOGGER, initial_timeout, label='ConvertVC_Task',
+                                    max_interval=CHECK_STATUS_INTERVAL)
+    result_response = poller.response
+    result_status = poller.state
+    LOGGER.info('ConvertVC_Task: details: %s.', result_response)
     if result_status == 'COMPLETED':
         LOGGER.info("-------ConvertVC_Task is successful.-----")
     else:
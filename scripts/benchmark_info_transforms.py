@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Benchmark of the conversion of the hosts and chassis API responses into module results.
+
+Builds synthetic responses (64 hosts with 24 disks, 8 NICs and 2 boot devices each, 16 chassis of 4 hosts) and times
+the transforms of dellemc_vxrail_hosts_get and dellemc_vxrail_chassis_get, as shipped, with the former
+reduce-based list building, which copies the result list for every element, and with the include option.
+Requires the collection and the vxrail_ansible_utility SDK to be installed (ex: ansible-galaxy collection install).
+
+usage: python scripts/benchmark_info_transforms.py [--hosts 64] [--disks 24] [--repeat 20]
+'''
+
+import argparse
+import json
+import timeit
+from functools import reduce
+
+from ansible_collections.dellemc.vxrail.plugins.modules import dellemc_vxrail_chassis_get as chassis_get
+from ansible_collections.dellemc.vxrail.plugins.modules import dellemc_vxrail_hosts_get as hosts_get
+
+API_VERSION_NUMBER = 16
+
+
+class Payload():
+    ''' Stands for a response model object: the fields which are not given are None '''
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+    def __getattr__(self, name):
+        return None
+
+
+def make_host(index, disks, nics, boot_devices):
+    return Payload(
+        id='host-{}'.format(index), sn='SN{:06d}'.format(index), slot=index, hostname='esx{}.example.com'.format(index),
+        health='Healthy', missing=False, dpus=[], gpus=[],
+        boot_devices=[Payload(id='boot-{}'.format(i), sn='BSN{}'.format(i), capacity='240GB') for i in range(boot_devices)],
+        nics=[Payload(id='nic-{}'.format(i), mac='00:00:00:00:00:{:02x}'.format(i), link_speed='25Gb',
+                      drivers=[Payload(driver_name='i40en', driver_version='1.0')]) for i in range(nics)],
+        disks=[Payload(id='disk-{}'.format(i), sn='DSN{}'.format(i), disk_type='SSD', capacity='1.92TB', slot=i)
+               for i in range(disks)],
+        firmware_info=Payload(bios_revision='2.1.0', bmc_revision='5.0'),
+        geo_location=Payload(rack_name='rack-1', order_number=1))
+
+
+def new_transform(cls, include=None):
+    # The module classes read their parameters from AnsibleModule in __init__, which is not needed here
+    transform = cls.__new__(cls)
+    transform.api_version_number = API_VERSION_NUMBER
+    transform.include = include
+    transform.exclude = None
+    return transform
+
+
+def reduce_info_list(self, generate_func, data_list):
+    return reduce(lambda infos, data: infos + [generate_func(data)], data_list, [])
+
+
+def bench(name, cls, convert, payload, repeat):
+    transform = new_transform(cls)
+    linear = min(timeit.repeat(lambda: convert(transform, payload), number=1, repeat=repeat))
+    baseline = new_transform(cls)
+    baseline._get_info_list = reduce_info_list.__get__(baseline, cls)
+    quadratic = min(timeit.repeat(lambda: convert(baseline, payload), number=1, repeat=repeat))
+    assert convert(transform, payload) == convert(baseline, payload)
+    print('{:<8} list comprehension {:8.2f} ms   reduce {:8.2f} ms   speedup x{:.2f}'.format(
+        name, linear * 1000, quadratic * 1000, quadratic / linear))
+    projected = new_transform(cls, include=['sn', 'health'])
+    sparse = min(timeit.repeat(lambda: convert(projected, payload), number=1, repeat=repeat))
+    print('{:<8} include sn,health  {:8.2f} ms   facts {} -> {} bytes'.format(
+        name, sparse * 1000, len(json.dumps(convert(transform, payload))), len(json.dumps(convert(projected, payload)))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--hosts', type=int, default=64)
+    parser.add_argument('--disks', type=int, default=24)
+    parser.add_argument('--nics', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    hosts = [make_host(i, args.disks, args.nics, 2) for i in range(args.hosts)]
+    chassis = [Payload(id='chassis-{}'.format(i), sn='CSN{}'.format(i), hosts=hosts[i * 4:i * 4 + 4],
+                       power_supplies=[Payload(id='psu-1'), Payload(id='psu-2')]) for i in range(args.hosts // 4)]
+
+    bench('hosts', hosts_get.VxRailHosts,
+          lambda transform, data: transform._get_info_list(transform._generate_host_info_from_response_data, data),
+          hosts, args.repeat)
+    bench('chassis', chassis_get.VxRailHosts,
+          lambda transform, data: transform._get_info_list(transform._generate_chassis_info, data),
+          chassis, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
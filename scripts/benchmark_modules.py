@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Benchmark of the modules end to end, against the local mock VxRail Manager (see scripts/mock_vxm_server.py) or a
+given VxRail Manager.
+
+Each module is run --repeat times as Ansible runs it, in its own Python process with its arguments file, and the wall
+time, the requests received by the mock (by method and path) and the peak memory of the process are reported, along
+with the failures. The API schema cache is cleared before each run with --cold, and kept between the runs otherwise.
+Requires the collection and the vxrail_ansible_utility SDK to be installed (ex: ansible-galaxy collection install).
+
+usage: python scripts/benchmark_modules.py [--modules hosts_get system_get] [--repeat 5] [--nodes 16] [--latency 0.05]
+       python scripts/benchmark_modules.py --vxmip 172.16.10.100 --vcadmin ... --vcpasswd ... --modules system_get
+'''
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import mock_vxm_server  # noqa: E402
+
+COLLECTION = 'ansible_collections.dellemc.vxrail.plugins.modules.dellemc_vxrail_'
+# Arguments of each benchmarked module, besides vxmip, vcadmin and vcpasswd
+SCENARIOS = {
+    'getsysteminfo': {},
+    'getclusterinfo': {},
+    'hosts_get': {},
+    'chassis_get': {},
+    'get_disks': {},
+    'callhome_info': {},
+    'fleet_info': {'resources': ['system', 'hosts', 'chassis', 'disks']},
+    'lcm_precheck': {'bundle_file_locator': '/data/store2/bundle.zip', 'vc_root_account': 'root', 'vc_root_passwd': 'mock',
+                     'vxm_root_account': 'root', 'vxm_root_passwd': 'mock'},
+}
+
+
+def module_file(name):
+    spec = importlib.util.find_spec(COLLECTION + name)
+    if spec is None:
+        sys.exit('Module dellemc_vxrail_{} is not installed'.format(name))
+    return spec.origin
+
+
+def module_arguments(name, args):
+    arguments = dict(SCENARIOS[name], vcadmin=args.vcadmin, vcpasswd=args.vcpasswd)
+    if name == 'fleet_info':
+        arguments['managers'] = [{'vxmip': args.vxmip}]
+    else:
+        arguments['vxmip'] = args.vxmip
+    return {'ANSIBLE_MODULE_ARGS': arguments}
+
+
+def mock_request(args, path, method='GET'):
+    context = ssl._create_unverified_context()
+    request = urllib.request.Request('https://{}{}'.format(args.vxmip, path), method=method)
+    with urllib.request.urlopen(request, context=context) as response:
+        return json.loads(response.read())
+
+
+def bench(name, args, env, workdir):
+    path = module_file(name)
+    args_file = os.path.join(workdir, name + '.json')
+    with open(args_file, 'w') as f:
+        json.dump(module_arguments(name, args), f)
+    walls, requests, failures = [], [], []
+    memory = 0
+    for _ in range(args.repeat):
+        if args.cold:
+            shutil.rmtree(env['VXRAIL_SCHEMA_CACHE_DIR'], ignore_errors=True)
+        if args.mock:
+            mock_request(args, '/mock/reset', 'POST')
+        wall, max_rss, result = run_module(path, args_file, env)
+        walls.append(wall)
+        memory = max(memory, max_rss)
+        if result.get('failed'):
+            failures.append(result.get('msg'))
+        if args.mock:
+            requests.append(mock_request(args, '/mock/stats'))
+    row = {'module': name, 'runs': args.repeat, 'failures': len(failures),
+           'wall_median': statistics.median(walls), 'wall_min': min(walls), 'wall_max': max(walls), 'max_rss_kb': memory}
+    if requests:
+        row['requests'] = requests[-1]['requests']
+        row['by_path'] = requests[-1]['by_path']
+    if failures:
+        row['last_failure'] = failures[-1]
+    return row
+
+
+def run_module(path, args_file, env):
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        started_at = time.monotonic()
+        process = subprocess.Popen([sys.executable, path, args_file], stdout=stdout, stderr=stderr, env=env)
+        # wait4 gives the resource usage of this process alone
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.monotonic() - started_at
+        process.returncode = os.waitstatus_to_exitcode(status)
+        stdout.seek(0)
+        stderr.seek(0)
+        output, errors = stdout.read(), stderr.read()
+    try:
+        result = json.loads(output)
+    except ValueError:
+        result = {'failed': True, 'msg': (errors or output).decode('utf-8', 'replace').strip()[-500:]}
+    return wall, usage.ru_maxrss, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--cold', action='store_true', help='clear the API schema cache before each run')
+    parser.add_argument('--vxmip', help='VxRail Manager to use instead of the mock')
+    parser.add_argument('--vcadmin', default='administrator@vsphere.local')
+    parser.add_argument('--vcpasswd', default='mock')
+    parser.add_argument('--json', help='file to write the results to')
+    mock_vxm_server.add_mock_arguments(parser)
+    parser.set_defaults(task_duration=2.0)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='vxrail_benchmark_')
+    server = None
+    args.mock = args.vxmip is None
+    if args.mock:
+        server = mock_vxm_server.start_server(mock_vxm_server.mock_from_arguments(args))
+        args.vxmip = '127.0.0.1:{}'.format(server.server_address[1])
+    env = dict(os.environ, VXRAIL_SCHEMA_CACHE_DIR=os.path.join(workdir, 'schema_cache'),
+               VXRAIL_PRECHECK_CACHE='off')
+    rows = []
+    try:
+        print('{:<16} {:>6} {:>10} {:>10} {:>10} {:>9} {:>11}'.format(
+            'module', 'failed', 'median s', 'min s', 'max s', 'requests', 'max rss kB'))
+        for name in args.modules:
+            row = bench(name, args, env, workdir)
+            rows.append(row)
+            print('{module:<16} {failures:>6} {wall_median:>10.3f} {wall_min:>10.3f} {wall_max:>10.3f} {0:>9} {max_rss_kb:>11}'.format(
+                row.get('requests', '-'), **row))
+            if row.get('last_failure'):
+                print('    last failure: {}'.format(row['last_failure']))
+    finally:
+        if server is not None:
+            server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
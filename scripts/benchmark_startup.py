@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Benchmark of the startup time of the modules, that is the time to import them, which is paid by every task.
+
+Each module is imported --repeat times in a new Python process with -X importtime. The best wall time of the
+process, the cumulative import time of the module and of the vxrail_ansible_utility SDK, the number of SDK modules
+imported and the --top slowest imports (by their own time) are reported. The module code itself (main) is not run.
+Requires the collection and the vxrail_ansible_utility SDK to be installed (ex: ansible-galaxy collection install).
+
+usage: python scripts/benchmark_startup.py [--modules hosts_get system_get] [--repeat 5] [--top 3] [--json startup.json]
+'''
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+COLLECTION = 'ansible_collections.dellemc.vxrail.plugins.modules'
+PREFIX = 'dellemc_vxrail_'
+SDK_PACKAGE = 'vxrail_ansible_utility'
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def installed_modules():
+    spec = importlib.util.find_spec(COLLECTION)
+    if spec is None:
+        sys.exit('The dellemc.vxrail collection is not installed')
+    names = []
+    for location in spec.submodule_search_locations:
+        names.extend(f[len(PREFIX):-3] for f in os.listdir(location) if f.startswith(PREFIX) and f.endswith('.py'))
+    return sorted(names)
+
+
+def import_module(name):
+    started_at = time.monotonic()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import {}.{}{}'.format(COLLECTION, PREFIX, name)],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    wall = time.monotonic() - started_at
+    sample = {'wall': wall, 'module_us': 0, 'sdk_us': 0, 'sdk_modules': 0, 'imports': {}, 'error': None}
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, package = int(match.group(1)), int(match.group(2)), match.group(4)
+        sample['imports'][package] = self_us
+        if package == '{}.{}{}'.format(COLLECTION, PREFIX, name):
+            sample['module_us'] = cumulative_us
+        if package == SDK_PACKAGE or package.startswith(SDK_PACKAGE + '.'):
+            # Self times, as the cumulative ones of nested SDK modules would be counted twice
+            sample['sdk_us'] += self_us
+            sample['sdk_modules'] += 1
+    if process.returncode != 0:
+        sample['error'] = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else 'exit status {}'.format(
+            process.returncode)
+    return sample
+
+
+def bench(name, repeat, top):
+    samples = [import_module(name) for _ in range(repeat)]
+    best = min(samples, key=lambda sample: sample['wall'])
+    slowest = sorted(best.pop('imports').items(), key=lambda item: item[1], reverse=True)[:top]
+    return dict(best, module_us=min(sample['module_us'] for sample in samples),
+                sdk_us=min(sample['sdk_us'] for sample in samples), slowest=slowest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modules', nargs='+', help='modules to import, without the dellemc_vxrail_ prefix (all by default)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=3, help='number of slowest imports reported per module')
+    parser.add_argument('--json', help='file to write the results to')
+    args = parser.parse_args()
+
+    rows = []
+    print('{:<36} {:>9} {:>10} {:>9} {:>11}  {}'.format('module', 'wall ms', 'module ms', 'sdk ms', 'sdk modules',
+                                                        'slowest imports'))
+    for name in args.modules or installed_modules():
+        row = dict(bench(name, args.repeat, args.top), module=name)
+        rows.append(row)
+        print('{:<36} {:>9.1f} {:>10.1f} {:>9.1f} {:>11}  {}'.format(
+            name, row['wall'] * 1000, row['module_us'] / 1000, row['sdk_us'] / 1000, row['sdk_modules'],
+            ', '.join('{} {:.1f}'.format(package, self_us / 1000) for package, self_us in row['slowest'])))
+        if row['error']:
+            print('    failed: {}'.format(row['error']))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
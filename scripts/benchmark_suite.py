@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Regression benchmarks of module_utils and of the module transforms, against stored baselines.
+
+Times, on synthetic payloads of 3, 16 and 64 nodes:
+  - APIVersionHandler.get_highest_module_version_from_schema on a multi-MB schema of 64 resources in 16 versions
+  - the extraction of the paths from the YAML of a schema of 16 resources in 8 versions (load_api_schema_paths)
+  - get_request_info on a request status whose extension lists every node
+  - the hosts and chassis transforms of dellemc_vxrail_hosts_get and dellemc_vxrail_chassis_get
+  - the nested report transforms of dellemc_vxrail_system_getprechecksreport
+Each time is divided by the time of a fixed pure Python workload measured in the same run, so that the baselines
+hold across machines of different speeds. A case fails when its normalized time exceeds its baseline by more than
+--threshold (ex: 1.5 for 50% slower), and the script then exits with status 1.
+Requires the collection and the vxrail_ansible_utility SDK to be installed (ex: ansible-galaxy collection install).
+
+usage: python scripts/benchmark_suite.py [--threshold 1.5] [--cases hosts chassis] [--save]
+'''
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from benchmark_info_transforms import Payload, make_host, new_transform  # noqa: E402
+
+from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils  # noqa: E402
+from ansible_collections.dellemc.vxrail.plugins.modules import dellemc_vxrail_chassis_get as chassis_get  # noqa: E402
+from ansible_collections.dellemc.vxrail.plugins.modules import dellemc_vxrail_hosts_get as hosts_get  # noqa: E402
+from ansible_collections.dellemc.vxrail.plugins.modules import dellemc_vxrail_system_getprechecksreport as prechecks_report  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines.json')
+NODES = (3, 16, 64)
+LOGGER = logging.getLogger('benchmark_suite')
+
+
+def calibration():
+    ''' Fixed workload of dictionary and list building, the unit of the normalized times '''
+    rows = []
+    for i in range(2000):
+        rows.append({'id': i, 'name': 'row-{}'.format(i), 'values': [i, i * 2, i * 3]})
+    return sorted(rows, key=lambda row: -row['id'])
+
+
+def make_schema(resources=64, versions=16):
+    operation = {'tags': ['resource'], 'summary': 'Operation of the resource', 'description': 'd' * 400,
+                 'parameters': [{'name': 'sn', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+                 'responses': {code: {'description': 'r' * 200, 'content': {'application/json': {'schema': {
+                     'type': 'object', 'properties': {'field{}'.format(i): {'type': 'string', 'description': 'f' * 40}
+                                                      for i in range(20)}}}}} for code in ('200', '400', '404', '500')}}
+    paths = {}
+    for resource in range(resources):
+        for version in range(1, versions + 1):
+            for suffix in ('', '/{sn}', '/{sn}/status'):
+                paths['/v{}/resource{}{}'.format(version, resource, suffix)] = {'get': operation, 'post': operation}
+    return {'openapi': '3.0.0', 'info': {'version': '8.0.300-28000000'}, 'paths': paths}
+
+
+def make_schema_yaml(schema):
+    # Written out in full like the schema of the VxRail Manager, PyYAML would otherwise use aliases for the shared operation
+    import yaml
+
+    class Dumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):
+        def ignore_aliases(self, data):
+            return True
+
+    return yaml.dump(schema, Dumper=Dumper).encode('utf_8')
+
+
+def make_request_status(nodes):
+    extension = {'hosts': [{'sn': 'V{:06d}'.format(i), 'status': 'COMPLETED', 'steps': ['precheck', 'upgrade', 'reboot']}
+                           for i in range(nodes)]}
+    return Payload(id='request-1', owner='LCM', state='COMPLETED', progress=100, start_time=1700000000000,
+                   end_time=1700007200000, step='Completed', detail='Upgrade completed', extension=str(extension))
+
+
+def make_prechecks_report(nodes, checks=40, messages=3):
+    def check(index):
+        return Payload(status='COMPLETED', check_id='check-{}'.format(index), start_time=1700000000000,
+                       end_time=1700000001000, plugin_name='plugin-{}'.format(index % 8), plugin_version='1.0',
+                       result=Payload(severity='WARNING', messages=[
+                           Payload(id='msg-{}'.format(m), kb='KB{}'.format(m), action='Check the configuration',
+                                   alphaid='VXR{:06d}'.format(m), symptom='Symptom of the check', severity='WARNING')
+                           for m in range(messages)]))
+    results = Payload(host_checks=[Payload(host_id='host-{}'.format(i), checks=[check(c) for c in range(checks)])
+                                   for i in range(nodes)],
+                      general_checks=[check(c) for c in range(checks)])
+    return [Payload(id='report-{}'.format(r), profile='LCM', status='COMPLETED', progress=100, total_severity='WARNING',
+                    complete_check_count=checks, total_success_count=checks, total_warn_count=0, total_error_count=0,
+                    results=results) for r in range(3)]
+
+
+def make_chassis(hosts):
+    return [Payload(id='chassis-{}'.format(i), sn='CSN{}'.format(i), hosts=hosts[i * 4:i * 4 + 4],
+                    power_supplies=[Payload(id='psu-1'), Payload(id='psu-2')]) for i in range((len(hosts) + 3) // 4)]
+
+
+def cases(selected):
+    ''' Yields (name, function) of the benchmarked calls '''
+    if 'schema' in selected:
+        schema = make_schema()
+        LOGGER.info('Schema of %s paths, %.1f MB as JSON', len(schema['paths']), len(json.dumps(schema)) / 1e6)
+        handler = utils.APIVersionHandler('benchmark', LOGGER)
+        yield 'schema.highest_version', lambda: handler.get_highest_module_version_from_schema(schema, 'GET /resource42/{sn}')
+    if 'schema_yaml' in selected:
+        document = make_schema_yaml(make_schema(resources=16, versions=8))
+        LOGGER.info('Schema YAML of %.1f MB', len(document) / 1e6)
+        yield 'schema.yaml_paths', lambda: utils.load_api_schema_paths(document)
+    for nodes in NODES:
+        if 'request_info' in selected:
+            status = make_request_status(nodes)
+            yield 'request_info.{}_nodes'.format(nodes), lambda status=status: utils.get_request_info(status)
+        hosts = [make_host(i, 24, 8, 2) for i in range(nodes)]
+        if 'hosts' in selected:
+            transform = new_transform(hosts_get.VxRailHosts)
+            yield 'hosts.{}_nodes'.format(nodes), lambda transform=transform, hosts=hosts: transform._get_info_list(
+                transform._generate_host_info_from_response_data, hosts)
+        if 'chassis' in selected:
+            transform = new_transform(chassis_get.VxRailHosts)
+            chassis = make_chassis(hosts)
+            yield 'chassis.{}_nodes'.format(nodes), lambda transform=transform, chassis=chassis: transform._get_info_list(
+                transform._generate_chassis_info, chassis)
+        if 'prechecks_report' in selected:
+            # The module class reads its parameters from AnsibleModule in __init__, which is not needed here
+            transform = prechecks_report.VxRailCluster.__new__(prechecks_report.VxRailCluster)
+            reports = make_prechecks_report(nodes)
+            yield 'prechecks_report.{}_nodes'.format(nodes), lambda transform=transform, reports=reports: \
+                transform._get_report_list_from_precheck_results(reports)
+
+
+def measure(function, repeat):
+    # Enough calls per sample for the timer resolution, the best sample is the least disturbed one
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cases', nargs='+', choices=['schema', 'schema_yaml', 'request_info', 'hosts', 'chassis', 'prechecks_report'],
+                        default=['schema', 'schema_yaml', 'request_info', 'hosts', 'chassis', 'prechecks_report'])
+    parser.add_argument('--threshold', type=float, default=1.5, help='allowed ratio to the baselines')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--baselines', default=BASELINES)
+    parser.add_argument('--save', action='store_true', help='store the results as the new baselines')
+    args = parser.parse_args()
+
+    unit = measure(calibration, args.repeat)
+    try:
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {'cases': {}}
+    results = {}
+    regressions = []
+    print('{:<28} {:>12} {:>11} {:>10} {:>7}'.format('case', 'time ms', 'normalized', 'baseline', 'ratio'))
+    for name, function in cases(args.cases):
+        seconds = measure(function, args.repeat)
+        normalized = seconds / unit
+        results[name] = {'seconds': seconds, 'normalized': normalized}
+        baseline = baselines['cases'].get(name, {}).get('normalized')
+        ratio = normalized / baseline if baseline else None
+        print('{:<28} {:>12.3f} {:>11.2f} {:>10} {:>7}'.format(
+            name, seconds * 1000, normalized, '{:.2f}'.format(baseline) if baseline else '-',
+            '{:.2f}'.format(ratio) if ratio else '-'))
+        if ratio and ratio > args.threshold:
+            regressions.append(name)
+    if args.save:
+        baselines['cases'].update(results)
+        baselines.update(calibration_seconds=unit, python=platform.python_version(), machine=platform.machine())
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('Baselines saved to {}'.format(args.baselines))
+    elif regressions:
+        print('Slower than {}x the baseline: {}'.format(args.threshold, ', '.join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
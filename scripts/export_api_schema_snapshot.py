@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Exports the API version index of a VxRail Manager release as a snapshot, for the modules to resolve the API versions
+without downloading the schema (see VXRAIL_SCHEMA_SNAPSHOT in the README).
+
+The index is built either from a reachable VxRail Manager, or from API schema files already at hand (the Stoplight
+vxrail_public_api.yaml, or the Swagger group specs of older releases, which are merged). The snapshot is written to
+the given file, or by default to <build>.json. The snapshot records its build, which must be given with --build when
+the schema files carry no version, and is not used for a VxRail Manager known to run another build: export the
+snapshot again after each upgrade. To give each VxRail Manager its own snapshot, write them as
+<vxm_ip>.json in one directory and set VXRAIL_SCHEMA_SNAPSHOT to that directory.
+Requires the collection and the vxrail_ansible_utility SDK to be installed (ex: ansible-galaxy collection install).
+
+usage: python scripts/export_api_schema_snapshot.py --vxmip 172.16.10.100 [-o snapshots/172.16.10.100.json]
+       python scripts/export_api_schema_snapshot.py --schema vxrail_public_api.yaml [--build 7.0.450-28185] \
+           [-o 7.0.450.json]
+'''
+
+import argparse
+import logging
+import sys
+
+from ansible_collections.dellemc.vxrail.plugins.module_utils import dellemc_vxrail_ansible_utils as utils
+
+
+def load_schema_files(paths):
+    schema = {'paths': {}}
+    for path in paths:
+        with open(path, 'rb') as f:
+            part = utils.load_api_schema_paths(f.read())
+        schema['paths'].update(part['paths'])
+        if part['info'].get('version'):
+            schema['info'] = part['info']
+    return schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--vxmip', help='VxRail Manager to download the API schema from')
+    source.add_argument('--schema', nargs='+', help='API schema files to index')
+    parser.add_argument('--build', help='build of the release, when the schema does not tell it')
+    parser.add_argument('-o', '--output', help='snapshot file to write, <build>.json by default')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logger = logging.getLogger('export_api_schema_snapshot')
+    if args.vxmip:
+        schema = utils.APIVersionHandler(args.vxmip, logger).get_api_schema(paths_only=True)
+        if schema == -1:
+            sys.exit('Could not collect the API schema of {}'.format(args.vxmip))
+    else:
+        schema = load_schema_files(args.schema)
+    index = utils.APIVersionIndex.from_schema(schema)
+    if not index.suffixes:
+        sys.exit('No versioned API path found in the schema')
+    if index.build is None:
+        if not args.build:
+            sys.exit('The schema does not tell its build, please give it with --build')
+        index.build = args.build
+    elif args.build and args.build != index.build:
+        sys.exit('The schema is of build {}, not {}'.format(index.build, args.build))
+    output = args.output or '{}.json'.format(index.build or args.vxmip or 'api_schema_snapshot')
+    index.save(output)
+    print('Wrote the API version index of build {} ({} paths) to {}'.format(index.build, len(index.suffixes), output))
+
+
+if __name__ == '__main__':
+    main()
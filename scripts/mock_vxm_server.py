@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+# Copyright 2021 Dell Inc. or its subsidiaries. All Rights Reserved
+
+'''
+Local stand-in for a VxRail Manager, to run the modules without a real cluster (see scripts/benchmark_modules.py).
+
+Serves over HTTPS, under /rest/vxm:
+  - the API schema read by the modules to resolve the API versions: the Stoplight vxrail_public_api.yaml (with ETag
+    revalidation) or, with --swagger, the Swagger groups of the managers older than 7.0.350. The schema lists the
+    versioned paths of the installed vxrail_ansible_utility SDK, so the highest versions resolved exist in the SDK;
+  - synthetic GET /system, /cluster, /hosts, /hosts/{sn}, /chassis, /chassis/{id} and /disks responses, scaled by
+    the number of nodes. The other GET paths return an empty object;
+  - the long running operations: every POST, PUT, PATCH and DELETE starts a task, whose GET /v1/requests/{id}
+    progresses through the steps until it completes (or fails, with --fail-tasks) after --task-duration seconds.
+Every response is delayed by --latency seconds (+/- --jitter). The request counts by method and path are returned by
+GET /mock/stats and cleared by POST /mock/reset. Any credentials are accepted.
+The certificate is generated with openssl when --certfile is not given.
+
+usage: python scripts/mock_vxm_server.py [--port 8443] [--nodes 4] [--latency 0.05] [--task-duration 10]
+       then use 127.0.0.1:8443 as the vxmip of the modules
+'''
+
+import argparse
+import collections
+import hashlib
+import json
+import os
+import random
+import re
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import yaml
+
+API_PREFIX = '/rest/vxm'
+STOPLIGHT_PATH = API_PREFIX + '/api-doc/vxrail_public_api.yaml'
+SWAGGER_PATH = API_PREFIX + '/v1/swagger-resources/api-specs'
+# Paths served when the SDK cannot be read (ex: not installed), with their highest version
+DEFAULT_PATHS = {
+    ('GET', '/system'): 5, ('GET', '/cluster'): 2, ('GET', '/hosts'): 16, ('GET', '/hosts/{sn}'): 16,
+    ('GET', '/chassis'): 5, ('GET', '/chassis/{chassis_id}'): 5, ('GET', '/disks'): 1, ('GET', '/disks/{disk_sn}'): 1,
+    ('GET', '/requests/{request_id}'): 1, ('POST', '/lcm/precheck'): 2, ('POST', '/lcm/upgrade'): 9,
+}
+TASK_STEPS = ['Validating', 'Preparing', 'Upgrading hosts', 'Finalizing']
+
+
+def sdk_paths():
+    ''' Returns the (method, versioned path) of every API call of the installed vxrail_ansible_utility SDK '''
+    try:
+        import vxrail_ansible_utility.api as api_package
+    except ImportError:
+        return []
+    paths = set()
+    api_dir = os.path.dirname(api_package.__file__)
+    for name in os.listdir(api_dir):
+        if name.endswith('.py'):
+            with open(os.path.join(api_dir, name), encoding='utf_8') as f:
+                source = f.read()
+            for path, method in re.findall(r"call_api\(\s*'(/v[0-9]+/[^']*)',\s*'([A-Z]+)'", source):
+                paths.add((method, path))
+    return sorted(paths)
+
+
+def build_schema(build, padding=0):
+    paths = {}
+    operations = sdk_paths() or [(method, '/v{}{}'.format(version, path))
+                                 for (method, path), highest in DEFAULT_PATHS.items() for version in range(1, highest + 1)]
+    for method, path in operations:
+        paths.setdefault(path, {})[method.lower()] = {'responses': {'200': {'description': 'OK'}}}
+    schema = {'openapi': '3.0.0', 'info': {'title': 'VxRail REST API', 'version': build}, 'paths': paths}
+    if padding:
+        # Real schemas carry descriptions and models, which make up most of their size
+        schema['components'] = {'schemas': {'Padding{}'.format(i): {'description': 'x' * 1000}
+                                            for i in range(padding // 1000)}}
+    return schema
+
+
+def swagger_group(path):
+    return path.split('/')[2] if path.count('/') >= 2 else ''
+
+
+def make_disk(host, index):
+    return {'id': 'disk-{}-{}'.format(host, index), 'sn': 'DSN{:04d}{:02d}'.format(host, index), 'guid': str(index),
+            'manufacturer': 'Samsung', 'model': 'PM1733', 'disk_type': 'SSD', 'protocol': 'NVMe', 'max_capable_speed': '16Gb',
+            'enclosure': 0, 'bay': 0, 'slot': index, 'capacity': '1.92TB', 'disk_state': 'OK', 'led_status': 'Off',
+            'missing': False, 'firmware_revision': '1.0', 'write_endurance': '99%', 'remaining_write_endurance_rate': 99,
+            'disk_tier': 'Capacity', 'disk_claim_type': 'vSAN'}
+
+
+def make_host(index, disks):
+    sn = 'V{:06d}'.format(index)
+    return {
+        'id': 'host-{}'.format(index), 'sn': sn, 'slot': index % 4 + 1, 'name': 'esx{}'.format(index),
+        'hostname': 'esx{}.example.com'.format(index), 'psnt': 'PSNT{}'.format(index), 'manufacturer': 'Dell Inc.',
+        'model': 'VxRail P670F', 'health': 'Healthy', 'missing': False, 'operational_status': 'normal',
+        'power_status': 'on', 'led_status': 'Off', 'tpm_present': True, 'is_primary_node': index == 0, 'cluster_affinity': True,
+        'geo_location': {'rack_name': 'rack-1', 'order_number': index},
+        'firmware_info': {'bios_revision': '2.1.0', 'bmc_revision': '5.0', 'boss_version': '2.5', 'cpld_version': '1.0',
+                          'hba_version': '16.0', 'perc_version': '52.0', 'dcpm_version': '1.0', 'idsdm_version': '1.0',
+                          'expander_bpf_version': '1.0', 'nonexpander_bpf_version': '1.0'},
+        'boot_devices': [{'id': 'boot-{}'.format(i), 'sn': 'BSN{}{}'.format(index, i), 'device_model': 'BOSS-S2',
+                          'sata_type': 'SSD', 'power_on_hours': 1000, 'power_cycle_count': 10, 'max_erase_count': 3000,
+                          'avr_erase_count': 5, 'capacity': '240GB', 'health': '100%', 'firmware_version': '1.0',
+                          'bootdevice_type': 'BOSS', 'block_size': 512, 'slot': i} for i in range(2)],
+        'nics': [{'mac': '00:50:56:{:02x}:{:02x}:{:02x}'.format(index // 256, index % 256, i), 'link_status': 'Up',
+                  'link_speed': '25Gb', 'slot': i, 'type': 'SFP+', 'firmware_family_version': '21.0', 'port': i,
+                  'drivers': [{'driver_name': 'i40en', 'driver_version': '2.1.0'}]} for i in range(4)],
+        'disks': [make_disk(index, i) for i in range(disks)],
+        'dpus': [], 'gpus': [],
+    }
+
+
+class MockVxM():
+    def __init__(self, nodes=4, disks=8, latency=0.0, jitter=0.0, task_duration=10.0, fail_tasks=False, swagger=False,
+                 build='7.0.450-28214470', schema_padding=0):
+        self.nodes = nodes
+        self.disks = disks
+        self.latency = latency
+        self.jitter = jitter
+        self.task_duration = task_duration
+        self.fail_tasks = fail_tasks
+        self.swagger = swagger
+        self.schema = build_schema(build, schema_padding)
+        self.schema_yaml = yaml.safe_dump(self.schema, sort_keys=False).encode('utf-8')
+        self.schema_etag = '"{}"'.format(hashlib.sha1(self.schema_yaml).hexdigest())
+        self.hosts = [make_host(i, disks) for i in range(nodes)]
+        self.tasks = {}
+        self.stats = collections.Counter()
+        self.lock = threading.Lock()
+
+    def count(self, method, path):
+        # Identifiers are folded, so that the counts are per API path
+        path = re.sub(r'/(host-[0-9]+|V[0-9]{6}|chassis-[0-9]+|[0-9a-f]{8}-[0-9a-f-]{27})(?=/|$)', '/{id}', path)
+        with self.lock:
+            self.stats[method + ' ' + path] += 1
+
+    def get_stats(self):
+        with self.lock:
+            return {'requests': sum(self.stats.values()), 'by_path': dict(self.stats)}
+
+    def reset(self):
+        with self.lock:
+            self.stats.clear()
+            self.tasks.clear()
+
+    def start_task(self, method, path):
+        request_id = str(uuid.uuid4())
+        with self.lock:
+            self.tasks[request_id] = {'started_at': time.monotonic(), 'owner': method + ' ' + path}
+        return {'request_id': request_id}
+
+    def task_status(self, request_id):
+        with self.lock:
+            task = self.tasks.get(request_id)
+        if task is None:
+            return None
+        elapsed = time.monotonic() - task['started_at']
+        done = elapsed >= self.task_duration
+        progress = 100 if done else int(100 * elapsed / self.task_duration)
+        state = ('FAILED' if self.fail_tasks else 'COMPLETED') if done else 'IN_PROGRESS'
+        step = TASK_STEPS[min(len(TASK_STEPS) - 1, progress * len(TASK_STEPS) // 100)]
+        return {'id': request_id, 'owner': task['owner'], 'state': state, 'progress': progress, 'step': step,
+                'error': 'Mock task failed' if state == 'FAILED' else None, 'detail': None,
+                'start_time': int(time.time() - elapsed) * 1000, 'end_time': int(time.time()) * 1000 if done else None,
+                'extension': '{}'}
+
+    def chassis(self):
+        return [{'id': 'chassis-{}'.format(i), 'sn': 'CSN{:04d}'.format(i), 'service_tag': 'ST{:04d}'.format(i),
+                 'part_number': 'PN1', 'description': 'VxRail chassis', 'generation': '15G', 'health': 'Healthy',
+                 'missing': False, 'render_category': 'P670F', 'bay': 1, 'psnt': 'PSNT{}'.format(i),
+                 'geo_location': {'rack_name': 'rack-1', 'order_number': i}, 'witness': None,
+                 'power_supplies': [{'id': 'psu-{}'.format(p), 'sn': 'PSU{}{}'.format(i, p), 'slot': p, 'health': 'Healthy',
+                                     'manufacturer': 'Dell', 'revision_number': '1', 'part_number': 'PN2'} for p in range(2)],
+                 'hosts': self.hosts[i * 4:i * 4 + 4]} for i in range((self.nodes + 3) // 4)]
+
+    # Returns the response body of a GET of the unversioned path, or None if the path is not found
+    def get(self, path):
+        if path == '/system':
+            return {'description': 'A hyperconverged infrastructure appliance', 'version': self.schema['info']['version'],
+                    'health': 'Healthy', 'installed_time': 1700000000000, 'number_of_host': self.nodes,
+                    'cluster_host_count': self.nodes, 'satellite_host_count': 0, 'is_external_vc': False,
+                    'network_connected': True, 'vc_connected': True, 'upgrade_status': 'NONE',
+                    'installed_components': [{'name': 'VxRail Manager', 'description': 'VxRail Manager',
+                                              'current_version': self.schema['info']['version'], 'baseline': '',
+                                              'upgrade_status': 'NONE', 'components': []}],
+                    'cluster_type': 'STANDARD', 'deployment_type': 'STANDARD', 'logical_view_status': 'GOOD'}
+        if path == '/cluster':
+            return {'cluster_id': 'cluster-1', 'product_type': 'VxRail', 'cluster_type': 'STANDARD', 'health': 'Healthy',
+                    'operational_status': 'normal', 'vc_connected': True, 'number_of_host': self.nodes}
+        if path == '/hosts':
+            return self.hosts
+        if path == '/disks':
+            return [disk for host in self.hosts for disk in host['disks']]
+        if path == '/chassis':
+            return self.chassis()
+        match = re.match(r'^/hosts/([^/]+)$', path)
+        if match:
+            return next((host for host in self.hosts if host['sn'] == match.group(1)), None)
+        match = re.match(r'^/chassis/([^/]+)$', path)
+        if match:
+            return next((chassis for chassis in self.chassis() if chassis['id'] == match.group(1)), None)
+        match = re.match(r'^/disks/([^/]+)$', path)
+        if match:
+            return next((disk for host in self.hosts for disk in host['disks'] if disk['sn'] == match.group(1)), None)
+        match = re.match(r'^/requests/([^/]+)$', path)
+        if match:
+            return self.task_status(match.group(1))
+        return {}
+
+
+class MockVxMHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    mock = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type='application/json', headers=None):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def not_found(self):
+        self.send_body(404, {'code': 404, 'message': 'Not Found'})
+
+    def handle_request(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        url = urlsplit(self.path)
+        if url.path == '/mock/stats':
+            return self.send_body(200, self.mock.get_stats())
+        if url.path == '/mock/reset':
+            self.mock.reset()
+            return self.send_body(200, {})
+        self.mock.count(method, url.path)
+        delay = self.mock.latency + random.uniform(-self.mock.jitter, self.mock.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if url.path == STOPLIGHT_PATH and method == 'GET':
+            if self.mock.swagger:
+                return self.not_found()
+            if self.headers.get('If-None-Match') == self.mock.schema_etag:
+                self.send_response(304)
+                self.send_header('ETag', self.mock.schema_etag)
+                self.send_header('Content-Length', '0')
+                return self.end_headers()
+            return self.send_body(200, self.mock.schema_yaml, 'application/yaml', {'ETag': self.mock.schema_etag})
+        if url.path == SWAGGER_PATH and method == 'GET':
+            group = parse_qs(url.query).get('group', [''])[0]
+            paths = {path: item for path, item in self.mock.schema['paths'].items() if swagger_group(path) == group}
+            if not self.mock.swagger or not paths:
+                return self.not_found()
+            return self.send_body(200, yaml.safe_dump({'swagger': '2.0', 'paths': paths}).encode('utf-8'), 'application/yaml')
+        match = re.match(r'^' + API_PREFIX + r'/v[0-9]+(/.*)$', url.path)
+        if not match:
+            return self.not_found()
+        if method != 'GET':
+            return self.send_body(202, self.mock.start_task(method, match.group(1)))
+        body = self.mock.get(match.group(1))
+        if body is None:
+            return self.not_found()
+        self.send_body(200, body)
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_PUT(self):
+        self.handle_request('PUT')
+
+    def do_PATCH(self):
+        self.handle_request('PATCH')
+
+    def do_DELETE(self):
+        self.handle_request('DELETE')
+
+
+def self_signed_certificate(directory):
+    certfile = os.path.join(directory, 'mock_vxm.crt')
+    keyfile = os.path.join(directory, 'mock_vxm.key')
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj', '/CN=localhost',
+                    '-keyout', keyfile, '-out', certfile], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return certfile, keyfile
+
+
+def start_server(mock, host='127.0.0.1', port=0, certfile=None, keyfile=None):
+    ''' Serves the mock from a background thread, returns the server (server.server_address has the port) '''
+    handler = type('Handler', (MockVxMHandler,), {'mock': mock})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    if certfile is None:
+        certfile, keyfile = self_signed_certificate(tempfile.mkdtemp(prefix='mock_vxm_'))
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile, keyfile)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def add_mock_arguments(parser):
+    parser.add_argument('--nodes', type=int, default=4, help='number of hosts of the cluster')
+    parser.add_argument('--disks', type=int, default=8, help='number of disks of each host')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='random +/- seconds added to the latency')
+    parser.add_argument('--task-duration', type=float, default=10.0, help='seconds for a task to complete')
+    parser.add_argument('--fail-tasks', action='store_true', help='make the tasks fail instead of completing')
+    parser.add_argument('--swagger', action='store_true', help='serve the Swagger groups instead of the Stoplight schema')
+    parser.add_argument('--schema-padding', type=int, default=0, help='bytes of descriptions added to the schema')
+
+
+def mock_from_arguments(args):
+    return MockVxM(nodes=args.nodes, disks=args.disks, latency=args.latency, jitter=args.jitter,
+                   task_duration=args.task_duration, fail_tasks=args.fail_tasks, swagger=args.swagger,
+                   schema_padding=args.schema_padding)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8443)
+    parser.add_argument('--certfile')
+    parser.add_argument('--keyfile')
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    mock = mock_from_arguments(args)
+    server = start_server(mock, args.host, args.port, args.certfile, args.keyfile)
+    print('Mock VxRail Manager with {} paths listening on https://{}:{}{}'.format(
+        len(mock.schema['paths']), args.host, server.server_address[1], API_PREFIX))
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()